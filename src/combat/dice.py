@@ -2,7 +2,10 @@
 
 import random
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+
+_DICE_PATTERN = re.compile(r"^(\d*)d(\d+)([+-]\d+)?$")
 
 
 class DiceRoller:
@@ -37,23 +40,7 @@ class DiceRoller:
             >>> roller.roll("1d20")
             [15]
         """
-        notation = notation.lower().replace(" ", "")
-
-        # Parse dice notation
-        match = re.match(r"^(\d*)d(\d+)([+-]\d+)?$", notation)
-        if not match:
-            raise ValueError(f"Invalid dice notation: {notation}")
-
-        num_dice_str = match.group(1) or "1"
-        die_size = int(match.group(2))
-
-        num_dice = int(num_dice_str)
-
-        if die_size not in self.DICE_SIZES:
-            raise ValueError(f"Unsupported die size: d{die_size}. Supported: {self.DICE_SIZES}")
-
-        if num_dice < 0:
-            raise ValueError("Number of dice cannot be negative")
+        num_dice, die_size, _ = _parse_notation(notation)
 
         # Roll the dice
         results = [self._random.randint(1, die_size) for _ in range(num_dice)]
@@ -74,32 +61,54 @@ class DiceRoller:
             >>> roller.roll_sum("2d6+3")
             13  # Sum of dice + modifier
         """
-        notation = notation.lower().replace(" ", "")
+        num_dice, die_size, modifier = _parse_notation(notation)
 
-        # Parse dice notation
-        match = re.match(r"^(\d*)d(\d+)([+-]\d+)?$", notation)
-        if not match:
-            raise ValueError(f"Invalid dice notation: {notation}")
+        # Roll the dice and sum
+        dice_sum = sum(self._random.randint(1, die_size) for _ in range(num_dice))
 
-        num_dice_str = match.group(1) or "1"
-        die_size = int(match.group(2))
-        modifier = int(match.group(3)) if match.group(3) else 0
+        return dice_sum + modifier
 
-        num_dice = int(num_dice_str)
 
-        if die_size not in self.DICE_SIZES:
-            raise ValueError(f"Unsupported die size: d{die_size}. Supported: {self.DICE_SIZES}")
+@lru_cache(maxsize=128)
+def _parse_notation(notation: str) -> Tuple[int, int, int]:
+    """Parse dice notation into (num_dice, die_size, modifier).
 
-        # Roll the dice and sum
-        dice_sum = sum(self._random.randint(1, die_size) for _ in range(num_dice))
+    Results are cached, since combat re-rolls the same handful of
+    notations every turn.
 
-        return dice_sum + modifier
+    Raises:
+        ValueError: If the notation is malformed or uses an unsupported die.
+    """
+    notation = notation.lower().replace(" ", "")
+
+    match = _DICE_PATTERN.match(notation)
+    if not match:
+        raise ValueError(f"Invalid dice notation: {notation}")
+
+    num_dice = int(match.group(1) or "1")
+    die_size = int(match.group(2))
+    modifier = int(match.group(3)) if match.group(3) else 0
+
+    if die_size not in DiceRoller.DICE_SIZES:
+        raise ValueError(
+            f"Unsupported die size: d{die_size}. Supported: {DiceRoller.DICE_SIZES}"
+        )
+
+    if num_dice < 0:
+        raise ValueError("Number of dice cannot be negative")
+
+    return num_dice, die_size, modifier
+
+
+# Shared roller for roll_dice(); building a fresh random.Random per call
+# reseeds from the OS every time.
+_default_roller = DiceRoller()
 
 
 def roll_dice(notation: str) -> int:
     """Roll dice according to D&D notation and return the total.
 
-    Convenience function that creates a DiceRoller and returns the sum.
+    Convenience function that rolls with a shared DiceRoller and returns the sum.
 
     Args:
         notation: Dice notation string (e.g., "2d6+3", "1d8", "3d10-2")
@@ -115,7 +124,7 @@ def roll_dice(notation: str) -> int:
         >>> roll_dice("3d8")
         12
     """
-    return DiceRoller().roll_sum(notation)
+    return _default_roller.roll_sum(notation)
 
 
 def ability_modifier(score: int) -> int:
@@ -1,9 +1,23 @@
 """Data models for the narrative system."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
+def intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a flag mapping with interned string keys.
+
+    Flag names loaded from scene files and saves are fresh string objects;
+    interning them lets dict lookups match on identity.
+    """
+    return {_intern(key): value for key, value in mapping.items()}
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class Consequence:
     """Represents a consequence of a choice."""
@@ -43,6 +57,21 @@ class Choice:
     defeat_scene: Optional[str] = None
     quest_trigger: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.id = _intern(self.id)
+        self.required_flags = intern_keys(self.required_flags)
+        self.set_flags = intern_keys(self.set_flags)
+        # Precomputed flag requirements for availability checks. Requirements
+        # on True take a subset test; any other value keeps the equality check
+        # against the flag, where a missing flag counts as False.
+        self._required_items = frozenset(
+            (flag, value) for flag, value in self.required_flags.items() if value is True
+        )
+        self._required_other = tuple(
+            (flag, value) for flag, value in self.required_flags.items() if value is not True
+        )
+        self._has_reqs = bool(self.required_flags)
+
 
 @dataclass
 class Scene:
@@ -69,6 +98,10 @@ class Scene:
     source_file: Optional[str] = None
     ai_choices: bool = False
 
+    def __post_init__(self) -> None:
+        self.flags_required = intern_keys(self.flags_required)
+        self.flags_set = intern_keys(self.flags_set)
+
 
 @dataclass
 class DiceRollResult:
@@ -3,7 +3,15 @@
 from typing import Dict, Any, Optional, List
 from dataclasses import asdict
 
-from ..narrative.models import GameState, Scene, Choice, SkillCheck, Consequence, Ending
+from ..narrative.models import (
+    GameState,
+    Scene,
+    Choice,
+    SkillCheck,
+    Consequence,
+    Ending,
+    intern_keys,
+)
 from ..entities.character import Character
 
 
@@ -45,7 +53,7 @@ class NarrativeSerializer:
             current_scene=data.get("current_scene", "start"),
             scene_history=data.get("scene_history", []),
             choices_made=data.get("choices_made", []),
-            flags=data.get("flags", {}),
+            flags=intern_keys(data.get("flags", {})),
             relationships=data.get("relationships", {}),
             inventory=data.get("inventory", []),
             current_act=data.get("current_act", 1),
@@ -174,12 +182,26 @@ class SaveDataBuilder:
     def build_full_save(
         game_state: GameState, metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Build a complete save data package."""
+        """Build a complete save data package.
+
+        The ``header`` block comes first so the save list can decode it from
+        the start of the file without reading the whole save.
+        """
+        metadata = metadata or {}
+        narrative_state = NarrativeSerializer.serialize_game_state(game_state)
+        character = narrative_state["character"] or {}
         return {
+            "header": {
+                "game_type": "narrative",
+                "saved_at": metadata.get("saved_at", "Unknown"),
+                "saved_at_epoch": metadata.get("saved_at_epoch"),
+                "current_scene": narrative_state["current_scene"],
+                "character_name": character.get("name", "Unknown"),
+            },
             "version": 2,
             "game_type": "narrative",
-            "metadata": metadata or {},
-            "narrative_state": NarrativeSerializer.serialize_game_state(game_state),
+            "metadata": metadata,
+            "narrative_state": narrative_state,
         }
 
     @staticmethod
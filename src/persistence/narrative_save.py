@@ -0,0 +1,79 @@
+"""Narrative save file format.
+
+A save is ``MAGIC``, a little-endian uint32 header length, the header as
+plain JSON, and then the compressed full save payload. The save list reads
+only the plain header; loading a save skips it and decompresses the rest.
+Saves written before the plain header existed are a bare compressed payload
+and are still readable.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+from ..utils import compression, fastjson
+
+MAGIC = b"DNDS\x01"
+_LENGTH = struct.Struct("<I")
+_PREFIX_SIZE = len(MAGIC) + _LENGTH.size
+
+# Older saves may start their compressed payload with the header block
+_HEADER_PREFIX = b'{"header":'
+_HEADER_CHUNK_SIZE = 8192
+_header_decoder = json.JSONDecoder()
+
+
+def encode_save(save_data: Dict[str, Any]) -> bytes:
+    """Encode save data with a plain header ahead of the compressed payload."""
+    header = fastjson.dumps(save_data.get("header") or {})
+    body = compression.compress(fastjson.dumps(save_data))
+    return MAGIC + _LENGTH.pack(len(header)) + header + body
+
+
+def read_save_file(path: Path) -> Dict[str, Any]:
+    """Read, decompress and decode a save file."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw.startswith(MAGIC):
+        (header_len,) = _LENGTH.unpack_from(raw, len(MAGIC))
+        raw = raw[_PREFIX_SIZE + header_len :]
+    return fastjson.loads(compression.decompress(raw))
+
+
+def read_save_header(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a save's header without decompressing the full payload.
+
+    Returns None for saves written without a header, which must be read in
+    full instead.
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX_SIZE)
+        if len(prefix) == _PREFIX_SIZE and prefix.startswith(MAGIC):
+            (header_len,) = _LENGTH.unpack_from(prefix, len(MAGIC))
+            header = fastjson.loads(f.read(header_len))
+            return header if isinstance(header, dict) and header else None
+        f.seek(0)
+        return _read_compressed_header(f)
+
+
+def _read_compressed_header(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Decompress just enough of an older save to decode its header block."""
+    decompressor = None
+    buffer = b""
+    while chunk := f.read(_HEADER_CHUNK_SIZE):
+        if decompressor is None:
+            decompressor = compression.decompressobj(chunk)
+        buffer += decompressor.decompress(chunk)
+        if len(buffer) < len(_HEADER_PREFIX):
+            continue
+        if not buffer.startswith(_HEADER_PREFIX):
+            return None
+        # A multi-byte character may be split at the end of the buffer
+        text = buffer[len(_HEADER_PREFIX) :].decode("utf-8", "ignore")
+        try:
+            header, _ = _header_decoder.raw_decode(text)
+        except ValueError:
+            continue
+        return header if isinstance(header, dict) else None
+    return None
@@ -207,13 +207,11 @@ class DNDRoguelikeApp(App):
     def save_narrative_game(self, save_data: dict) -> bool:
         """Save the current narrative game."""
         try:
-            import json
-            import zlib
             from datetime import datetime
+            from ..persistence.narrative_save import encode_save
 
             config.ensure_directories()
-            json_str = json.dumps(save_data, indent=2, default=str)
-            compressed = zlib.compress(json_str.encode("utf-8"), level=6)
+            encoded = encode_save(save_data)
             char_name = (
                 save_data.get("narrative_state", {}).get("character", {}).get("name", "game")
             )
@@ -221,7 +219,7 @@ class DNDRoguelikeApp(App):
             filename = f"{char_name}_{timestamp}.sav"
             save_path = config.save_directory / filename
             with open(save_path, "wb") as f:
-                f.write(compressed)
+                f.write(encoded)
             return True
         except Exception as e:
             self.notify(f"Failed to save: {e}")
@@ -1,6 +1,7 @@
 """TUI screens for the game."""
 
-from typing import Optional
+from operator import methodcaller
+from typing import Final, Optional
 from textual.screen import Screen
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -15,6 +16,52 @@ from ...world.dungeon_generator import DungeonGenerator, DungeonConfig
 from ...combat.dice_display import DiceDisplay
 from ...narrative.models import Scene, Choice, GameState as NarrativeGameState
 
+# Engine states in which GameScreen accepts movement/action keys.
+_ACTIVE_STATES: Final = frozenset({GameState.PLAYING, GameState.COMBAT})
+
+# Roguelike movement keys mapped to engine directions.
+_DIRECTION_MAP: Final = {
+    "n": "north",
+    "s": "south",
+    "e": "east",
+    "w": "west",
+    "y": "northwest",
+    "u": "northeast",
+    "b": "southwest",
+    "j": "southeast",
+}
+
+# Keys that pass the turn without acting.
+_WAIT_KEYS: Final = frozenset({".", "space"})
+
+# Keys that open another screen or run an app-level action.
+_APP_ACTIONS: Final = {
+    "i": methodcaller("action_show_inventory"),
+    "c": methodcaller("action_show_character"),
+    "l": methodcaller("action_show_log"),
+    "s": methodcaller("save_game"),
+    "escape": methodcaller("action_show_menu"),
+}
+
+
+def _diff_positions(last: dict, entities) -> tuple[dict, set]:
+    """Diff entity positions against ``last`` and update it in place.
+
+    Returns:
+        Tuple of ({id: new_position} for moved or new entities, removed ids).
+    """
+    moved = {}
+    seen = set()
+    for entity in entities:
+        seen.add(entity.id)
+        if last.get(entity.id) != entity.position:
+            moved[entity.id] = entity.position
+    removed = last.keys() - seen
+    last.update(moved)
+    for entity_id in removed:
+        del last[entity_id]
+    return moved, removed
+
 
 class MenuScreen(Screen):
     """Main menu screen."""
@@ -24,6 +71,8 @@ class MenuScreen(Screen):
         self.selected_index = 0
         self.menu_options = ["New Game", "Continue", "Load Game", "Quit"]
         self.buttons = ["btn_new", "btn_continue", "btn_load", "btn_quit"]
+        self._button_widgets: list[Button] = []
+        self._prev_index = 0
 
     def compose(self):
         """Compose the menu screen."""
@@ -48,7 +97,8 @@ class MenuScreen(Screen):
 
     def on_mount(self):
         """Focus first button on mount."""
-        self.query_one("#btn_new").focus()
+        self._button_widgets = [self.query_one(f"#{btn_id}", Button) for btn_id in self.buttons]
+        self._button_widgets[0].focus()
 
     def on_key(self, event: events.Key) -> None:
         """Handle key presses for menu navigation."""
@@ -70,9 +120,11 @@ class MenuScreen(Screen):
                 self.action_quit()
 
     def _update_focus(self):
-        """Update button focus based on selected_index."""
-        btn_id = self.buttons[self.selected_index]
-        self.query_one(f"#{btn_id}").focus()
+        """Move focus to the newly selected button, if the selection changed."""
+        if self.selected_index == self._prev_index:
+            return
+        self._button_widgets[self.selected_index].focus()
+        self._prev_index = self.selected_index
 
     def action_new_game(self) -> None:
         """Start a new game."""
@@ -137,6 +189,18 @@ class CharacterCreationScreen(Screen):
         }
         self.classes = ["fighter", "wizard", "rogue", "cleric"]
         self.races = ["human", "elf", "dwarf", "halfling"]
+        # Per-step (character_data key, option list, prompt).
+        self._steps: tuple[tuple[str, Optional[list[str]], str], ...] = (
+            ("name", None, "Enter your name:"),
+            ("character_class", self.classes, "Choose your class:"),
+            ("race", self.races, "Choose your race:"),
+        )
+        self._last_rendered_step: int = -1
+        self._prompt_widget: Optional[Static] = None
+        self._value_widget: Optional[Static] = None
+        self._options_widget: Optional[Static] = None
+        self._name_input: Optional[Input] = None
+        self._start_button: Optional[Button] = None
 
     def compose(self):
         """Compose the character creation screen."""
@@ -156,15 +220,20 @@ class CharacterCreationScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
+        self._prompt_widget = self.query_one("#cc_prompt", Static)
+        self._value_widget = self.query_one("#cc_value", Static)
+        self._options_widget = self.query_one("#cc_options", Static)
+        self._name_input = self.query_one("#name_input", Input)
+        self._start_button = self.query_one("#btn_start", Button)
         self._update_display()
         self._focus_current_step()
 
     def _focus_current_step(self) -> None:
         """Focus the appropriate widget for the current step."""
         if self.step == 0:
-            self.query_one("#name_input", Input).focus()
+            self._name_input.focus()
         else:
-            self.query_one("#cc_options", Static).focus()
+            self._options_widget.focus()
 
     def on_key(self, event: events.Key) -> None:
         """Handle key presses when Input has focus (step 0); BINDINGS handle step 1+."""
@@ -191,55 +260,29 @@ class CharacterCreationScreen(Screen):
 
     def _update_display(self) -> None:
         """Update the display based on current step."""
-        prompts = [
-            "Enter your name:",
-            "Choose your class:",
-            "Choose your race:",
-        ]
-        options = [
-            "",
-            ", ".join(self.classes),
-            ", ".join(self.races),
-        ]
-
-        prompt = self.query_one("#cc_prompt", Static)
-        prompt.update(prompts[self.step])
-
-        value = self.query_one("#cc_value", Static)
-        opts = self.query_one("#cc_options", Static)
-        name_input = self.query_one("#name_input", Input)
-        start_btn = self.query_one("#btn_start", Button)
-
-        if self.step == 0:
-            value.update(f"[b]{self.character_data['name']}[/b]")
-            name_input.display = True
-            name_input.can_focus = True
-            start_btn.display = False
-            opts.update("Type your name and press Enter")
-        elif self.step == 1:
-            name_input.display = False
-            name_input.can_focus = False
-            start_btn.display = False
-            current = self.classes
-            display = []
-            for c in current:
-                if c == self.character_data["character_class"]:
-                    display.append(f"> {c}")
-                else:
-                    display.append(f"  {c}")
-            opts.update("\n".join(display))
-        else:
-            name_input.display = False
-            name_input.can_focus = False
-            start_btn.display = True
-            current = self.races
-            display = []
-            for c in current:
-                if c == self.character_data["race"]:
-                    display.append(f"> {c}")
-                else:
-                    display.append(f"  {c}")
-            opts.update("\n".join(display))
+        field, options, prompt = self._steps[self.step]
+        value = self._value_widget
+        opts = self._options_widget
+
+        with self.app.batch_update():
+            # Prompt and widget visibility only change when the step changes.
+            if self.step != self._last_rendered_step:
+                self._prompt_widget.update(prompt)
+
+                name_input = self._name_input
+                start_btn = self._start_button
+                name_input.display = self.step == 0
+                name_input.can_focus = self.step == 0
+                start_btn.display = self.step == 2
+                if self.step == 0:
+                    opts.update("Type your name and press Enter")
+                self._last_rendered_step = self.step
+
+            if self.step == 0:
+                value.update(f"[b]{self.character_data[field]}[/b]")
+            else:
+                selected = self.character_data[field]
+                opts.update("\n".join(f"> {c}" if c == selected else f"  {c}" for c in options))
 
     def _navigate(self, delta: int) -> None:
         """Navigate options."""
@@ -247,12 +290,9 @@ class CharacterCreationScreen(Screen):
             self._focus_current_step()
             return
 
-        current_list = [self.classes, self.races][self.step - 1]
-        current_list = list(current_list) if not isinstance(current_list, list) else current_list
-        current_val = self.character_data[["character_class", "race"][self.step - 1]]
-        idx = current_list.index(current_val)
-        idx = (idx + delta) % len(current_list)
-        self.character_data[["character_class", "race"][self.step - 1]] = current_list[idx]
+        field, options, _ = self._steps[self.step]
+        idx = (options.index(self.character_data[field]) + delta) % len(options)
+        self.character_data[field] = options[idx]
         self._update_display()
 
     def on_input_changed(self, event: Input.Changed) -> None:
@@ -290,6 +330,11 @@ class GameScreen(Screen):
         super().__init__(**kwargs)
         self.fov_cache: set = set()
         self.explored_cache: set = set()
+        self._last_enemy_pos: dict = {}
+        self._last_item_pos: dict = {}
+        self._last_view_key: Optional[tuple] = None
+        self._map_widget: Optional[MapWidget] = None
+        self._status_widget: Optional[StatusWidget] = None
 
     def compose(self):
         """Compose the game screen."""
@@ -301,11 +346,14 @@ class GameScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
-        # Generate initial dungeon
-        self._generate_dungeon()
+        self._map_widget = self.query_one("#map", MapWidget)
+        self._status_widget = self.query_one("#status", StatusWidget)
+        # Generate initial dungeon in a worker thread so the first frame
+        # renders immediately with an empty map.
+        self.run_worker(self._generate_dungeon, thread=True, exclusive=True)
 
     def _generate_dungeon(self) -> None:
-        """Generate a new dungeon."""
+        """Generate a new dungeon (runs in a worker thread)."""
         config = DungeonConfig(
             width=80,
             height=24,
@@ -315,20 +363,43 @@ class GameScreen(Screen):
             max_rooms=10,
         )
         dungeon = DungeonGenerator(config).generate()
+        self.app.call_from_thread(self._apply_dungeon, dungeon)
 
-        # Set map on widget
-        map_widget = self.query_one("#map", MapWidget)
-        map_widget.set_map(dungeon)
+    def _apply_dungeon(self, dungeon) -> None:
+        """Show a generated dungeon on the map widget."""
+        if self._map_widget is None:
+            return
+        with self.app.batch_update():
+            self._map_widget.set_map(dungeon)
 
     def update_view(self) -> None:
         """Update the map view."""
-        map_widget = self.query_one("#map", MapWidget)
-        status_widget = self.query_one("#status", StatusWidget)
+        map_widget = self._map_widget
+        status_widget = self._status_widget
+        if map_widget is None or status_widget is None:
+            return
 
         engine = self.app.game_engine
         if not engine.player:
             return
 
+        # Skip the whole refresh when nothing the view shows has changed
+        player = engine.player
+        view_key = (
+            player.position,
+            player.current_hp,
+            player.max_hp,
+            player.armor_class,
+            player.level,
+            player.experience,
+            player.current_floor,
+            tuple(e.position for e in engine.enemies),
+            tuple(i.position for i in engine.items),
+        )
+        if view_key == self._last_view_key:
+            return
+        self._last_view_key = view_key
+
         # Update player position
         map_widget.set_player(engine.player.position)
 
@@ -336,62 +407,58 @@ class GameScreen(Screen):
         visible = engine.visible_tiles
         map_widget.set_visible_tiles(visible)
 
-        # Update enemies
-        enemy_positions = {e.id: e.position for e in engine.enemies}
-        map_widget.set_enemies(enemy_positions)
+        # Update enemies and items with only the positions that changed
+        if self._last_enemy_pos:
+            moved, removed = _diff_positions(self._last_enemy_pos, engine.enemies)
+            map_widget.patch_enemies(moved, removed)
+        else:
+            self._last_enemy_pos = {e.id: e.position for e in engine.enemies}
+            map_widget.set_enemies(dict(self._last_enemy_pos))
 
-        # Update items
-        item_positions = {i.id: i.position for i in engine.items}
-        map_widget.set_items(item_positions)
+        if self._last_item_pos:
+            moved, removed = _diff_positions(self._last_item_pos, engine.items)
+            map_widget.patch_items(moved, removed)
+        else:
+            self._last_item_pos = {i.id: i.position for i in engine.items}
+            map_widget.set_items(dict(self._last_item_pos))
 
         # Update status
         status_widget.set_player(engine.player)
 
+    def _take_turn(self, action: dict) -> None:
+        """Run a player action and, if it consumed the turn, the enemy phase."""
+        engine = self.app.game_engine
+        if engine.player_turn(action):
+            engine.enemy_turns()
+            self.update_view()
+
     def on_key(self, event: events.Key) -> None:
         """Handle key presses for movement and actions."""
         engine = self.app.game_engine
 
-        if engine.state not in (GameState.PLAYING, GameState.COMBAT):
+        if engine.state not in _ACTIVE_STATES:
             return
 
-        direction_map = {
-            "n": "north",
-            "s": "south",
-            "e": "east",
-            "w": "west",
-            "y": "northwest",
-            "u": "northeast",
-            "b": "southwest",
-            "j": "southeast",
-        }
-
-        if event.key in direction_map:
-            engine.player_turn({"action": "move", "direction": direction_map[event.key]})
-            engine.enemy_turns()
-            self.update_view()
-        elif event.key == "." or event.key == "space":
-            engine.player_turn({"action": "wait"})
-            engine.enemy_turns()
-            self.update_view()
-        elif event.key == "," or event.key == "g":
-            # Pick up item (simplified)
-            pass
-        elif event.key == "i":
-            self.app.action_show_inventory()
-        elif event.key == "c":
-            self.app.action_show_character()
-        elif event.key == "l":
-            self.app.action_show_log()
-        elif event.key == "s":
-            # Save game
-            self.app.save_game()
-        elif event.key == "escape":
-            self.app.action_show_menu()
+        direction = _DIRECTION_MAP.get(event.key)
+        if direction is not None:
+            self._take_turn({"action": "move", "direction": direction})
+        elif event.key in _WAIT_KEYS:
+            self._take_turn({"action": "wait"})
+        else:
+            # "," / "g" (pick up) are not wired up yet and fall through here
+            handler = _APP_ACTIONS.get(event.key)
+            if handler is not None:
+                handler(self.app)
 
 
 class CharacterScreen(Screen):
     """Character sheet screen."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._cached_sheet: Optional[tuple] = None
+        self._details_widget: Optional[Static] = None
+
     def compose(self):
         """Compose the character screen."""
         yield Container(
@@ -405,6 +472,7 @@ class CharacterScreen(Screen):
 
     def on_mount(self) -> None:
         """Update character display."""
+        self._details_widget = self.query_one("#char_details", Static)
         self._update_display()
 
     def _update_display(self) -> None:
@@ -414,33 +482,57 @@ class CharacterScreen(Screen):
             return
 
         p = engine.player
-        details = [
-            f"[b]{p.name}[/b]",
-            f"Level {p.level} {p.race} {p.character_class}",
-            "",
-            "Attributes:",
-            f"  STR {p.strength} ({p.strength_mod:+d})",
-            f"  DEX {p.dexterity} ({p.dexterity_mod:+d})",
-            f"  CON {p.constitution} ({p.constitution_mod:+d})",
-            f"  INT {p.intelligence} ({p.intelligence_mod:+d})",
-            f"  WIS {p.wisdom} ({p.wisdom_mod:+d})",
-            f"  CHA {p.charisma} ({p.charisma_mod:+d})",
-            "",
-            "Combat:",
-            f"  HP: {p.current_hp}/{p.max_hp}",
-            f"  AC: {p.armor_class}",
-            f"  Proficiency: +{p.proficiency_bonus}",
-            "",
-            f"Experience: {p.experience}",
-        ]
-
-        widget = self.query_one("#char_details", Static)
-        widget.update("\n".join(details))
+        widget = self._details_widget
+
+        key = (
+            p.name,
+            p.level,
+            p.race,
+            p.character_class,
+            p.strength,
+            p.dexterity,
+            p.constitution,
+            p.intelligence,
+            p.wisdom,
+            p.charisma,
+            p.current_hp,
+            p.max_hp,
+            p.armor_class,
+            p.experience,
+        )
+        if self._cached_sheet is not None and self._cached_sheet[0] == key:
+            widget.update(self._cached_sheet[1])
+            return
+
+        text = f"""[b]{p.name}[/b]
+Level {p.level} {p.race} {p.character_class}
+
+Attributes:
+  STR {p.strength} ({p.strength_mod:+d})
+  DEX {p.dexterity} ({p.dexterity_mod:+d})
+  CON {p.constitution} ({p.constitution_mod:+d})
+  INT {p.intelligence} ({p.intelligence_mod:+d})
+  WIS {p.wisdom} ({p.wisdom_mod:+d})
+  CHA {p.charisma} ({p.charisma_mod:+d})
+
+Combat:
+  HP: {p.current_hp}/{p.max_hp}
+  AC: {p.armor_class}
+  Proficiency: +{p.proficiency_bonus}
+
+Experience: {p.experience}"""
+        self._cached_sheet = (key, text)
+        widget.update(text)
 
 
 class InventoryScreen(Screen):
     """Inventory management screen."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._last_items: list[str] = []
+        self._list_view: Optional[ListView] = None
+
     def compose(self):
         """Compose the inventory screen."""
         yield Container(
@@ -455,6 +547,7 @@ class InventoryScreen(Screen):
 
     def on_mount(self) -> None:
         """Update inventory display."""
+        self._list_view = self.query_one("#inv_list", ListView)
         self._update_display()
 
     def _update_display(self) -> None:
@@ -464,13 +557,24 @@ class InventoryScreen(Screen):
             return
 
         # For now, show floor items
-        items = [i.name for i in engine.items]
-
-        list_view = self.query_one("#inv_list", ListView)
-        list_view.clear()
+        names = [i.name for i in engine.items]
+        if names == self._last_items:
+            return
 
-        for item_name in items:
-            list_view.append(ListItem(Static(item_name)))
+        # Keep the rows shared with the last render; only drop the changed
+        # tail and append the new one.
+        common = 0
+        for old_name, new_name in zip(self._last_items, names):
+            if old_name != new_name:
+                break
+            common += 1
+
+        list_view = self._list_view
+        if common < len(self._last_items):
+            list_view.remove_items(range(common, len(self._last_items)))
+        if common < len(names):
+            list_view.extend(ListItem(Static(name)) for name in names[common:])
+        self._last_items = names
 
 
 class LogScreen(Screen):
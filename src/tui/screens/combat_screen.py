@@ -2,17 +2,51 @@
 
 import random
 import logging
+from collections import deque
+from itertools import islice
+from operator import attrgetter
+from rich.text import Text
 from textual.screen import Screen
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Static, Button
 from textual import events
-from typing import List, Optional
+from textual.timer import Timer
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from ...combat.dice import roll_dice, ability_modifier
+from .narrative_game_screen import NarrativeGameScreen
 
 logger = logging.getLogger(__name__)
 
+# Ability name -> accessor for the character's modifier in that ability.
+_STAT_MOD = {
+    "strength": attrgetter("strength_mod"),
+    "dexterity": attrgetter("dexterity_mod"),
+    "constitution": attrgetter("constitution_mod"),
+    "intelligence": attrgetter("intelligence_mod"),
+    "wisdom": attrgetter("wisdom_mod"),
+    "charisma": attrgetter("charisma_mod"),
+}
+
+
+def _no_modifier(char) -> int:
+    """Attack modifier for weapons keyed to an unknown ability."""
+    return 0
+
+
+def _resolve_weapon(char) -> Tuple[Callable[[Any], int], str]:
+    """Resolve the character's attack-modifier accessor and damage dice once."""
+    if not hasattr(char, "equipment"):
+        return _STAT_MOD["strength"], "1d8"
+    stat = char.equipment.get("weapon_stat", "strength")
+    return _STAT_MOD.get(stat, _no_modifier), char.equipment.get("weapon_damage", "1d8")
+
+
+# Entries kept in the combat log and how many of the newest are shown.
+COMBAT_LOG_MAX_ENTRIES = 64
+COMBAT_LOG_VISIBLE_LINES = 5
+
 
 @dataclass
 class Attack:
@@ -28,6 +62,14 @@ class Attack:
 class CombatScreen(Screen):
     """Screen for combat encounters in narrative mode."""
 
+    _CHOICES_IDLE_MARKUP = (
+        "\n[b]Choose your action:[/b]\n"
+        "[yellow]A[/yellow] Attack\n"
+        "[yellow]D[/yellow] Defend (+2 AC)\n"
+        "[yellow]F[/yellow] Flee (DEX check DC 12)"
+    )
+    _CHOICES_BUSY_MARKUP = "\n[b]Action in progress...[/b]"
+
     def __init__(
         self,
         enemy_name: str,
@@ -50,8 +92,23 @@ class CombatScreen(Screen):
         self.enemy_abilities = enemy_abilities or []
         self.victory_scene = victory_scene
         self.defeat_scene = defeat_scene
-        self.combat_log: List[str] = []
+        self.combat_log: deque[str] = deque(maxlen=COMBAT_LOG_MAX_ENTRIES)
         self.player_action: Optional[str] = None
+        self._game_state = None
+        self._weapon: Optional[Tuple[Callable[[Any], int], str]] = None
+        self._scene_mgr = None
+        self._title_markup = f"[b]═══ ⚔ Combat: {enemy_name} ⚔ ═══[/b]"
+        self._dirty = False
+        self._flush_timer: Optional[Timer] = None
+        self._title_widget: Optional[Static] = None
+        self._status_widget: Optional[Static] = None
+        self._log_widget: Optional[Static] = None
+        self._choices_widget: Optional[Static] = None
+        self._status_key: Optional[tuple] = None
+        self._last_rendered: Dict[str, Optional[str]] = {
+            "log": None,
+            "choices": None,
+        }
 
     def compose(self):
         """Compose the combat screen."""
@@ -69,13 +126,40 @@ class CombatScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
+        self._refresh_app_refs()
+        self._title_widget = self.query_one("#combat_title", Static)
+        self._status_widget = self.query_one("#combat_status", Static)
+        self._log_widget = self.query_one("#combat_log", Static)
+        self._choices_widget = self.query_one("#combat_choices", Static)
+        self._title_widget.update(self._title_markup)
         self._update_display()
         self._add_combat_message(f"A {self.enemy_name} appears! {self.enemy_description}")
 
+    def on_screen_resume(self) -> None:
+        """Re-read app state in case it was replaced while the screen was hidden."""
+        self._refresh_app_refs()
+
+    def _refresh_app_refs(self) -> None:
+        """Cache the app's narrative game state and scene manager."""
+        self._game_state = getattr(self.app, "narrative_game_state", None)
+        self._scene_mgr = getattr(self.app, "scene_manager", None)
+
+    def _get_game_state(self):
+        """Return the cached narrative game state, resolving it on first use."""
+        if self._game_state is None:
+            self._game_state = getattr(self.app, "narrative_game_state", None)
+        return self._game_state
+
+    def _get_scene_manager(self):
+        """Return the cached scene manager, resolving it on first use."""
+        if self._scene_mgr is None:
+            self._scene_mgr = getattr(self.app, "scene_manager", None)
+        return self._scene_mgr
+
     def _update_display(self) -> None:
         """Update the combat display."""
         try:
-            game_state = getattr(self.app, "narrative_game_state", None)
+            game_state = self._get_game_state()
         except Exception:
             return
         player_hp = "??"
@@ -88,42 +172,74 @@ class CombatScreen(Screen):
             player_max_hp = str(char.max_hp)
             player_name = char.name
 
-        try:
-            title_widget = self.query_one("#combat_title", Static)
-        except Exception:
+        if self._status_widget is None:
             return
-        title_widget.update(f"[b]═══ ⚔ Combat: {self.enemy_name} ⚔ ═══[/b]")
 
-        status_widget = self.query_one("#combat_status", Static)
-        status = f"""
-[yellow]{player_name}[/yellow]
-HP: {player_hp}/{player_max_hp}
+        status_key = (player_name, player_hp, player_max_hp, self.enemy_current_hp, self.enemy_ac)
 
-[red]{self.enemy_name}[/red]
-HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
-"""
-        if self.enemy_abilities:
-            status += f"Abilities: {', '.join(self.enemy_abilities)}"
-        status_widget.update(status)
-
-        log_widget = self.query_one("#combat_log", Static)
-        log_widget.update("\n".join(self.combat_log[-5:]) if self.combat_log else "Combat begins!")
+        if self.combat_log:
+            start = max(0, len(self.combat_log) - COMBAT_LOG_VISIBLE_LINES)
+            log = "\n".join(islice(self.combat_log, start, None))
+        else:
+            log = "Combat begins!"
 
-        choices_widget = self.query_one("#combat_choices", Static)
         if self.player_action is None:
-            choices_widget.update(
-                "\n[b]Choose your action:[/b]\n"
-                "[yellow]A[/yellow] Attack\n"
-                "[yellow]D[/yellow] Defend (+2 AC)\n"
-                "[yellow]F[/yellow] Flee (DEX check DC 12)"
-            )
+            choices = self._CHOICES_IDLE_MARKUP
         else:
-            choices_widget.update("\n[b]Action in progress...[/b]")
+            choices = self._CHOICES_BUSY_MARKUP
 
-    def _add_combat_message(self, message: str) -> None:
-        """Add a message to the combat log."""
+        # Land all panel changes in a single compositor pass
+        with self.app.batch_update():
+            if status_key != self._status_key:
+                self._status_widget.update(
+                    self._build_status_text(player_name, player_hp, player_max_hp)
+                )
+                self._status_key = status_key
+            self._update_panel("log", self._log_widget, log)
+            self._update_panel("choices", self._choices_widget, choices)
+
+    def _build_status_text(self, player_name: str, player_hp: str, player_max_hp: str) -> Text:
+        """Build the styled player/enemy status block."""
+        status = Text.assemble(
+            "\n",
+            (player_name, "yellow"),
+            f"\nHP: {player_hp}/{player_max_hp}\n\n",
+            (self.enemy_name, "red"),
+            f"\nHP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}\n",
+        )
+        if self.enemy_abilities:
+            status.append(f"Abilities: {', '.join(self.enemy_abilities)}")
+        return status
+
+    def _update_panel(self, name: str, widget: Static, content: str) -> None:
+        """Update a panel only if its content differs from the last render."""
+        if content != self._last_rendered[name]:
+            widget.update(content)
+            self._last_rendered[name] = content
+
+    def _schedule_update(self) -> None:
+        """Mark the display dirty and coalesce redraws into one deferred flush."""
+        self._dirty = True
+        if self._flush_timer is None and self.is_mounted:
+            self._flush_timer = self.set_timer(0.05, self._flush_display)
+
+    def _flush_display(self, force: bool = False) -> None:
+        """Redraw now if anything changed since the last flush (or if forced)."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if self._dirty or force:
+            self._dirty = False
+            self._update_display()
+
+    def _append_log(self, message: str) -> None:
+        """Append a message to the combat log without redrawing."""
         self.combat_log.append(message)
-        self._update_display()
+
+    def _add_combat_message(self, message: str) -> None:
+        """Add a message to the combat log and schedule a redraw."""
+        self._append_log(message)
+        self._schedule_update()
 
     async def on_key(self, event: events.Key) -> None:
         """Handle key presses for combat actions."""
@@ -140,42 +256,49 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
             await self._player_flee()
         elif key == "escape":
             self.app.pop_screen()
+            return
+        else:
+            return
+
+        # Render the whole turn in one pass rather than waiting on the timer,
+        # unless the action already left this screen (flee, victory, defeat).
+        if self.is_current:
+            self._flush_display(force=True)
+        elif self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
 
     async def _player_attack(self) -> None:
         """Player attacks the enemy."""
-        game_state = getattr(self.app, "narrative_game_state", None)
+        game_state = self._get_game_state()
         if not game_state or not game_state.character:
-            self._add_combat_message("Error: No character found")
+            self._append_log("Error: No character found")
             return
 
         char = game_state.character
 
         # Roll attack
         attack_roll = random.randint(1, 20)
-        attack_modifier = (
-            getattr(char, f"{char.equipment.get('weapon_stat', 'strength')}_mod", 0)
-            if hasattr(char, "equipment")
-            else char.strength_mod
-        )
+        if self._weapon is None:
+            self._weapon = _resolve_weapon(char)
+        get_attack_mod, damage_dice = self._weapon
+        attack_modifier = get_attack_mod(char)
 
         # Check proficiency
         proficiency = 2  # Level 1
         total_attack = attack_roll + attack_modifier + proficiency
 
-        self._add_combat_message(
+        self._append_log(
             f"You attack: d20({attack_roll}) + {attack_modifier} + {proficiency} = {total_attack} vs AC {self.enemy_ac}"
         )
 
         if attack_roll == 1:
-            self._add_combat_message("[red]Critical failure! You miss![/red]")
+            self._append_log("[red]Critical failure! You miss![/red]")
             await self._enemy_turn()
             return
 
         if total_attack >= self.enemy_ac:
             # Hit! Roll damage
-            damage_dice = (
-                char.equipment.get("weapon_damage", "1d8") if hasattr(char, "equipment") else "1d8"
-            )
             try:
                 damage = roll_dice(damage_dice) + attack_modifier
             except Exception as e:
@@ -183,9 +306,9 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
                 damage = 4  # Fallback damage on error
             if attack_roll == 20:
                 damage *= 2
-                self._add_combat_message(f"[green]CRITICAL HIT! You deal {damage} damage![/green]")
+                self._append_log(f"[green]CRITICAL HIT! You deal {damage} damage![/green]")
             else:
-                self._add_combat_message(f"[green]Hit! You deal {damage} damage![/green]")
+                self._append_log(f"[green]Hit! You deal {damage} damage![/green]")
 
             self.enemy_current_hp -= damage
 
@@ -193,43 +316,36 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
                 await self._combat_victory()
                 return
         else:
-            self._add_combat_message("[red]You miss![/red]")
+            self._append_log("[red]You miss![/red]")
 
         await self._enemy_turn()
 
     async def _player_defend(self) -> None:
         """Player takes a defensive stance."""
-        self._add_combat_message("[cyan]You raise your shield, bracing for impact (+2 AC).[/cyan]")
+        self._append_log("[cyan]You raise your shield, bracing for impact (+2 AC).[/cyan]")
         # TODO: Implement actual AC bonus
         await self._enemy_turn()
 
     async def _player_flee(self) -> None:
         """Player attempts to flee."""
-        import random
-
         dex_check = random.randint(1, 20)
         dex_mod = 0  # Could get from character
 
         total = dex_check + dex_mod
-        self._add_combat_message(
+        self._append_log(
             f"You try to flee: d20({dex_check}) + {dex_mod} = {total} vs DC 12"
         )
 
         if total >= 12:
-            self._add_combat_message("[green]You successfully escape![/green]")
+            self._append_log("[green]You successfully escape![/green]")
             # Return to previous scene
             self.app.pop_screen()
-            # Transition back
-            from .narrative_game_screen import NarrativeGameScreen
-            # Just pop back
         else:
-            self._add_combat_message("[red]You fail to escape![/red]")
+            self._append_log("[red]You fail to escape![/red]")
             await self._enemy_turn()
 
     async def _enemy_turn(self) -> None:
         """Enemy takes their turn."""
-        import random
-
         if self.enemy_current_hp <= 0:
             return
 
@@ -240,17 +356,17 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
         total_attack = attack_roll + enemy_attack_bonus
 
         # Get player AC
-        game_state = getattr(self.app, "narrative_game_state", None)
+        game_state = self._get_game_state()
         player_ac = 10  # Default
         if game_state and game_state.character:
             player_ac = game_state.character.armor_class
 
-        self._add_combat_message(
+        self._append_log(
             f"{self.enemy_name} attacks: d20({attack_roll}) + {enemy_attack_bonus} = {total_attack} vs AC {player_ac}"
         )
 
         if attack_roll == 1:
-            self._add_combat_message(f"[cyan]The {self.enemy_name} trips and misses![/cyan]")
+            self._append_log(f"[cyan]The {self.enemy_name} trips and misses![/cyan]")
             return
 
         if total_attack >= player_ac:
@@ -259,29 +375,27 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
             damage = random.randint(1, 6) + enemy_attack_bonus
             if attack_roll == 20:
                 damage *= 2
-                self._add_combat_message(
+                self._append_log(
                     f"[red]CRITICAL HIT! {self.enemy_name} deals {damage} damage![/red]"
                 )
             else:
-                self._add_combat_message(f"[red]{self.enemy_name} hits for {damage} damage![/red]")
+                self._append_log(f"[red]{self.enemy_name} hits for {damage} damage![/red]")
 
             if game_state and game_state.character:
                 game_state.character.hit_points -= damage
                 if game_state.character.hit_points <= 0:
                     await self._combat_defeat()
         else:
-            self._add_combat_message(f"[cyan]The {self.enemy_name} misses![/cyan]")
-
-        self._update_display()
+            self._append_log(f"[cyan]The {self.enemy_name} misses![/cyan]")
 
     async def _combat_victory(self) -> None:
         """Handle combat victory."""
-        self._add_combat_message(
+        self._append_log(
             f"\n[green][b]VICTORY! You have defeated the {self.enemy_name}![/b][/green]"
         )
 
         # Clear combat state
-        game_state = getattr(self.app, "narrative_game_state", None)
+        game_state = self._get_game_state()
         if game_state:
             game_state.is_combat = False
             game_state.current_enemy = None
@@ -291,10 +405,8 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
 
         # Transition to victory scene
         if self.victory_scene:
-            from .narrative_game_screen import NarrativeGameScreen
-
             screen = NarrativeGameScreen()
-            scene_mgr = getattr(self.app, "scene_manager", None)
+            scene_mgr = self._get_scene_manager()
             if scene_mgr:
                 if scene_mgr.ai_client and game_state:
                     scene = await scene_mgr.get_scene_async(
@@ -308,10 +420,10 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
 
     async def _combat_defeat(self) -> None:
         """Handle combat defeat."""
-        self._add_combat_message(f"\n[red][b]DEFEAT! You have fallen in battle...[/b][/red]")
+        self._append_log(f"\n[red][b]DEFEAT! You have fallen in battle...[/b][/red]")
 
         # Clear combat state
-        game_state = getattr(self.app, "narrative_game_state", None)
+        game_state = self._get_game_state()
         if game_state:
             game_state.is_combat = False
             game_state.current_enemy = None
@@ -321,10 +433,8 @@ HP: {self.enemy_current_hp}/{self.enemy_max_hp}  AC: {self.enemy_ac}
 
         # Transition to defeat scene
         if self.defeat_scene:
-            from .narrative_game_screen import NarrativeGameScreen
-
             screen = NarrativeGameScreen()
-            scene_mgr = getattr(self.app, "scene_manager", None)
+            scene_mgr = self._get_scene_manager()
             if scene_mgr:
                 if scene_mgr.ai_client and game_state:
                     scene = await scene_mgr.get_scene_async(
@@ -1,5 +1,7 @@
 """Ending screen for displaying game conclusions."""
 
+from typing import Dict, Optional
+
 from textual.screen import Screen
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Static, Button
@@ -14,6 +16,13 @@ class EndingScreen(Screen):
         self.ending_title: str = ""
         self.ending_description: str = ""
         self.stats: dict = {}
+        self._title_widget: Optional[Static] = None
+        self._desc_widget: Optional[Static] = None
+        self._stats_widget: Optional[Static] = None
+        self._buttons_widget: Optional[Static] = None
+        self._last_rendered: Dict[str, str] = {}
+        self._cached_stats_sig: Optional[tuple] = None
+        self._cached_stats_text: Optional[str] = None
 
     def compose(self):
         """Compose the ending screen."""
@@ -33,34 +42,48 @@ class EndingScreen(Screen):
         self.ending_title = title
         self.ending_description = description
         self.stats = stats or {}
+        self._cached_stats_text = None
         self._update_display()
 
     def _update_display(self) -> None:
         """Update the ending display."""
-        try:
-            title_widget = self.query_one("#ending_title", Static)
-        except Exception:
+        if self._title_widget is None:
             return
-        desc_widget = self.query_one("#ending_description", Static)
-        stats_widget = self.query_one("#stats_section", Static)
-        buttons_widget = self.query_one("#ending_buttons", Static)
 
-        title_widget.update(f"[b]{self.ending_title}[/b]")
-        desc_widget.update(f"\n{self.ending_description}\n")
+        with self.app.batch_update():
+            self._update_panel("title", self._title_widget, f"[b]{self.ending_title}[/b]")
+            self._update_panel(
+                "description", self._desc_widget, f"\n{self.ending_description}\n"
+            )
+            self._update_panel("stats", self._stats_widget, self._format_stats())
+
+    def _format_stats(self) -> str:
+        """Format the statistics block, reusing the last result for the same stats."""
+        sig = tuple(self.stats.items())
+        if self._cached_stats_text is not None and sig == self._cached_stats_sig:
+            return self._cached_stats_text
 
-        stats_lines = ["[b]STATISTICS[/b]", "-" * 20]
         if self.stats:
-            for key, value in self.stats.items():
-                stats_lines.append(f"{key}: {value}")
+            stats_body = "\n".join(f"{key}: {value}" for key, value in self.stats.items())
         else:
-            stats_lines.append("No stats available")
-
-        stats_widget.update("\n".join(stats_lines))
+            stats_body = "No stats available"
+        self._cached_stats_sig = sig
+        self._cached_stats_text = f"[b]STATISTICS[/b]\n{'-' * 20}\n{stats_body}"
+        return self._cached_stats_text
 
-        buttons_widget.update("\n\n[Enter] Play Again  [Q] Quit")
+    def _update_panel(self, name: str, widget: Static, content: str) -> None:
+        """Update a panel only if its content differs from the last render."""
+        if content != self._last_rendered.get(name):
+            widget.update(content)
+            self._last_rendered[name] = content
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
+        self._title_widget = self.query_one("#ending_title", Static)
+        self._desc_widget = self.query_one("#ending_description", Static)
+        self._stats_widget = self.query_one("#stats_section", Static)
+        self._buttons_widget = self.query_one("#ending_buttons", Static)
+        self._buttons_widget.update("\n\n[Enter] Play Again  [Q] Quit")
         self._update_display()
 
     def on_key(self, event: events.Key) -> None:
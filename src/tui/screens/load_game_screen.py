@@ -1,30 +1,228 @@
 """Load game screen for resuming saved games."""
 
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from textual.screen import Screen
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Static, Button
 from textual import events
 from textual.app import App
 
-from datetime import datetime
+from ...persistence.narrative_save import read_save_file, read_save_header
+from ...utils import fastjson
+
+
+# Sidecar file in the save directory caching each save's listing fields,
+# keyed by filename and validated against the file's mtime and size.
+INDEX_FILENAME = "_index.json"
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_MAX_SCAN_WORKERS = 8
 
 
 class SaveFileInfo:
-    """Information about a save file."""
+    """Information about a save file.
 
-    def __init__(self, path: Path, data: Dict[str, Any]):
+    The listing fields are available without touching the file contents;
+    the full save payload is read by ``load_full`` on first use and kept.
+    """
+
+    __slots__ = (
+        "path",
+        "filename",
+        "timestamp",
+        "saved_at_epoch",
+        "scene",
+        "character_name",
+        "_full_data",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        timestamp: str = "Unknown",
+        saved_at_epoch: Optional[int] = None,
+        scene: str = "Unknown",
+        character_name: str = "Unknown",
+    ):
         self.path = path
-        self.data = data
         self.filename = path.name
-        self.timestamp = data.get("metadata", {}).get("saved_at", "Unknown")
-        self.scene = data.get("narrative_state", {}).get("current_scene", "Unknown")
-        self.character_name = "Unknown"
-        if data.get("narrative_state", {}).get("character"):
-            self.character_name = (
-                data.get("narrative_state", {}).get("character", {}).get("name", "Unknown")
-            )
+        # Keep an already decoded payload so loading does not read it again
+        self._full_data = data
+        if data is not None:
+            header = data.get("header")
+            if header is not None:
+                timestamp = header.get("saved_at", "Unknown")
+                saved_at_epoch = header.get("saved_at_epoch")
+                scene = header.get("current_scene", "Unknown")
+                character_name = header.get("character_name", "Unknown")
+            else:
+                # Saves written before the header block was added
+                narrative_state = data.get("narrative_state") or _EMPTY
+                timestamp = (data.get("metadata") or _EMPTY).get("saved_at", "Unknown")
+                scene = narrative_state.get("current_scene", "Unknown")
+                character = narrative_state.get("character")
+                if character:
+                    character_name = character.get("name", "Unknown")
+        self.timestamp = timestamp
+        self.saved_at_epoch = saved_at_epoch
+        self.scene = scene
+        self.character_name = character_name
+
+    def load_full(self) -> Dict[str, Any]:
+        """Full save payload, read from disk on first call and then cached."""
+        if self._full_data is None:
+            self._full_data = read_save_file(self.path)
+        return self._full_data
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Full save payload."""
+        return self.load_full()
+
+    def display_time(self) -> str:
+        """Human-readable save time, formatted from the epoch when known."""
+        if self.saved_at_epoch is None:
+            return self.timestamp
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.saved_at_epoch))
+
+    @classmethod
+    def from_header(cls, path: Path, header: Dict[str, Any]) -> "SaveFileInfo":
+        """Build from a save's leading header block without reading the rest."""
+        return cls(
+            path,
+            timestamp=header.get("saved_at", "Unknown"),
+            saved_at_epoch=header.get("saved_at_epoch"),
+            scene=header.get("current_scene", "Unknown"),
+            character_name=header.get("character_name", "Unknown"),
+        )
+
+    @classmethod
+    def from_index(cls, path: Path, entry: Dict[str, Any]) -> "SaveFileInfo":
+        """Build from a cached sidecar index entry without reading the file."""
+        return cls(
+            path,
+            timestamp=entry["timestamp"],
+            saved_at_epoch=entry.get("saved_at_epoch"),
+            scene=entry["scene"],
+            character_name=entry["character_name"],
+        )
+
+    def index_entry(self, mtime: float, size: int) -> Dict[str, Any]:
+        """Sidecar index entry for this save."""
+        return {
+            "mtime": mtime,
+            "size": size,
+            "narrative": True,
+            "timestamp": self.timestamp,
+            "saved_at_epoch": self.saved_at_epoch,
+            "scene": self.scene,
+            "character_name": self.character_name,
+        }
+
+
+def _load_index(save_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the sidecar index, treating a missing or corrupt file as empty."""
+    try:
+        with open(save_dir / INDEX_FILENAME, "rb") as f:
+            index = fastjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_index(save_dir: Path, index: Dict[str, Dict[str, Any]]) -> None:
+    """Persist the sidecar index; failures only cost a rescan next time."""
+    try:
+        with open(save_dir / INDEX_FILENAME, "wb") as f:
+            f.write(fastjson.dumps(index))
+    except OSError:
+        pass
+
+
+def _index_matches(entry: Optional[Dict[str, Any]], mtime: float, size: int) -> bool:
+    return bool(entry) and entry.get("mtime") == mtime and entry.get("size") == size
+
+
+def _read_listing(save_file: Path) -> Optional[Tuple[Optional[str], SaveFileInfo]]:
+    """Read a save's game type and listing fields, or None if unreadable."""
+    try:
+        header = read_save_header(save_file)
+        if header is not None:
+            return header.get("game_type"), SaveFileInfo.from_header(save_file, header)
+        data = read_save_file(save_file)
+        return data.get("game_type"), SaveFileInfo(save_file, data)
+    except Exception:
+        return None
+
+
+def scan_saves(save_dir: Path) -> List[SaveFileInfo]:
+    """List narrative saves in ``save_dir``, newest first.
+
+    Saves whose mtime and size match the sidecar index are listed from the
+    cached fields; for new or modified files only the header is decoded.
+    """
+    if not save_dir.exists():
+        return []
+
+    # One directory sweep; DirEntry.stat reuses what the listing already fetched
+    entries = []
+    with os.scandir(save_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".sav"):
+                continue
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, save_dir / entry.name))
+    entries.sort(key=lambda e: e[0], reverse=True)
+
+    index = _load_index(save_dir)
+    stale = [
+        save_file
+        for mtime, size, save_file in entries
+        if not _index_matches(index.get(save_file.name), mtime, size)
+    ]
+    # Decompression runs in C with the GIL released, so files read in parallel
+    if len(stale) > 1:
+        workers = min(_MAX_SCAN_WORKERS, len(stale), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            listings = dict(zip(stale, executor.map(_read_listing, stale)))
+    else:
+        listings = {save_file: _read_listing(save_file) for save_file in stale}
+
+    new_index: Dict[str, Dict[str, Any]] = {}
+    saves: List[SaveFileInfo] = []
+    for mtime, size, save_file in entries:
+        if save_file not in listings:
+            entry = index[save_file.name]
+            new_index[save_file.name] = entry
+            if entry.get("narrative"):
+                saves.append(SaveFileInfo.from_index(save_file, entry))
+            continue
+
+        listing = listings[save_file]
+        if listing is None:
+            continue
+
+        game_type, info = listing
+        if game_type == "narrative":
+            saves.append(info)
+            new_index[save_file.name] = info.index_entry(mtime, size)
+        else:
+            new_index[save_file.name] = {"mtime": mtime, "size": size, "narrative": False}
+
+    if new_index != index:
+        _write_index(save_dir, new_index)
+    return saves
 
 
 class LoadGameScreen(Screen):
@@ -34,6 +232,14 @@ class LoadGameScreen(Screen):
         super().__init__(**kwargs)
         self.saves: List[SaveFileInfo] = []
         self.selected_index = 0
+        self.save_dir = Path.home() / ".dnd_roguelike" / "saves"
+        self._list_widget: Optional[Static] = None
+        self._details_widget: Optional[Static] = None
+        # One pre-formatted entry per save; only the selected one is expanded
+        self._row_lines: List[str] = []
+        self._plain_rows: Tuple[str, ...] = ()
+        self._expanded_rows: Dict[int, str] = {}
+        self._rendered_index: Optional[int] = None
 
     def compose(self):
         """Compose the load game screen."""
@@ -48,56 +254,58 @@ class LoadGameScreen(Screen):
             id="load_container",
         )
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Called when screen is mounted."""
-        self._load_saves()
+        self._list_widget = self.query_one("#saves_list", Static)
+        self._details_widget = self.query_one("#save_details", Static)
+        self._list_widget.update("Loading saves...")
+        await self._load_saves()
         self._update_display()
 
-    def _load_saves(self) -> None:
-        """Load list of available save files."""
-        self.saves = []
-        save_dir = Path.home() / ".dnd_roguelike" / "saves"
-
-        if not save_dir.exists():
-            return
-
-        import json
-        import zlib
-
-        for save_file in sorted(
-            save_dir.glob("*.sav"), key=lambda f: f.stat().st_mtime, reverse=True
-        ):
-            try:
-                with open(save_file, "rb") as f:
-                    compressed = f.read()
-                    decompressed = zlib.decompress(compressed)
-                    data = json.loads(decompressed)
-
-                if data.get("game_type") == "narrative":
-                    self.saves.append(SaveFileInfo(save_file, data))
-            except Exception:
-                continue
+    async def _load_saves(self) -> None:
+        """Load list of available save files without blocking the UI."""
+        self.saves = await asyncio.to_thread(scan_saves, self.save_dir)
+        self._row_lines = []
+        self._rendered_index = None
 
     def _update_display(self) -> None:
         """Update the saves list display."""
-        list_widget = self.query_one("#saves_list", Static)
-        details_widget = self.query_one("#save_details", Static)
+        list_widget = self._list_widget
+        details_widget = self._details_widget
+        if list_widget is None or details_widget is None:
+            return
 
         if not self.saves:
             list_widget.update("No saves found.")
             details_widget.update("")
             return
 
-        lines = []
-        for i, save in enumerate(self.saves):
-            prefix = ">" if i == self.selected_index else " "
-            lines.append(f"{prefix} {save.filename}")
-            if i == self.selected_index:
-                lines.append(f"   Scene: {save.scene}")
-                lines.append(f"   Saved: {save.timestamp}")
+        if not self._row_lines:
+            # Rows never change for a loaded list, so format each one once
+            self._plain_rows = tuple(f"  {save.filename}" for save in self.saves)
+            self._expanded_rows = {}
+            self._row_lines = list(self._plain_rows)
+            self._rendered_index = None
+            details_widget.update("")
+
+        # Only the previously and newly selected rows change
+        old_index = self._rendered_index
+        index = self.selected_index
+        if old_index == index:
+            return
+        if old_index is not None:
+            self._row_lines[old_index] = self._plain_rows[old_index]
+        expanded = self._expanded_rows.get(index)
+        if expanded is None:
+            save = self.saves[index]
+            expanded = (
+                f"> {save.filename}\n   Scene: {save.scene}\n   Saved: {save.display_time()}"
+            )
+            self._expanded_rows[index] = expanded
+        self._row_lines[index] = expanded
+        self._rendered_index = index
 
-        list_widget.update("\n".join(lines))
-        details_widget.update("")
+        list_widget.update("\n".join(self._row_lines))
 
     def on_key(self, event: events.Key) -> None:
         """Handle key presses."""
@@ -120,7 +328,7 @@ class LoadGameScreen(Screen):
         save_info = self.saves[self.selected_index]
 
         try:
-            save_data = save_info.data
+            save_data = save_info.load_full()
             self.dismiss(save_data)
         except Exception as e:
             self.notify(f"Failed to load save: {e}")
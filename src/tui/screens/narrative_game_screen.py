@@ -1,12 +1,16 @@
 """Narrative game screen for story-driven gameplay."""
 
 import asyncio
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from operator import attrgetter
 from textual.screen import Screen
 from textual.containers import Horizontal, Vertical, ScrollableContainer  # noqa: F401
 from textual.widgets import Static, Button
 from textual import events
 
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from ...narrative.models import Scene, Choice, GameState  # noqa: F401
 from ...narrative.quest_generator import QUEST_TEMPLATES
@@ -15,6 +19,74 @@ from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Quoted NPC dialogue inside scene descriptions
+_DIALOGUE_RE = re.compile(r"\"([^\"]*)\"")
+
+
+def _style_dialogue(match: "re.Match[str]") -> str:
+    return f"[italic #87CEEB]{match.group(0)}[/italic #87CEEB]"
+
+
+def _flags_hash(flags: Dict[str, Any]) -> int:
+    """Hash the flag state for cache keys; unhashable values fall back to repr."""
+    try:
+        return hash(frozenset(flags.items()))
+    except TypeError:
+        return hash(repr(sorted(flags.items())))
+
+
+# Notable flags and how an NPC describes them in its AI context
+_NPC_CONTEXT_FLAGS = (
+    ("met_stranger", "The player has met me before."),
+    ("learned_dungeon_secret", "The player knows about the dungeon's secrets."),
+    ("allied_with_stranger", "The player is my ally in this quest."),
+    ("accepted_quest", "The player accepted my quest."),
+)
+
+
+@lru_cache(maxsize=64)
+def _compose_npc_context(
+    char_sig: Tuple[str, str, str], npc_context: Optional[str], flag_bits: Tuple[bool, ...]
+) -> str:
+    """Join the NPC context string; every input is part of the cache key."""
+    race, character_class, name = char_sig
+    context_parts = [f"Player is a {race} {character_class} named {name}."]
+    if npc_context:
+        context_parts.append(npc_context)
+    context_parts.extend(
+        text for (_, text), is_set in zip(_NPC_CONTEXT_FLAGS, flag_bits) if is_set
+    )
+    return " ".join(context_parts)
+
+
+# Skill check ability codes mapped to display names and modifier accessors
+_ABILITY_NAMES = {
+    "str": "Strength",
+    "dex": "Dexterity",
+    "con": "Constitution",
+    "int": "Intelligence",
+    "wis": "Wisdom",
+    "cha": "Charisma",
+}
+_ABILITY_MODS = {
+    "str": attrgetter("strength_mod"),
+    "dex": attrgetter("dexterity_mod"),
+    "con": attrgetter("constitution_mod"),
+    "int": attrgetter("intelligence_mod"),
+    "wis": attrgetter("wisdom_mod"),
+    "cha": attrgetter("charisma_mod"),
+}
+
+
+@lru_cache(maxsize=256)
+def _choice_button_spec(
+    scene_id: str, choice_id: str, shortcut: str, text: str
+) -> Tuple[str, str]:
+    """Return the (button id, label) pair for a choice button."""
+    # Format: [A] Choice text - shortcut in yellow (NOT a hotkey)
+    # Use scene ID prefix to ensure unique button IDs across scenes
+    return f"choice_{scene_id}_{choice_id}", f"[yellow]{shortcut.upper()}[/yellow] {text}"
+
 
 class NarrativeGameScreen(Screen):
     """Main game screen for narrative/story-driven gameplay."""
@@ -26,6 +98,35 @@ class NarrativeGameScreen(Screen):
         self.dice_display = DiceDisplay()
         self._start_time: float | None = None
         self._effective_choices: List[Choice] = []
+        self._choice_buttons: Dict[str, Button] = {}
+        self._shortcut_index: Dict[str, Tuple[Choice, ...]] = {}
+        # Choice behind each button, keyed by button id
+        self._button_choices: Dict[str, Choice] = {}
+        # Availability per choice id as of the last status refresh; every
+        # flag change made by this screen is followed by one.
+        self._availability: Dict[str, bool] = {}
+        self._rendered_scene: Optional[Scene] = None
+        # Text last written to the status panel
+        self._last_status: Optional[str] = None
+        # AI-enhanced descriptions keyed by (scene id, hash of flag state)
+        self._scene_desc_cache: Dict[Tuple[str, int], str] = {}
+        self._dialogue_suffix = ""
+        # Formatted AI dialogue keyed by (npc name, mood, npc context)
+        self._dialogue_cache: Dict[Tuple[str, str, str], str] = {}
+        # AI dialogue request for the scene being rendered, if in flight
+        self._dialogue_task: Optional[asyncio.Task] = None
+        # Scenes already resolved through the scene manager that owns them
+        self._scene_cache: Dict[str, Scene] = {}
+        self._scene_cache_owner: object = None
+        self._batch_depth = 0
+        self._refresh_pending = False
+        # Widget handles resolved once in on_mount
+        self._title_widget: Optional[Static] = None
+        self._desc_widget: Optional[Static] = None
+        self._choices_container: Optional[Vertical] = None
+        self._dice_widget: Optional[Static] = None
+        self._status_widget: Optional[Static] = None
+        self._action_widget: Optional[Static] = None
 
     def compose(self):
         """Compose the narrative game screen."""
@@ -54,6 +155,14 @@ class NarrativeGameScreen(Screen):
         import time
 
         self._start_time = time.time()
+        self._title_widget = self.query_one("#scene_title", Static)
+        self._desc_widget = self.query_one("#scene_description", Static)
+        self._choices_container = self.query_one("#choices_container", Vertical)
+        self._dice_widget = self.query_one("#dice_display", Static)
+        self._status_widget = self.query_one("#status_info", Static)
+        self._action_widget = self.query_one("#action_buttons", Static)
+        # The action hints never change, so they are written once here
+        self._update_action_buttons()
         if not self.game_state and hasattr(self.app, "narrative_game_state"):
             self.game_state = self.app.narrative_game_state
         if not self.current_scene and hasattr(self.app, "narrative_initial_scene"):
@@ -75,41 +184,67 @@ class NarrativeGameScreen(Screen):
     async def set_game_state(self, state: GameState) -> None:
         """Set the game state."""
         self.game_state = state
-        await self._update_display()
+        await self._schedule_refresh()
 
     async def set_scene(self, scene: Scene) -> None:
         """Set and display a new scene."""
         self.current_scene = scene
+        await self._schedule_refresh()
+
+    @asynccontextmanager
+    async def _batch(self) -> AsyncIterator[None]:
+        """Defer display refreshes until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._refresh_pending:
+            self._refresh_pending = False
+            await self._update_display()
+
+    async def _schedule_refresh(self) -> None:
+        """Refresh the display now, or once at the end of the current batch."""
+        if self._batch_depth:
+            self._refresh_pending = True
+            return
         await self._update_display()
 
     async def _update_display(self) -> None:
         """Update the narrative display."""
-        if not self.current_scene:
+        if not self.current_scene or self._title_widget is None:
             return
 
-        title_widget = self.query_one("#scene_title", Static)
-        desc_widget = self.query_one("#scene_description", Static)
+        await self._refresh_scene()
+        self._refresh_status()
 
+    async def _refresh_scene(self) -> None:
+        """Render the scene title, description and choice buttons."""
         # Format title with decoration per PRD
-        title_widget.update(f"[b]═══ {self.current_scene.title} ═══[/b]")
+        self._title_widget.update(f"[b]═══ {self.current_scene.title} ═══[/b]")
 
-        # Get description - enhance with AI when available for rich content
-        if (
-            hasattr(self.app, "scene_manager")
-            and self.app.scene_manager.ai_client
-            and self.game_state
-        ):
-            try:
-                description = await self.app.scene_manager.render_scene(
-                    self.current_scene, self.game_state
-                )
-            except Exception as e:
-                logger.warning(f"Scene enhancement failed: {e}")
-                description = self.current_scene.description
-        else:
-            description = self.current_scene.description
+        # Get description - AI-enhanced text is cached per scene and flag
+        # state; on a miss the static text is shown while it is fetched.
+        scene = self.current_scene
+        description = scene.description
+        fetch_key = None
+        scene_manager = getattr(self.app, "scene_manager", None)
+        if scene_manager and scene_manager.ai_client and self.game_state:
+            key = (scene.id, _flags_hash(self.game_state.flags))
+            cached = self._scene_desc_cache.get(key)
+            if cached is not None:
+                description = cached
+            else:
+                fetch_key = key
 
         description = self._format_description(description)
+        self._dialogue_suffix = ""
+
+        # A dialogue request still running belongs to a render we are replacing
+        stale_task = self._dialogue_task
+        if stale_task is not None and not stale_task.done():
+            self._dialogue_task = None
+            stale_task.cancel()
 
         # Check for AI-enhanced dialogue
         if self.current_scene.ai_dialogue and self.current_scene.npc_name:
@@ -119,18 +254,32 @@ class NarrativeGameScreen(Screen):
             # Build context for AI
             npc_context = self._build_npc_context()
 
-            # Generate AI dialogue
-            if ai_service and ai_service.is_enabled():
-                try:
-                    ai_dialogue = await ai_service.enhance_dialogue(
-                        npc_name=self.current_scene.npc_name,
-                        mood=self.current_scene.npc_mood or "neutral",
+            # Generate AI dialogue, reusing the formatted text for repeat visits
+            npc_name = self.current_scene.npc_name
+            mood = self.current_scene.npc_mood or "neutral"
+            dialogue_key = (npc_name, mood, npc_context)
+            cached_dialogue = self._dialogue_cache.get(dialogue_key)
+            if cached_dialogue is not None:
+                self._dialogue_suffix = cached_dialogue
+            elif ai_service and ai_service.is_enabled():
+                task = asyncio.create_task(
+                    ai_service.enhance_dialogue(
+                        npc_name=npc_name,
+                        mood=mood,
                         context=npc_context,
                         dialogue_type="greeting",
                     )
-                    description += self._format_ai_dialogue(
-                        self.current_scene.npc_name, ai_dialogue
-                    )
+                )
+                self._dialogue_task = task
+                try:
+                    ai_dialogue = await task
+                    self._dialogue_suffix = self._format_ai_dialogue(npc_name, ai_dialogue)
+                    self._dialogue_cache[dialogue_key] = self._dialogue_suffix
+                except asyncio.CancelledError:
+                    if self._dialogue_task is task:
+                        raise
+                    # A newer render took over the display
+                    return
                 except Exception as e:
                     # Log error for debugging but continue with fallback
                     logger.error(
@@ -138,23 +287,35 @@ class NarrativeGameScreen(Screen):
                     )
                     # Continue with static description as fallback
 
-        desc_widget.update(description)
+        self._desc_widget.update(description + self._dialogue_suffix)
+        if fetch_key is not None:
+            self.run_worker(
+                self._fetch_scene_description(scene, fetch_key),
+                group="scene_description",
+                exclusive=True,
+            )
 
         await self._update_choices()
+
+    async def _fetch_scene_description(self, scene: Scene, key: Tuple[str, int]) -> None:
+        """Fetch the AI-enhanced description and show it if still current."""
+        try:
+            description = await self.app.scene_manager.render_scene(scene, self.game_state)
+        except Exception as e:
+            logger.warning(f"Scene enhancement failed: {e}")
+            return
+        self._scene_desc_cache[key] = description
+        if self.current_scene is scene and self._desc_widget is not None:
+            self._desc_widget.update(self._format_description(description) + self._dialogue_suffix)
+
+    def _refresh_status(self) -> None:
+        """Refresh the parts of the display that follow flags and HP."""
+        self._update_choice_visibility()
         self._update_status()
-        self._update_action_buttons()
 
     def _format_description(self, description: str) -> str:
         """Format description - make NPC dialogue distinct with styling."""
-        import re
-
-        def replace_dialogue(match):
-            quote = match.group(0)
-            return f"[italic #87CEEB]{quote}[/italic #87CEEB]"
-
-        formatted = re.sub(r"\"([^\"]*)\"", replace_dialogue, description)
-
-        return formatted
+        return _DIALOGUE_RE.sub(_style_dialogue, description)
 
     def _format_ai_dialogue(self, npc_name: str, dialogue: str) -> str:
         """Format AI-generated NPC dialogue with distinct roleplay styling."""
@@ -171,33 +332,30 @@ class NarrativeGameScreen(Screen):
         char = self.game_state.character
         flags = self.game_state.flags
 
-        context_parts = [
-            f"Player is a {char.race} {char.character_class} named {char.name}.",
-        ]
-
         # Get NPC memory context if available
+        npc_context = None
         npc_id = self.current_scene.npc_name if self.current_scene else None
         if npc_id:
             npc_context = self.app.npc_memory.get_npc_context(npc_id.lower())
-            if npc_context:
-                context_parts.append(npc_context)
 
-        # Add notable flags
-        if flags.get("met_stranger"):
-            context_parts.append("The player has met me before.")
-        if flags.get("learned_dungeon_secret"):
-            context_parts.append("The player knows about the dungeon's secrets.")
-        if flags.get("allied_with_stranger"):
-            context_parts.append("The player is my ally in this quest.")
-        if flags.get("accepted_quest"):
-            context_parts.append("The player accepted my quest.")
-
-        return " ".join(context_parts)
+        return _compose_npc_context(
+            (char.race, char.character_class, char.name),
+            npc_context or None,
+            tuple(bool(flags.get(flag)) for flag, _ in _NPC_CONTEXT_FLAGS),
+        )
 
     async def _update_choices(self) -> None:
         """Update the choices display."""
-        choices_container = self.query_one("#choices_container", Vertical)
-        await choices_container.remove_children()
+        choices_container = self._choices_container
+        if choices_container is None:
+            return
+        # Re-rendering the same scene keeps its buttons; _refresh_status
+        # already brings their visibility up to date.
+        if self.current_scene is not None and self.current_scene is self._rendered_scene:
+            return
+        self._rendered_scene = self.current_scene
+        if choices_container.children:
+            await choices_container.remove_children()
 
         if not self.current_scene:
             return
@@ -245,36 +403,55 @@ class NarrativeGameScreen(Screen):
                 logger.warning(f"AI choice generation failed: {e}")
 
         self._effective_choices = effective_choices
+        self._choice_buttons = {}
+        self._button_choices = {}
+        self._availability.clear()
+        shortcut_index: Dict[str, List[Choice]] = {}
+        for choice in effective_choices:
+            shortcut_index.setdefault(choice.shortcut.upper(), []).append(choice)
+        self._shortcut_index = {key: tuple(group) for key, group in shortcut_index.items()}
 
         if not effective_choices:
             return
 
+        # Every choice gets a button once per scene; availability changes
+        # only toggle its visibility (see _update_choice_visibility, which
+        # always runs after this) instead of rebuilding the list.
+        scene_id = self.current_scene.id if self.current_scene else "unknown"
         for choice in effective_choices:
-            if self._is_choice_available(choice):
-                # Format: [A] Choice text - shortcut in yellow (NOT a hotkey)
-                # Use scene ID prefix to ensure unique button IDs across scenes
-                scene_id = self.current_scene.id if self.current_scene else "unknown"
-                btn = Button(
-                    f"[yellow]{choice.shortcut.upper()}[/yellow] {choice.text}",
-                    id=f"choice_{scene_id}_{choice.id}",
-                    variant="default",
-                )
-                choices_container.mount(btn)
+            button_id, label = _choice_button_spec(
+                scene_id, choice.id, choice.shortcut, choice.text
+            )
+            btn = Button(label, id=button_id, variant="default")
+            self._choice_buttons[choice.id] = btn
+            self._button_choices.setdefault(button_id, choice)
+        choices_container.mount_all(self._choice_buttons.values())
+
+    def _update_choice_visibility(self) -> None:
+        """Recompute choice availability and show or hide buttons to match."""
+        availability = self._availability
+        availability.clear()
+        for choice in self._effective_choices:
+            available = self._is_choice_available(choice)
+            availability.setdefault(choice.id, available)
+            btn = self._choice_buttons.get(choice.id)
+            if btn is not None and btn.display != available:
+                btn.display = available
 
     def _is_choice_available(self, choice: Choice) -> bool:
         """Check if a choice is available based on flags."""
-        if not self.game_state:
+        if not choice._has_reqs or not self.game_state:
             return True
 
-        for flag, required_value in choice.required_flags.items():
-            if self.game_state.flags.get(flag, False) != required_value:
-                return False
-        return True
+        required = choice._required_items
+        flags = self.game_state.flags
+        if required and not required <= flags.items():
+            return False
+        return all(flags.get(flag, False) == value for flag, value in choice._required_other)
 
     def _update_status(self) -> None:
         """Update the status display."""
-        status_widget = self.query_one("#status_info", Static)
-        if not self.game_state:
+        if self._status_widget is None or not self.game_state:
             return
 
         lines = [
@@ -288,12 +465,15 @@ class NarrativeGameScreen(Screen):
                 lines.append(f"Level {char.level} {char.race} {char.character_class}")
             lines.append(hp_line)
 
-        status_widget.update("\n".join(lines))
+        status = "\n".join(lines)
+        if status != self._last_status:
+            self._last_status = status
+            self._status_widget.update(status)
 
     def _update_action_buttons(self) -> None:
         """Update action buttons (save, etc.)."""
-        buttons_container = self.query_one("#action_buttons", Static)
-        buttons_container.update("[S] Save Game")
+        if self._action_widget is not None:
+            self._action_widget.update("[S] Save Game")
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses for choices."""
@@ -302,15 +482,9 @@ class NarrativeGameScreen(Screen):
             return
 
         if button_id.startswith("choice_"):
-            # Button ID format: choice_{scene_id}_{choice_id}
-            # Extract choice_id by removing the prefix
-            if self.current_scene:
-                prefix = f"choice_{self.current_scene.id}_"
-                choice_id = button_id.replace(prefix, "", 1)
-            else:
-                # Fallback: just remove "choice_" prefix
-                choice_id = button_id.replace("choice_", "")
-            await self._handle_choice(choice_id)
+            choice = self._button_choices.get(button_id)
+            if choice:
+                await self._handle_choice(choice)
         elif button_id == "btn_save":
             self._save_game()
 
@@ -338,23 +512,21 @@ class NarrativeGameScreen(Screen):
         import time
         from ...narrative.serializers import SaveDataBuilder
 
+        now = time.time()
         metadata = {
-            "playtime_seconds": int(time.time() - self._start_time) if self._start_time else 0,
-            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "playtime_seconds": int(now - self._start_time) if self._start_time else 0,
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            "saved_at_epoch": int(now),
         }
 
         return SaveDataBuilder.build_full_save(self.game_state, metadata)
 
-    async def _handle_choice(self, choice_id: str) -> None:
+    async def _handle_choice(self, choice: Choice) -> None:
         """Handle a player's choice."""
         if not self.current_scene or not self.game_state:
             return
 
-        choice = next((c for c in self._effective_choices if c.id == choice_id), None)
-        if not choice:
-            return
-
-        self.game_state.choices_made.append(choice_id)
+        self.game_state.choices_made.append(choice.id)
 
         for flag, value in choice.set_flags.items():
             self.game_state.flags[flag] = value
@@ -366,6 +538,8 @@ class NarrativeGameScreen(Screen):
         if choice.combat_encounter:
             await self._start_combat(choice)
         elif choice.skill_check:
+            if choice.set_flags:
+                self._refresh_status()
             self._handle_skill_check(choice)
         else:
             await self._transition_to_scene(choice.next_scene)
@@ -442,80 +616,68 @@ class NarrativeGameScreen(Screen):
 
         skill_check = choice.skill_check
         modifier = self._get_skill_modifier(skill_check.ability)
-        ability_names = {
-            "str": "Strength",
-            "dex": "Dexterity",
-            "con": "Constitution",
-            "int": "Intelligence",
-            "wis": "Wisdom",
-            "cha": "Charisma",
-        }
-        skill_name = ability_names.get(skill_check.ability, skill_check.ability.upper())
+        skill_name = _ABILITY_NAMES.get(skill_check.ability) or skill_check.ability.upper()
         self.app.run_worker(
             self._animate_and_reveal_skill_check(choice, skill_check, modifier, skill_name)
         )
 
     def _get_skill_modifier(self, ability: str) -> int:
         """Get modifier for an ability from character."""
-        ability_mods = {
-            "str": "strength_mod",
-            "dex": "dexterity_mod",
-            "con": "constitution_mod",
-            "int": "intelligence_mod",
-            "wis": "wisdom_mod",
-            "cha": "charisma_mod",
-        }
-        attr = ability_mods.get(ability, "strength_mod")
-        if self.game_state and hasattr(self.game_state.character, attr):
-            return getattr(self.game_state.character, attr, 0)
-        return 0
+        if not self.game_state:
+            return 0
+        get_mod = _ABILITY_MODS.get(ability, _ABILITY_MODS["str"])
+        try:
+            return get_mod(self.game_state.character)
+        except AttributeError:
+            return 0
 
     async def _animate_and_reveal_skill_check(
         self, choice: Choice, skill_check, modifier: int, skill_name: str
     ) -> None:
         """Animate rolling, then reveal result."""
-        try:
-            dice_widget = self.query_one("#dice_display", Static)
-        except Exception:
+        dice_widget = self._dice_widget
+        if dice_widget is None:
             return
 
-        pre_roll = DiceDisplay.display_pre_roll(skill_name, skill_check.dc, modifier)
-        dice_widget.update(pre_roll)
-        await asyncio.sleep(0.2)
+        try:
+            pre_roll = DiceDisplay.display_pre_roll(skill_name, skill_check.dc, modifier)
+            dice_widget.update(pre_roll)
+            await asyncio.sleep(0.2)
 
-        mod_str = f"+{modifier}" if modifier >= 0 else str(modifier)
-        for i in range(4):
-            try:
-                q = "?" * ((i % 3) + 1)
-                rolling = f"""
+            mod_str = f"+{modifier}" if modifier >= 0 else str(modifier)
+            header = f"""
 ╭───────────────────────────────────╮
 │    🔍 {skill_name.upper()} CHECK          │
 │                                   │
 │        DC {skill_check.dc} · {skill_name} ({mod_str})   │
 │                                   │
-│         Rolling... {q:<3}              │
-╰───────────────────────────────────╯"""
-                dice_widget.update(rolling)
-            except Exception:
-                return
-            await asyncio.sleep(0.15)
+"""
+            footer = "\n╰───────────────────────────────────╯"
+            # The animation cycles through "?", "??" and "???"
+            frames = tuple(
+                f"{header}│         Rolling... {'?' * dots:<3}              │{footer}"
+                for dots in (1, 2, 3)
+            )
+            for i in range(4):
+                dice_widget.update(frames[i % 3])
+                await asyncio.sleep(0.15)
 
-        result = DiceDisplay.roll_d20(modifier)
-        success = result.total >= skill_check.dc
+            result = DiceDisplay.roll_d20(modifier)
+            success = result.total >= skill_check.dc
 
-        if result.is_critical:
-            try:
-                import sys
+            if result.is_critical:
+                try:
+                    import sys
 
-                sys.stdout.write("\a")
-                sys.stdout.flush()
-            except Exception:
-                pass
+                    sys.stdout.write("\a")
+                    sys.stdout.flush()
+                except Exception:
+                    pass
 
-        try:
             display = DiceDisplay.display_skill_check(skill_name, result, skill_check.dc, success)
             dice_widget.update(display)
-        except Exception:
+        except Exception as e:
+            logger.debug(f"Skill check animation aborted: {e}")
             return
 
         await asyncio.sleep(0.5)
@@ -534,17 +696,21 @@ class NarrativeGameScreen(Screen):
         if not scene_manager:
             return
 
+        if scene_manager is not self._scene_cache_owner:
+            self._scene_cache.clear()
+            self._scene_cache_owner = scene_manager
+
         try:
-            if scene_manager.ai_client and self.game_state:
-                scene = await scene_manager.get_scene_async(scene_id, self.game_state)
-            else:
-                scene = scene_manager.get_scene(scene_id)
+            scene = self._scene_cache.get(scene_id)
+            if scene is None:
+                scene = await self._resolve_scene(scene_manager, scene_id)
             self.game_state.current_scene = scene_id
             self.game_state.scene_history.append(scene_id)
-            await self.set_scene(scene)
-
-            for flag, value in scene.flags_set.items():
-                self.game_state.flags[flag] = value
+            # Render once, after the scene's own flags are applied
+            async with self._batch():
+                await self.set_scene(scene)
+                for flag, value in scene.flags_set.items():
+                    self.game_state.flags[flag] = value
 
             if scene.is_combat:
                 self.game_state.is_combat = True
@@ -555,6 +721,24 @@ class NarrativeGameScreen(Screen):
         except Exception as e:
             logger.warning(f"Scene load failed for {scene_id}: {e}")
             self.notify(f"Scene not found: {scene_id}")
+            # The choice that led here may have set flags; shortcut keys
+            # read availability from the last refresh, so redo it now
+            self._refresh_status()
+
+    async def _resolve_scene(self, scene_manager, scene_id: str) -> Scene:
+        """Fetch a scene from the manager, caching it unless it is a fallback."""
+        if scene_manager.ai_client and self.game_state:
+            scene = await scene_manager.get_scene_async(scene_id, self.game_state)
+        else:
+            scene = scene_manager.get_scene(scene_id)
+        # Generic fallbacks are not cached so a later visit can still get
+        # the authored or AI-generated scene.
+        if (
+            scene_manager.scenes.get(scene_id) is scene
+            or scene_manager.ai_scene_cache.get(scene_id) is scene
+        ):
+            self._scene_cache[scene_id] = scene
+        return scene
 
     async def _handle_ending(self, scene: Scene) -> None:
         """Handle reaching an ending."""
@@ -610,8 +794,10 @@ class NarrativeGameScreen(Screen):
         if not self.current_scene:
             return
 
-        key = event.key.upper()
-        for choice in self._effective_choices:
-            if choice.shortcut.upper() == key and self._is_choice_available(choice):
-                await self._handle_choice(choice.id)
+        for choice in self._shortcut_index.get(event.key.upper(), ()):
+            available = self._availability.get(choice.id)
+            if available is None:
+                available = self._is_choice_available(choice)
+            if available:
+                await self._handle_choice(choice)
                 break
@@ -1,6 +1,8 @@
 """Widgets for displaying game data."""
 
-from typing import Optional, Tuple
+import time
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
 from textual.widget import Widget
 from textual.widgets import Static
 
@@ -19,6 +21,13 @@ class MapWidget(Widget):
         self.player_pos: Optional[Tuple[int, int]] = None
         self.enemy_positions: dict = {}
         self.item_positions: dict = {}
+        # Entity glyph per position; the player wins over enemies over items
+        self._overlay: dict = {}
+        # Bumped on every state change; render reuses its output until then
+        self._version = 0
+        self._map_text_cache: Tuple[int, str] = (-1, "")
+        # Setters called back to back share one deferred refresh
+        self._refresh_pending = False
 
         self.tile_chars = {
             "FLOOR": ".",
@@ -31,85 +40,181 @@ class MapWidget(Widget):
             "LAVA": "^",
             "VOID": " ",
         }
+        # Per-row glyphs for visible and explored tiles, built by set_map
+        self._glyph_rows: List[str] = []
+        self._explored_rows: List[str] = []
+        # Flat y * width + x masks of visible_tiles and explored_tiles
+        self._visible_mask = bytearray()
+        self._explored_mask = bytearray()
+        if map_data is not None:
+            self._build_glyph_rows()
+            self._visible_mask = self._tile_mask(self.visible_tiles)
+            self._explored_mask = self._tile_mask(self.explored_tiles)
 
     def set_map(self, map_data) -> None:
-        """Set the map data to display."""
+        """Set the map data to display.
+
+        Tile glyphs are looked up once here, so call this again after
+        changing the map's tiles.
+        """
         self.map_data = map_data
-        self.refresh()
+        self._build_glyph_rows()
+        self._visible_mask = self._tile_mask(self.visible_tiles)
+        self._explored_mask = self._tile_mask(self.explored_tiles)
+        self._invalidate()
+
+    def _build_glyph_rows(self) -> None:
+        """Translate every tile of the map into its visible and explored glyph."""
+        self._glyph_rows = []
+        self._explored_rows = []
+        if not self.map_data:
+            return
+
+        tile_chars = self.tile_chars
+        # Glyph per tile type, so each type's name is looked up only once
+        visible_lut: dict = {}
+        get_tile = self.map_data.get_tile
+        for y in range(self.map_data.height):
+            visible_row = []
+            explored_row = []
+            for x in range(self.map_data.width):
+                tile = get_tile(x, y)
+                if not tile:
+                    visible_row.append(" ")
+                    explored_row.append(" ")
+                    continue
+                glyph = visible_lut.get(tile.tile_type)
+                if glyph is None:
+                    glyph = visible_lut[tile.tile_type] = tile_chars.get(tile.tile_type.name)
+                if glyph is None:
+                    visible_row.append("?")
+                    explored_row.append(" ")
+                else:
+                    visible_row.append(glyph)
+                    explored_row.append(glyph.lower())
+            self._glyph_rows.append("".join(visible_row))
+            self._explored_rows.append("".join(explored_row))
+
+    def _tile_mask(self, tiles: Iterable[Tuple[int, int]]) -> bytearray:
+        """Flatten a set of positions into a byte per map tile."""
+        if not self.map_data:
+            return bytearray()
+        width = self.map_data.width
+        height = self.map_data.height
+        mask = bytearray(width * height)
+        for x, y in tiles:
+            if 0 <= x < width and 0 <= y < height:
+                mask[y * width + x] = 1
+        return mask
 
     def set_visible_tiles(self, tiles: set) -> None:
         """Set currently visible tiles (FOV)."""
         self.visible_tiles = tiles
-        self.refresh()
+        self._visible_mask = self._tile_mask(tiles)
+        self._invalidate()
 
     def set_explored_tiles(self, tiles: set) -> None:
         """Set explored but not currently visible tiles."""
         self.explored_tiles = tiles
-        self.refresh()
+        self._explored_mask = self._tile_mask(tiles)
+        self._invalidate()
 
     def set_player(self, pos: Tuple[int, int]) -> None:
         """Set player position."""
         self.player_pos = pos
-        self.refresh()
+        self._build_overlay()
+        self._invalidate()
 
     def set_enemies(self, positions: dict) -> None:
         """Set enemy positions {id: (x, y)}."""
         self.enemy_positions = positions
-        self.refresh()
+        self._build_overlay()
+        self._invalidate()
 
     def set_items(self, positions: dict) -> None:
         """Set item positions {id: (x, y)}."""
         self.item_positions = positions
+        self._build_overlay()
+        self._invalidate()
+
+    def patch_enemies(self, moved: dict, removed: Iterable) -> None:
+        """Apply enemy position changes {id: (x, y)} and removals in place."""
+        if self._patch_positions(self.enemy_positions, moved, removed):
+            self._build_overlay()
+            self._invalidate()
+
+    def patch_items(self, moved: dict, removed: Iterable) -> None:
+        """Apply item position changes {id: (x, y)} and removals in place."""
+        if self._patch_positions(self.item_positions, moved, removed):
+            self._build_overlay()
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Record a state change and schedule a redraw."""
+        self._version += 1
+        if not self._refresh_pending:
+            self._refresh_pending = self.call_later(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Redraw once for every change since the last flush."""
+        self._refresh_pending = False
         self.refresh()
 
+    def _build_overlay(self) -> None:
+        """Index entity glyphs by position, writing higher priorities last."""
+        overlay = dict.fromkeys(self.item_positions.values(), "*")
+        overlay.update(dict.fromkeys(self.enemy_positions.values(), "E"))
+        if self.player_pos is not None:
+            overlay[self.player_pos] = "@"
+        self._overlay = overlay
+
+    @staticmethod
+    def _patch_positions(positions: dict, moved: dict, removed: Iterable) -> bool:
+        """Update a position dict in place; return True if anything changed."""
+        changed = bool(moved)
+        positions.update(moved)
+        for entity_id in removed:
+            if positions.pop(entity_id, None) is not None:
+                changed = True
+        return changed
+
     def render(self) -> str:
         """Render the map."""
         if not self.map_data:
             return "No map loaded"
+        if self._map_text_cache[0] == self._version:
+            return self._map_text_cache[1]
 
-        lines = []
-        height = self.map_data.height
-        width = self.map_data.width
-
-        for y in range(height):
-            line = ""
-            for x in range(width):
-                char = self._get_tile_char(x, y)
-                line += char
-            lines.append(line)
-
-        return "\n".join(lines)
-
-    def _get_tile_char(self, x: int, y: int) -> str:
-        """Get the character to display for a tile."""
-        pos = (x, y)
-
-        if self.player_pos == pos:
-            return "@"
-
-        for enemy_id, enemy_pos in self.enemy_positions.items():
-            if enemy_pos == pos:
-                return "E"
+        rendered = self._render_tiles()
+        self._map_text_cache = (self._version, rendered)
+        return rendered
 
-        for item_id, item_pos in self.item_positions.items():
-            if item_pos == pos:
-                return "*"
-
-        if pos not in self.visible_tiles:
-            if pos in self.explored_tiles:
-                tile = self.map_data.get_tile(x, y)
-                if tile:
-                    base_char = self.tile_chars.get(tile.tile_type.name, " ")
-                    return base_char.lower()
-                return " "
-            else:
-                return " "
+    def _render_tiles(self) -> str:
+        """Draw the map rows from the glyph rows, FOV masks and overlay."""
+        width = self.map_data.width
+        height = self.map_data.height
+        visible = self._visible_mask
+        explored = self._explored_mask
+        columns = range(width)
+        rows = []
+        for y, (glyphs, dim_glyphs) in enumerate(zip(self._glyph_rows, self._explored_rows)):
+            offset = y * width
+            rows.append(
+                [
+                    glyphs[x]
+                    if visible[offset + x]
+                    else dim_glyphs[x]
+                    if explored[offset + x]
+                    else " "
+                    for x in columns
+                ]
+            )
 
-        tile = self.map_data.get_tile(x, y)
-        if tile:
-            return self.tile_chars.get(tile.tile_type.name, "?")
+        for (x, y), char in self._overlay.items():
+            if 0 <= x < width and 0 <= y < height:
+                rows[y][x] = char
 
-        return " "
+        return "\n".join(["".join(row) for row in rows])
 
 
 class StatusWidget(Widget):
@@ -146,14 +251,12 @@ class CombatWidget(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.combat_log: list = []
         self.max_lines = 10
+        self.combat_log: deque[str] = deque(maxlen=self.max_lines)
 
     def add_entry(self, text: str) -> None:
         """Add a combat log entry."""
         self.combat_log.append(text)
-        if len(self.combat_log) > self.max_lines:
-            self.combat_log.pop(0)
         self.refresh()
 
     def clear(self) -> None:
@@ -171,19 +274,30 @@ class CombatWidget(Widget):
 class LogWidget(Widget):
     """Widget for displaying game log messages."""
 
+    _LEVEL_MARKERS = {"debug": "D", "info": "I", "warning": "!", "error": "X"}
+
     def __init__(self, max_lines: int = 100, **kwargs):
         super().__init__(**kwargs)
-        self.messages: list = []
+        # Messages are stored already formatted for display
+        self.messages: deque[str] = deque(maxlen=max_lines)
         self.max_lines = max_lines
+        # Last formatted timestamp, reused for messages in the same second
+        self._last_second = -1
+        self._last_timestamp = ""
+
+    def _timestamp(self) -> str:
+        """Return the current time as HH:MM:SS."""
+        second = int(time.time())
+        if second != self._last_second:
+            self._last_second = second
+            self._last_timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._last_timestamp
 
     def add_message(self, text: str, level: str = "info") -> None:
         """Add a log message."""
-        import datetime
-
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.messages.append({"timestamp": timestamp, "level": level, "text": text})
-        if len(self.messages) > self.max_lines:
-            self.messages.pop(0)
+        timestamp = self._timestamp()
+        level_marker = self._LEVEL_MARKERS.get(level, "?")
+        self.messages.append(f"[{timestamp}] {level_marker}: {text}")
         self.refresh()
 
     def clear(self) -> None:
@@ -195,13 +309,4 @@ class LogWidget(Widget):
         """Render the log messages."""
         if not self.messages:
             return "No messages"
-
-        lines = []
-        for msg in self.messages[-self.max_lines :]:
-            level_marker = {"debug": "D", "info": "I", "warning": "!", "error": "X"}.get(
-                msg["level"], "?"
-            )
-
-            lines.append(f"[{msg['timestamp']}] {level_marker}: {msg['text']}")
-
-        return "\n".join(lines)
+        return "\n".join(self.messages)
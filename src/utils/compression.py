@@ -0,0 +1,41 @@
+"""Save payload compression that uses zstd when it is installed."""
+
+import zlib
+from typing import Any
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only with zstandard
+    zstandard = None
+
+# Every zstd frame starts with this magic number; zlib streams never do
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+
+
+def _require_zstd() -> Any:
+    if zstandard is None:
+        raise ValueError("zstd-compressed data requires the zstandard package")
+    return zstandard
+
+
+def compress(data: bytes) -> bytes:
+    """Compress with zstd if available, otherwise zlib."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, level=ZLIB_LEVEL)
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress zstd or zlib data, detected from the leading bytes."""
+    if data.startswith(ZSTD_MAGIC):
+        return _require_zstd().ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def decompressobj(prefix: bytes) -> Any:
+    """Streaming decompressor for data that starts with ``prefix``."""
+    if prefix.startswith(ZSTD_MAGIC):
+        return _require_zstd().ZstdDecompressor().decompressobj()
+    return zlib.decompressobj()
@@ -0,0 +1,25 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON, stringifying unknown types."""
+    if orjson is not None:
+        # Pass datetimes through to ``default`` so they match the stdlib output
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
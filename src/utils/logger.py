@@ -1,9 +1,18 @@
 """Logging utilities for the game."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Formatters are stateless, so every GameLogger shares the same two
+_CONSOLE_FORMATTER = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
+)
+_FILE_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
 
 class GameLogger:
@@ -18,24 +27,53 @@ class GameLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
         self.logger.handlers.clear()
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
 
         # Console handler
         console = logging.StreamHandler(sys.stderr)
         console.setLevel(level)
-        console.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
-        )
+        console.setFormatter(_CONSOLE_FORMATTER)
         self.logger.addHandler(console)
 
-        # File handler
-        if log_file:
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(
-                logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-            )
-            self.logger.addHandler(file_handler)
+        self.log_file: Optional[Path] = None
+        self._attach_file(log_file)
+        # Drain anything still queued when the game exits
+        atexit.register(self.close)
+
+    def _attach_file(self, log_file: Optional[Path]) -> None:
+        """Send records to log_file through a queue so log calls never wait on disk."""
+        if not log_file:
+            return
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_FILE_FORMATTER)
+
+        records: queue.Queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(records)
+        self._queue_handler.setLevel(logging.DEBUG)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(records, file_handler)
+        self._listener.start()
+        self.log_file = log_file
+
+    def set_log_file(self, log_file: Optional[Path]) -> None:
+        """Move file output to log_file, flushing the current file first."""
+        self.close()
+        self._attach_file(log_file)
+
+    def close(self) -> None:
+        """Flush queued file records and release the log file."""
+        if self._listener is None:
+            return
+        self.logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+        self._queue_handler = None
+        self.log_file = None
 
     def debug(self, msg: str) -> None:
         self.logger.debug(msg)
@@ -53,13 +91,19 @@ class GameLogger:
         self.logger.critical(msg)
 
 
-# Default logger instance
-default_logger: Optional[GameLogger] = None
+# Logger instances by name; each owns its stdlib logger's handlers
+_loggers: Dict[str, GameLogger] = {}
 
 
 def get_logger(name: str = "dnd_roguelike", log_file: Optional[Path] = None) -> GameLogger:
-    """Get or create a logger instance."""
-    global default_logger
-    if default_logger is None:
-        default_logger = GameLogger(name, log_file)
-    return default_logger
+    """Get or create the logger for name.
+
+    A log_file other than the one the logger already writes to moves its file
+    output there; omitting log_file keeps the current file.
+    """
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = GameLogger(name, log_file)
+    elif log_file is not None and log_file != logger.log_file:
+        logger.set_log_file(log_file)
+    return logger
@@ -3,13 +3,30 @@
 from typing import Tuple
 from .exceptions import ValidationError
 
+# Punctuation allowed in character names, stripped before the isalnum check
+_NAME_PUNCTUATION = str.maketrans("", "", " -'")
+
+_DIRECTIONS = {
+    "n": "north",
+    "north": "north",
+    "s": "south",
+    "south": "south",
+    "e": "east",
+    "east": "east",
+    "w": "west",
+    "west": "west",
+}
+
 
 def validate_coordinate(x: int, y: int, width: int, height: int) -> Tuple[int, int]:
     """Validate and clamp coordinates to bounds."""
-    return (
-        max(0, min(x, width - 1)),
-        max(0, min(y, height - 1))
-    )
+    # Conditional expressions avoid the min()/max() calls on this hot path;
+    # the upper bound is applied first so empty grids still clamp to 0
+    if x >= width:
+        x = width - 1
+    if y >= height:
+        y = height - 1
+    return (0 if x < 0 else x, 0 if y < 0 else y)
 
 
 def validate_character_name(name: str) -> None:
@@ -18,26 +35,16 @@ def validate_character_name(name: str) -> None:
         raise ValidationError("Character name cannot be empty")
     if len(name) > 50:
         raise ValidationError("Character name cannot exceed 50 characters")
-    if not name.replace(" ", "").replace("-", "").replace("'", "").isalnum():
+    if not name.translate(_NAME_PUNCTUATION).isalnum():
         raise ValidationError("Character name contains invalid characters")
 
 
 def validate_direction(direction: str) -> str:
     """Validate and normalize direction input."""
-    direction_map = {
-        "n": "north",
-        "north": "north",
-        "s": "south",
-        "south": "south",
-        "e": "east",
-        "east": "east",
-        "w": "west",
-        "west": "west",
-    }
-    normalized = direction.lower()
-    if normalized not in direction_map:
+    normalized = _DIRECTIONS.get(direction.lower())
+    if normalized is None:
         raise ValidationError(f"Invalid direction: {direction}")
-    return direction_map[normalized]
+    return normalized
 
 
 def validate_attribute_value(value: int, attr_name: str) -> int:
@@ -1,14 +1,25 @@
 # src/world/dungeon_generator.py
 """Procedural dungeon generation using BSP and Cellular Automata."""
 
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import List, Optional
 from .map import GameMap, Room
 from .tile_types import Tile
 from .fov import FieldOfView
 
 
+# Next cell state indexed by 3x3 block sum + 10 * current cell: floor when
+# more than 4 of the 8 neighbors are floor, wall when fewer, else unchanged
+_CA_RULE = tuple(
+    1 if total - cell > 4 else 0 if total - cell < 4 else cell
+    for cell in (0, 1)
+    for total in range(10)
+)
+
+
 @dataclass
 class DungeonConfig:
     """Configuration for dungeon generation."""
@@ -48,20 +59,16 @@ class DungeonGenerator:
         self.config = config
         self.map: Optional[GameMap] = None
         self.rooms: List[Room] = []
-
-        if config.seed is not None:
-            random.seed(config.seed)
+        # Floor layout while generating: one row per y, 1 for floor, 0 for wall
+        self._floor: List[bytearray] = []
+        # Private RNG so generators never share or reseed the global one
+        self._rng = random.Random(config.seed)
 
     def generate(self) -> GameMap:
         """Generate a complete dungeon."""
-        self.map = GameMap(
-            width=self.config.width, height=self.config.height, seed=self.config.seed
-        )
-
-        # Fill with walls (overriding default floors)
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                self.map.set_tile(x, y, Tile.wall())
+        # Start from solid rock; rooms and corridors are carved out of it
+        width, height = self.config.width, self.config.height
+        self._floor = [bytearray(width) for _ in range(height)]
 
         if self.config.use_cave:
             self._generate_caves()
@@ -69,6 +76,15 @@ class DungeonGenerator:
             self._generate_bsp_rooms()
             self._connect_rooms()
 
+        # Tile objects are only built once the layout is final
+        self.map = GameMap(
+            width=width,
+            height=height,
+            tiles=[[Tile.floor() if cell else Tile.wall() for cell in row] for row in self._floor],
+            rooms=self.rooms,
+            seed=self.config.seed,
+        )
+
         # Place stairs
         self._place_stairs()
 
@@ -82,11 +98,26 @@ class DungeonGenerator:
         generator = cls(config)
         return generator.generate()
 
+    @classmethod
+    def generate_many(
+        cls, configs: List[DungeonConfig], max_workers: Optional[int] = None
+    ) -> List[GameMap]:
+        """Generate one dungeon per config, in parallel worker processes.
+
+        Each dungeon depends only on its own config, so the result matches
+        generating them one after another.
+        """
+        if len(configs) <= 1:
+            return [cls(config).generate() for config in configs]
+        workers = min(len(configs), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.generate_dungeon, configs))
+
     def _generate_bsp_rooms(self) -> None:
         """Generate rooms using BSP."""
         # Build BSP tree
         root = BSPNode(1, 1, self.config.width - 2, self.config.height - 2)
-        self._build_bsp(root, depth=0)
+        self._build_bsp(root)
 
         # Extract rooms from leaf nodes
         self._extract_bsp_rooms(root)
@@ -95,34 +126,35 @@ class DungeonGenerator:
         for room in self.rooms:
             self._carve_room(room)
 
-        # Sync rooms to map
-        self.map.rooms = self.rooms
-
-    def _build_bsp(self, node: BSPNode, depth: int) -> None:
-        """Recursively build BSP tree."""
+    def _build_bsp(self, root: BSPNode) -> None:
+        """Build the BSP tree below root."""
         max_depth = 8
 
         # Determine if we should split
         min_size = self.config.min_room_size
         max_size = self.config.max_room_size
 
-        # Check if both dimensions allow splitting
-        can_split = (node.width > max_size and node.height >= min_size * 2) or (
-            node.height > max_size and node.width >= min_size * 2
-        )
+        # Explicit stack instead of recursion; the right child is pushed
+        # first so nodes are split in the same depth-first, left-first order
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
 
-        # Prefer splitting the larger dimension
-        if node.width >= node.height:
-            can_split_vertically = node.width > max_size and node.height >= min_size * 2
-            can_split_horizontally = node.height > max_size and node.width >= min_size * 2
-        else:
-            can_split_horizontally = node.height > max_size and node.width >= min_size * 2
-            can_split_vertically = node.width > max_size and node.height >= min_size * 2
+            # Prefer splitting the larger dimension
+            if node.width >= node.height:
+                can_split_vertically = node.width > max_size and node.height >= min_size * 2
+                can_split_horizontally = node.height > max_size and node.width >= min_size * 2
+            else:
+                can_split_horizontally = node.height > max_size and node.width >= min_size * 2
+                can_split_vertically = node.width > max_size and node.height >= min_size * 2
+
+            if depth >= max_depth or not (can_split_horizontally or can_split_vertically):
+                # Cannot split further - this node will become a leaf
+                continue
 
-        if depth < max_depth and (can_split_horizontally or can_split_vertically):
             # Decide split direction
             if can_split_horizontally and can_split_vertically:
-                split_horizontal = random.choice([True, False])
+                split_horizontal = self._rng.choice([True, False])
             elif can_split_horizontally:
                 split_horizontal = True
             else:
@@ -133,8 +165,8 @@ class DungeonGenerator:
                 min_split = self.config.min_room_size
                 max_split = node.height - self.config.min_room_size
                 if min_split >= max_split:
-                    return  # Cannot split
-                split_point = random.randint(min_split, max_split)
+                    continue  # Cannot split
+                split_point = self._rng.randint(min_split, max_split)
                 node.left = BSPNode(node.x, node.y, node.width, split_point)
                 node.right = BSPNode(
                     node.x, node.y + split_point, node.width, node.height - split_point
@@ -144,27 +176,33 @@ class DungeonGenerator:
                 min_split = self.config.min_room_size
                 max_split = node.width - self.config.min_room_size
                 if min_split >= max_split:
-                    return  # Cannot split
-                split_point = random.randint(min_split, max_split)
+                    continue  # Cannot split
+                split_point = self._rng.randint(min_split, max_split)
                 node.left = BSPNode(node.x, node.y, split_point, node.height)
                 node.right = BSPNode(
                     node.x + split_point, node.y, node.width - split_point, node.height
                 )
 
-            self._build_bsp(node.left, depth + 1)
-            self._build_bsp(node.right, depth + 1)
-        else:
-            # Cannot split further - this node will become a leaf
-            pass
+            stack.append((node.right, depth + 1))
+            stack.append((node.left, depth + 1))
+
+    def _extract_bsp_rooms(self, root: BSPNode) -> None:
+        """Extract rooms from BSP leaf nodes, left to right."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.left is not None or node.right is not None:
+                if node.right:
+                    stack.append(node.right)
+                if node.left:
+                    stack.append(node.left)
+                continue
 
-    def _extract_bsp_rooms(self, node: BSPNode) -> None:
-        """Extract rooms from BSP leaf nodes."""
-        if node.left is None and node.right is None:
             # This is a leaf - create a room
-            room_width = random.randint(
+            room_width = self._rng.randint(
                 self.config.min_room_size, min(self.config.max_room_size, node.width)
             )
-            room_height = random.randint(
+            room_height = self._rng.randint(
                 self.config.min_room_size, min(self.config.max_room_size, node.height)
             )
 
@@ -181,33 +219,18 @@ class DungeonGenerator:
             )
             node.room = room
             self.rooms.append(room)
-        else:
-            # Recurse into children
-            if node.left:
-                self._extract_bsp_rooms(node.left)
-            if node.right:
-                self._extract_bsp_rooms(node.right)
 
     def _carve_room(self, room: Room) -> None:
         """Carve a room into the map."""
-        for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                if 0 <= x < self.map.width and 0 <= y < self.map.height:
-                    self.map.set_tile(x, y, Tile.floor())
-
-        # Add walls around room edges (ensure edges are walls)
-        for y in range(room.y - 1, room.y + room.height + 1):
-            for x in range(room.x - 1, room.x + room.width + 1):
-                if 0 <= x < self.map.width and 0 <= y < self.map.height:
-                    tile = self.map.get_tile(x, y)
-                    if tile and tile.tile_type.name == "WALL":
-                        # Only set wall if not part of a room
-                        is_in_room = any(
-                            room.x <= x < room.x + room.width and room.y <= y < room.y + room.height
-                            for room in self.rooms
-                        )
-                        if not is_in_room:
-                            self.map.set_tile(x, y, Tile.wall())
+        # Everything around the room is still wall, so only the interior
+        # is written, one row slice at a time.
+        x0 = max(room.x, 0)
+        x1 = min(room.x + room.width, self.config.width)
+        if x0 >= x1:
+            return
+        carved = b"\x01" * (x1 - x0)
+        for row in self._floor[max(room.y, 0) : max(room.y + room.height, 0)]:
+            row[x0:x1] = carved
 
     def _connect_rooms(self) -> None:
         """Connect rooms with corridors."""
@@ -226,7 +249,7 @@ class DungeonGenerator:
         center_b = room_b.center
 
         # Randomly choose horizontal or vertical first
-        if random.choice([True, False]):
+        if self._rng.choice([True, False]):
             # Horizontal then vertical
             self._carve_horizontal_corridor(center_a[0], center_b[0], center_a[1])
             self._carve_vertical_corridor(center_a[1], center_b[1], center_b[0])
@@ -237,115 +260,95 @@ class DungeonGenerator:
 
     def _carve_horizontal_corridor(self, x1: int, x2: int, y: int) -> None:
         """Carve horizontal corridor."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= x < self.map.width and 0 <= y < self.map.height:
-                tile = self.map.get_tile(x, y)
-                if tile and tile.tile_type.name == "WALL":
-                    self.map.set_tile(x, y, Tile.floor())
+        if not 0 <= y < len(self._floor):
+            return
+        start = max(min(x1, x2), 0)
+        stop = min(max(x1, x2) + 1, self.config.width)
+        if start < stop:
+            self._floor[y][start:stop] = b"\x01" * (stop - start)
 
     def _carve_vertical_corridor(self, y1: int, y2: int, x: int) -> None:
         """Carve vertical corridor."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            if 0 <= x < self.map.width and 0 <= y < self.map.height:
-                tile = self.map.get_tile(x, y)
-                if tile and tile.tile_type.name == "WALL":
-                    self.map.set_tile(x, y, Tile.floor())
+        if not 0 <= x < self.config.width:
+            return
+        for row in self._floor[max(min(y1, y2), 0) : max(max(y1, y2) + 1, 0)]:
+            row[x] = 1
 
     def _generate_caves(self) -> None:
         """Generate cave system using cellular automata."""
-        # Initialize with random noise
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                if random.random() < self.config.cave_density:
-                    self.map.set_tile(x, y, Tile.floor())
-                else:
-                    self.map.set_tile(x, y, Tile.wall())
+        # Initialize with random noise; 1 marks floor, 0 marks wall
+        density = self.config.cave_density
+        floor = [
+            [1 if self._rng.random() < density else 0 for _ in range(self.config.width)]
+            for _ in range(self.config.height)
+        ]
 
         # Apply cellular automata rules
         for _ in range(5):
-            self._apply_cellular_automata()
+            floor = self._apply_cellular_automata(floor)
 
         # Ensure connectivity
-        self._ensure_cave_connectivity()
-
-    def _apply_cellular_automata(self) -> None:
-        """Apply cellular automata smoothing."""
-        new_tiles = [
-            [self.map.get_tile(x, y) for x in range(self.map.width)] for y in range(self.map.height)
+        self._floor = [bytearray(row) for row in self._ensure_cave_connectivity(floor)]
+
+    @staticmethod
+    def _apply_cellular_automata(floor: List[List[int]]) -> List[List[int]]:
+        """Apply one cellular automata smoothing step to a 0/1 floor grid."""
+        # Floor count of each 3x3 block: sum across each row, then down the
+        # columns, treating everything outside the map as wall.
+        row_sums = [[0] * (len(floor[0]) if floor else 0)]
+        for row in floor:
+            padded = [0, *row, 0]
+            row_sums.append([a + b + c for a, b, c in zip(padded, padded[1:], padded[2:])])
+        row_sums.append(row_sums[0])
+
+        rule = _CA_RULE
+        return [
+            [rule[a + b + c + 10 * cell] for a, b, c, cell in zip(above, middle, below, row)]
+            for above, middle, below, row in zip(row_sums, row_sums[1:], row_sums[2:], floor)
         ]
 
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                neighbors = self._count_floor_neighbors(x, y)
-
-                if neighbors > 4:
-                    new_tiles[y][x] = Tile.floor()
-                elif neighbors < 4:
-                    new_tiles[y][x] = Tile.wall()
-
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                self.map.set_tile(x, y, new_tiles[y][x])
-
-    def _count_floor_neighbors(self, x: int, y: int) -> int:
-        """Count floor neighbors."""
-        count = 0
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.map.width and 0 <= ny < self.map.height:
-                    tile = self.map.get_tile(nx, ny)
-                    if tile and tile.tile_type.name == "FLOOR":
-                        count += 1
-        return count
-
-    def _ensure_cave_connectivity(self) -> None:
-        """Ensure cave is connected (flood fill and fill disconnected)."""
-        # Find largest connected floor area
-        visited = set()
-        largest_area = []
-
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                if (x, y) not in visited:
-                    tile = self.map.get_tile(x, y)
-                    if tile and tile.tile_type.name == "FLOOR":
-                        area = self._flood_fill(x, y, visited)
-                        if len(area) > len(largest_area):
-                            largest_area = area
-
-        # Fill all but largest area with walls
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                if (x, y) not in largest_area:
-                    tile = self.map.get_tile(x, y)
-                    if tile and tile.tile_type.name == "FLOOR":
-                        self.map.set_tile(x, y, Tile.wall())
-
-    def _flood_fill(self, start_x: int, start_y: int, visited: set) -> List[Tuple[int, int]]:
-        """Flood fill from starting point."""
-        area = []
-        stack = [(start_x, start_y)]
-
-        while stack:
-            x, y = stack.pop()
-            if (x, y) in visited:
-                continue
-            if x < 0 or x >= self.map.width or y < 0 or y >= self.map.height:
-                continue
-
-            tile = self.map.get_tile(x, y)
-            if not tile or tile.tile_type.name != "FLOOR":
+    @staticmethod
+    def _ensure_cave_connectivity(floor: List[List[int]]) -> List[List[int]]:
+        """Keep only the largest 4-connected region of a 0/1 floor grid."""
+        height = len(floor)
+        width = len(floor[0]) if floor else 0
+        size = width * height
+        cells = [cell for row in floor for cell in row]
+
+        # Label each floor region by flood fill over flat y * width + x indices
+        labels = [0] * size
+        region_sizes = [0]
+        for start in range(size):
+            if not cells[start] or labels[start]:
                 continue
-
-            visited.add((x, y))
-            area.append((x, y))
-
-            stack.extend([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
-
-        return area
+            label = len(region_sizes)
+            labels[start] = label
+            stack = [start]
+            area = 0
+            while stack:
+                index = stack.pop()
+                area += 1
+                x = index % width
+                for neighbor, in_row in (
+                    (index - 1, x > 0),
+                    (index + 1, x < width - 1),
+                    (index - width, True),
+                    (index + width, True),
+                ):
+                    if in_row and 0 <= neighbor < size and cells[neighbor] and not labels[neighbor]:
+                        labels[neighbor] = label
+                        stack.append(neighbor)
+            region_sizes.append(area)
+
+        if len(region_sizes) == 1:
+            return floor
+
+        # The first region found wins ties
+        largest = max(range(1, len(region_sizes)), key=region_sizes.__getitem__)
+        return [
+            [1 if label == largest else 0 for label in labels[y * width : (y + 1) * width]]
+            for y in range(height)
+        ]
 
     def _place_stairs(self) -> None:
         """Place stairs in the dungeon."""
@@ -3,10 +3,10 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import List, Optional, Set, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from src.entities.enemy import AIType, Enemy
-from src.world.pathfinding import a_star_path, manhattan_distance
+from src.world.pathfinding import a_star_path, chebyshev_distance, manhattan_distance
 
 
 class Action(Enum):
@@ -27,6 +27,9 @@ class Decision:
     message: str = ""
 
 
+# Adjacent steps considered when fleeing: N, E, S, W
+_FLEE_DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
 # Type for anything with a position attribute or a position tuple
 PositionLike = Union[Tuple[int, int], object]
 
@@ -55,6 +58,11 @@ class EnemyAI:
     - PATROL: Follows predefined route
     """
 
+    # Heuristic values towards the current goal, shared by every enemy's AI
+    # so later pathfinds in the same turn reuse earlier ones
+    _h_goal: Optional[Tuple[int, int]] = None
+    _h_cache: Dict[Tuple[int, int], int] = {}
+
     def __init__(
         self,
         ai_type: AIType = AIType.AGGRESSIVE,
@@ -70,6 +78,27 @@ class EnemyAI:
         self.patrol_route = patrol_route or []
         self._patrol_index = 0
 
+    @classmethod
+    def begin_turn(cls, player_position: Tuple[int, int]) -> None:
+        """Reset the shared heuristic cache for a new turn.
+
+        Args:
+            player_position: Player position that paths will target this turn
+        """
+        cls._h_goal = player_position
+        cls._h_cache.clear()
+
+    def _heuristic(self, pos: Tuple[int, int], goal: Tuple[int, int]) -> int:
+        """Chebyshev distance to goal, memoized for the current turn."""
+        cache = EnemyAI._h_cache
+        if goal != EnemyAI._h_goal:
+            EnemyAI.begin_turn(goal)
+        value = cache.get(pos)
+        if value is None:
+            value = chebyshev_distance(pos, goal)
+            cache[pos] = value
+        return value
+
     def is_aggro(
         self,
         enemy: Enemy,
@@ -115,7 +144,10 @@ class EnemyAI:
         def passable(x: int, y: int) -> bool:
             return map_data.is_walkable(x, y)
 
-        return a_star_path(enemy.position, player_position, passable)
+        # Enemies move diagonally, where Manhattan distance overestimates
+        return a_star_path(
+            enemy.position, player_position, passable, heuristic=self._heuristic
+        )
 
     def _get_flee_position(
         self,
@@ -133,24 +165,19 @@ class EnemyAI:
         Returns:
             Best position to flee to
         """
-        player_position = _extract_position(player)
-        # Get all valid adjacent positions
-        directions = [
-            (0, -1),  # N
-            (1, 0),   # E
-            (0, 1),   # S
-            (-1, 0),  # W
-        ]
-
-        current_pos = enemy.position
-        best_pos = current_pos
-        best_distance = -1  # We want to maximize distance
+        px, py = _extract_position(player)
+        ex, ey = enemy.position
+        is_walkable = map_data.is_walkable
 
-        for dx, dy in directions:
-            nx, ny = current_pos[0] + dx, current_pos[1] + dy
+        best_pos = enemy.position
+        best_distance = -1  # We want to maximize distance
 
-            if map_data.is_walkable(nx, ny):
-                dist = manhattan_distance((nx, ny), player_position)
+        # Earlier directions win ties, so fleeing stays deterministic
+        for dx, dy in _FLEE_DIRECTIONS:
+            nx = ex + dx
+            ny = ey + dy
+            if is_walkable(nx, ny):
+                dist = abs(nx - px) + abs(ny - py)
                 if dist > best_distance:
                     best_distance = dist
                     best_pos = (nx, ny)
@@ -184,25 +211,6 @@ class EnemyAI:
 
         return target
 
-    def _get_adjacent_attack_position(
-        self,
-        enemy: Enemy,
-        player_position: Tuple[int, int],
-        map_data,
-    ) -> bool:
-        """Check if enemy is adjacent to player (can attack).
-
-        Args:
-            enemy: The enemy entity
-            player_position: Player position
-            map_data: Map object
-
-        Returns:
-            True if enemy can attack (adjacent to player)
-        """
-        distance = manhattan_distance(enemy.position, player_position)
-        return distance == 1
-
     def decide_action(
         self,
         enemy: Enemy,
@@ -222,16 +230,18 @@ class EnemyAI:
             The chosen action
         """
         player_position = player.position
+        # Every behaviour measures the same distance, so it is computed once
+        distance = manhattan_distance(enemy.position, player_position)
 
         # Handle different AI types
         if self.ai_type == AIType.PASSIVE:
-            return self._decide_passive(enemy, player_position, map_data, fov)
+            return self._decide_passive(enemy, player_position, distance, map_data, fov)
         elif self.ai_type == AIType.AGGRESSIVE:
-            return self._decide_aggressive(enemy, player_position, map_data, fov)
+            return self._decide_aggressive(enemy, player_position, distance, map_data, fov)
         elif self.ai_type == AIType.DEFENSIVE:
-            return self._decide_defensive(enemy, player_position, map_data, fov)
+            return self._decide_defensive(enemy, player_position, distance, map_data, fov)
         elif self.ai_type == AIType.PATROL:
-            return self._decide_patrol(enemy, player_position, map_data, fov)
+            return self._decide_patrol(enemy, player_position, distance, map_data, fov)
 
         return Action.WAIT
 
@@ -239,15 +249,14 @@ class EnemyAI:
         self,
         enemy: Enemy,
         player_position: Tuple[int, int],
+        distance: int,
         map_data,
         fov: Set[Tuple[int, int]],
     ) -> Action:
         """Passive AI: Flees from player if too close, otherwise waits."""
         # Check if player is visible and close
-        if player_position in fov:
-            distance = manhattan_distance(enemy.position, player_position)
-            if distance <= enemy.aggro_range:
-                return Action.FLEE
+        if player_position in fov and distance <= enemy.aggro_range:
+            return Action.FLEE
 
         return Action.WAIT
 
@@ -255,6 +264,7 @@ class EnemyAI:
         self,
         enemy: Enemy,
         player_position: Tuple[int, int],
+        distance: int,
         map_data,
         fov: Set[Tuple[int, int]],
     ) -> Action:
@@ -262,7 +272,7 @@ class EnemyAI:
         # Check if player is visible
         if player_position in fov:
             # If adjacent, attack
-            if self._get_adjacent_attack_position(enemy, player_position, map_data):
+            if distance == 1:
                 return Action.ATTACK
             # Otherwise move toward player
             return Action.MOVE
@@ -275,14 +285,14 @@ class EnemyAI:
         self,
         enemy: Enemy,
         player_position: Tuple[int, int],
+        distance: int,
         map_data,
         fov: Set[Tuple[int, int]],
     ) -> Action:
         """Defensive AI: Attacks only if threatened (adjacent), otherwise waits."""
         # Check if player is adjacent (threatening)
-        if player_position in fov:
-            if self._get_adjacent_attack_position(enemy, player_position, map_data):
-                return Action.ATTACK
+        if player_position in fov and distance == 1:
+            return Action.ATTACK
 
         return Action.WAIT
 
@@ -290,15 +300,14 @@ class EnemyAI:
         self,
         enemy: Enemy,
         player_position: Tuple[int, int],
+        distance: int,
         map_data,
         fov: Set[Tuple[int, int]],
     ) -> Action:
         """Patrol AI: Follows predefined route, ignores player unless attacked."""
         # If player is very close and visible, become aggressive temporarily
-        if player_position in fov:
-            distance = manhattan_distance(enemy.position, player_position)
-            if distance <= 1:
-                return Action.ATTACK
+        if player_position in fov and distance <= 1:
+            return Action.ATTACK
 
         # Otherwise follow patrol route
         target = self._get_patrol_target(enemy, map_data)
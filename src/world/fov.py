@@ -4,6 +4,19 @@
 from typing import Set, Tuple
 from .map import GameMap
 
+# Per-octant multipliers (xx, xy, yx, yy) mapping an octant-relative
+# (dx, dy) to the map position (cx + dx*xx + dy*xy, cy + dx*yx + dy*yy)
+_OCTANT_TRANSFORMS = (
+    (1, 0, 0, -1),  # N
+    (0, 1, 1, 0),  # E
+    (-1, 0, 0, 1),  # S
+    (0, -1, -1, 0),  # W
+    (-1, 0, 0, -1),  # NW
+    (0, -1, 1, 0),  # SW
+    (1, 0, 0, 1),  # SE
+    (0, 1, -1, 0),  # NE
+)
+
 
 class FieldOfView:
     """Field of View calculator using Shadow Casting algorithm."""
@@ -13,35 +26,42 @@ class FieldOfView:
 
     def compute(self, x: int, y: int, radius: int) -> Set[Tuple[int, int]]:
         """Compute visible tiles from position with given radius."""
-        visible = {(x, y)}
         self.game_map.mark_explored(x, y)
 
         # Cast light in all 8 octants
+        lit: Set[Tuple[int, int]] = set()
         for octant in range(8):
-            visible |= self._cast_light(x, y, radius, 1, 1.0, 0.0, octant)
+            lit |= self._cast_light(x, y, radius, 1, 1.0, 0.0, octant)
 
-        return visible
+        # Lit tiles are always inside the map, so they are marked in one go
+        self.game_map.explored_tiles |= lit
+        lit.add((x, y))
+        return lit
 
     def _cast_light(self, cx: int, cy: int, radius: int, row: int,
                     start: float, end: float, octant: int) -> Set[Tuple[int, int]]:
-        """Recursively cast light in an octant."""
+        """Cast light in an octant; returns the lit tiles inside the map."""
         visible = set()
 
         if start < end:
             return visible
 
         radius_sq = radius * radius
+        xx, xy, yx, yy = _OCTANT_TRANSFORMS[octant]
+        width = self.game_map.width
+        height = self.game_map.height
+        opaque = self.game_map.opaque_mask
 
         for j in range(row, radius + 1):
             dx = -j - 1
             dy = -j
             blocked = False
-            tan_angle_start = start
 
             while dx <= 0:
                 dx += 1
-                X, Y = self._transform(dx, dy, octant, cx, cy)
-                if X < 0 or X >= self.game_map.width or Y < 0 or Y >= self.game_map.height:
+                X = cx + dx * xx + dy * xy
+                Y = cy + dx * yx + dy * yy
+                if X < 0 or X >= width or Y < 0 or Y >= height:
                     break
 
                 l_slope = (dx - 0.5) / (dy + 0.5)
@@ -52,19 +72,16 @@ class FieldOfView:
                 if end > l_slope:
                     break
 
-                dist_sq = dx * dx + dy * dy
-                if dist_sq <= radius_sq:
+                if dx * dx + dy * dy <= radius_sq:
                     visible.add((X, Y))
-                    self.game_map.mark_explored(X, Y)
 
                 if blocked:
                     if l_slope < end:
                         break
                     continue
 
-                if self.game_map.is_opaque(X, Y):
+                if opaque[Y][X]:
                     blocked = True
-                    tan_angle_start = l_slope
 
             if blocked:
                 break
@@ -73,18 +90,8 @@ class FieldOfView:
 
     def _transform(self, dx: int, dy: int, octant: int, cx: int, cy: int) -> Tuple[int, int]:
         """Transform coordinates based on octant."""
-        # Octant mapping
-        transformations = [
-            (lambda dx, dy: (cx + dx, cy - dy)),  # N
-            (lambda dx, dy: (cx + dy, cy + dx)),  # E
-            (lambda dx, dy: (cx - dx, cy + dy)),  # S
-            (lambda dx, dy: (cx - dy, cy - dx)),  # W
-            (lambda dx, dy: (cx - dx, cy - dy)),  # NW
-            (lambda dx, dy: (cx - dy, cy + dx)),  # SW
-            (lambda dx, dy: (cx + dx, cy + dy)),  # SE
-            (lambda dx, dy: (cx + dy, cy - dx)),  # NE
-        ]
-        return transformations[octant](dx, dy)
+        xx, xy, yx, yy = _OCTANT_TRANSFORMS[octant]
+        return cx + dx * xx + dy * xy, cy + dx * yx + dy * yy
 
     def update_fov(self, x: int, y: int, radius: int) -> Set[Tuple[int, int]]:
         """Compute FOV and return newly visible tiles."""
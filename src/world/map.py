@@ -16,10 +16,11 @@ class Room:
     y: int
     width: int
     height: int
+    # Rooms are not resized once placed, so the center is computed once
+    center: Tuple[int, int] = field(init=False, repr=False, compare=False)
 
-    @property
-    def center(self) -> Tuple[int, int]:
-        return (self.x + self.width // 2, self.y + self.height // 2)
+    def __post_init__(self) -> None:
+        self.center = (self.x + self.width // 2, self.y + self.height // 2)
 
     @property
     def bounds(self) -> Tuple[int, int, int, int]:
@@ -47,10 +48,15 @@ class GameMap:
     rooms: List[Room] = field(default_factory=list)
     explored_tiles: Set[Tuple[int, int]] = field(default_factory=set)
     seed: Optional[int] = None
+    # Per-tile walkable/opaque flags indexed [y][x], kept in step by set_tile
+    walkable_mask: List[List[bool]] = field(init=False, repr=False, compare=False)
+    opaque_mask: List[List[bool]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.tiles:
             self.tiles = [[Tile.floor() for _ in range(self.width)] for _ in range(self.height)]
+        self.walkable_mask = [[tile.walkable for tile in row] for row in self.tiles]
+        self.opaque_mask = [[tile.opaque for tile in row] for row in self.tiles]
 
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """Get tile at position, returns None if out of bounds."""
@@ -59,14 +65,19 @@ class GameMap:
         return None
 
     def set_tile(self, x: int, y: int, tile: Tile) -> None:
-        """Set tile at position."""
+        """Set tile at position.
+
+        Change tiles through here rather than through tiles directly, so
+        walkable_mask and opaque_mask stay in step.
+        """
         if 0 <= x < self.width and 0 <= y < self.height:
             self.tiles[y][x] = tile
+            self.walkable_mask[y][x] = tile.walkable
+            self.opaque_mask[y][x] = tile.opaque
 
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if position is walkable."""
-        tile = self.get_tile(x, y)
-        return tile is not None and tile.walkable
+        return 0 <= x < self.width and 0 <= y < self.height and self.walkable_mask[y][x]
 
     def is_transparent(self, x: int, y: int) -> bool:
         """Check if position is transparent (blocks sight)."""
@@ -80,8 +91,7 @@ class GameMap:
 
     def is_opaque(self, x: int, y: int) -> bool:
         """Check if position is opaque (blocks FOV)."""
-        tile = self.get_tile(x, y)
-        return tile is None or tile.opaque
+        return not (0 <= x < self.width and 0 <= y < self.height) or self.opaque_mask[y][x]
 
     def mark_explored(self, x: int, y: int) -> None:
         """Mark tile as explored."""
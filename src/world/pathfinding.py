@@ -1,27 +1,10 @@
 # src/world/pathfinding.py
 """A* pathfinding algorithm and utilities."""
 
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
-
-
-@dataclass(frozen=True)
-class Node:
-    """A node for A* pathfinding."""
-
-    position: Tuple[int, int]
-    g_cost: float  # Cost from start
-    h_cost: float  # Heuristic cost to goal
-    parent: Optional["Node"] = None
-
-    @property
-    def f_cost(self) -> float:
-        """Total cost (g + h)."""
-        return self.g_cost + self.h_cost
-
-    def __lt__(self, other: "Node") -> bool:
-        """Compare nodes by f_cost for priority queue."""
-        return self.f_cost < other.f_cost
+import heapq
+import math
+from itertools import count
+from typing import Callable, List, Tuple
 
 
 def manhattan_distance(a: Tuple[int, int], b: Tuple[int, int]) -> int:
@@ -57,17 +40,21 @@ def a_star_path(
     start: Tuple[int, int],
     goal: Tuple[int, int],
     passable: Callable[[int, int], bool],
+    heuristic: Callable[[Tuple[int, int], Tuple[int, int]], float] = manhattan_distance,
 ) -> List[Tuple[int, int]]:
     """Find a path using A* algorithm.
 
     Implements A* pathfinding with 8-directional movement (including diagonals).
-    Uses Manhattan distance as the heuristic.
+    Uses Manhattan distance as the heuristic unless another one is given.
 
     Args:
         start: Starting position (x, y)
         goal: Goal position (x, y)
         passable: Callable that takes (x, y) and returns True if passable.
                   Should return False for out-of-bounds positions.
+        heuristic: Estimated cost between two positions. Manhattan distance
+                   can overestimate diagonal moves; chebyshev_distance never
+                   does, so it always finds a shortest path.
 
     Returns:
         List of positions forming the path from start to goal.
@@ -110,76 +97,67 @@ def a_star_path(
     diagonal_cost = 1.5
     orthogonal_cost = 1
 
-    # Priority queue: list of (f_cost, counter, node) to break ties
-    # Using a simple list with manual priority queue implementation
-    open_set: List[Node] = []
+    # Binary heap of (f_cost, g_cost, counter, x, y, parent_index); the
+    # counter breaks ties first-in first-out, so positions are never compared
+    open_set: List[Tuple[float, float, int, int, int, int]] = []
+    counter = count()
+    heapq.heappush(open_set, (heuristic(start, goal), 0, next(counter), start[0], start[1], -1))
 
-    # Create start node
-    start_node = Node(
-        position=start,
-        g_cost=0,
-        h_cost=manhattan_distance(start, goal),
-    )
-    open_set.append(start_node)
+    # Expanded positions as (x, y, parent_index); parent_index points back
+    # into this list, and -1 marks the start
+    expanded: List[Tuple[int, int, int]] = []
 
-    # Track visited positions with their best g_cost
+    # Track visited positions with their best g_cost; unvisited reads as inf
     closed_set: dict[Tuple[int, int], float] = {}
+    best_g = closed_set.get
+    inf = math.inf
 
     while open_set:
         # Get node with lowest f_cost
-        open_set.sort(key=lambda n: (n.f_cost, n.g_cost))
-        current = open_set.pop(0)
+        _, g_cost, _, x, y, parent_index = heapq.heappop(open_set)
 
         # Check if we reached the goal
-        if current.position == goal:
-            # Reconstruct path
-            path = []
-            node: Optional[Node] = current
-            while node is not None:
-                path.append(node.position)
-                node = node.parent
+        if (x, y) == goal:
+            # Reconstruct path, leaving out the start (caller will be at start)
+            path = [goal]
+            while parent_index >= 0:
+                x, y, parent_index = expanded[parent_index]
+                path.append((x, y))
+            path.pop()
             path.reverse()
-            # Remove start position from path (caller will be at start)
-            return path[1:] if len(path) > 1 else []
+            return path
 
         # Skip if we've already found a better path to this position
-        pos = current.position
-        if pos in closed_set and closed_set[pos] <= current.g_cost:
+        pos = (x, y)
+        if best_g(pos, inf) <= g_cost:
             continue
-        closed_set[pos] = current.g_cost
+        closed_set[pos] = g_cost
+        index = len(expanded)
+        expanded.append((x, y, parent_index))
 
         # Explore neighbors
         for dx, dy in directions:
-            nx, ny = pos[0] + dx, pos[1] + dy
-
-            # Skip non-passable tiles (handle out of bounds gracefully)
-            try:
-                if not passable(nx, ny):
-                    continue
-            except (IndexError, ValueError):
-                continue
+            nx, ny = x + dx, y + dy
 
             # Calculate movement cost (diagonal vs orthogonal)
             is_diagonal = dx != 0 and dy != 0
             move_cost = diagonal_cost if is_diagonal else orthogonal_cost
+            new_g_cost = g_cost + move_cost
 
-            # Calculate new costs
-            new_g_cost = current.g_cost + move_cost
-            new_h_cost = manhattan_distance((nx, ny), goal)
-
-            # Skip if we've already found a better path to neighbor
-            if (nx, ny) in closed_set and closed_set[(nx, ny)] <= new_g_cost:
+            # Skip if we've already found a better path to neighbor; checked
+            # before passable, which is usually the costlier call
+            if best_g((nx, ny), inf) <= new_g_cost:
                 continue
 
-            # Create neighbor node
-            neighbor = Node(
-                position=(nx, ny),
-                g_cost=new_g_cost,
-                h_cost=new_h_cost,
-                parent=current,
-            )
+            # Skip non-passable tiles (handle out of bounds gracefully)
+            try:
+                if not passable(nx, ny):
+                    continue
+            except (IndexError, ValueError):
+                continue
 
-            open_set.append(neighbor)
+            new_f_cost = new_g_cost + heuristic((nx, ny), goal)
+            heapq.heappush(open_set, (new_f_cost, new_g_cost, next(counter), nx, ny, index))
 
     # No path found
     return []
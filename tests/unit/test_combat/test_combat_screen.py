@@ -85,7 +85,7 @@ class TestCombatScreenActions:
         for msg in messages:
             combat_screen._add_combat_message(msg)
         assert len(combat_screen.combat_log) == 3
-        assert combat_screen.combat_log == messages
+        assert list(combat_screen.combat_log) == messages
 
     def test_combat_log_limit(self, combat_screen):
         """Test that combat log displays last 5 messages."""
@@ -93,6 +93,33 @@ class TestCombatScreenActions:
             combat_screen._add_combat_message(f"Message {i}")
         assert len(combat_screen.combat_log) == 10
 
+    def test_combat_log_is_bounded(self, combat_screen):
+        """Test that old combat log entries are dropped past the cap."""
+        from src.tui.screens.combat_screen import COMBAT_LOG_MAX_ENTRIES
+
+        for i in range(COMBAT_LOG_MAX_ENTRIES + 10):
+            combat_screen._add_combat_message(f"Message {i}")
+        assert len(combat_screen.combat_log) == COMBAT_LOG_MAX_ENTRIES
+        assert combat_screen.combat_log[0] == "Message 10"
+
+    def test_status_text_contents(self, combat_screen):
+        """Test that the status block shows both combatants' HP."""
+        status = combat_screen._build_status_text("Hero", "8", "12")
+        assert "Hero\nHP: 8/12" in status.plain
+        assert "Goblin\nHP: 10/10  AC: 10" in status.plain
+
+    def test_messages_coalesce_into_single_redraw(self, combat_screen):
+        """Test that several messages only trigger one redraw on flush."""
+        with patch.object(combat_screen, "_update_display") as update:
+            for i in range(4):
+                combat_screen._add_combat_message(f"Message {i}")
+            update.assert_not_called()
+
+            combat_screen._flush_display()
+            combat_screen._flush_display()
+
+        update.assert_called_once()
+
 
 class TestCombatScreenEnemyDefeat:
     """Tests for enemy defeat scenarios."""
@@ -192,6 +219,19 @@ class TestCombatScreenTransitions:
         assert mock_game_state.current_enemy is None
         combat_screen.app.pop_screen.assert_called_once()
 
+    def test_game_state_cached_until_refresh(self, combat_screen):
+        """Test that the app game state is cached and re-read on refresh."""
+        first_state = Mock()
+        combat_screen.app.narrative_game_state = first_state
+        assert combat_screen._get_game_state() is first_state
+
+        second_state = Mock()
+        combat_screen.app.narrative_game_state = second_state
+        assert combat_screen._get_game_state() is first_state
+
+        combat_screen._refresh_app_refs()
+        assert combat_screen._get_game_state() is second_state
+
     @pytest.mark.asyncio
     async def test_defeat_transition(self, combat_screen):
         """Test that defeat transitions to defeat scene."""
@@ -282,3 +322,30 @@ class TestCombatScreenPlayerState:
         char = combat_screen.app.narrative_game_state.character
 
         assert char.strength_mod == 2
+
+
+class TestResolveWeapon:
+    """Tests for resolving the attack modifier and damage dice."""
+
+    def test_weapon_stat_selects_modifier(self):
+        """Test that the weapon's ability picks the matching modifier."""
+        from src.tui.screens.combat_screen import _resolve_weapon
+
+        char = Mock()
+        char.dexterity_mod = 3
+        char.equipment = {"weapon_stat": "dexterity", "weapon_damage": "1d6"}
+
+        get_mod, damage_dice = _resolve_weapon(char)
+        assert get_mod(char) == 3
+        assert damage_dice == "1d6"
+
+    def test_unknown_stat_has_no_modifier(self):
+        """Test that an unrecognised weapon ability adds no modifier."""
+        from src.tui.screens.combat_screen import _resolve_weapon
+
+        char = Mock()
+        char.equipment = {"weapon_stat": "luck"}
+
+        get_mod, damage_dice = _resolve_weapon(char)
+        assert get_mod(char) == 0
+        assert damage_dice == "1d8"
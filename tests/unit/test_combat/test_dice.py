@@ -91,3 +91,18 @@ class TestDiceRollerEdgeCases:
         result = DiceRoller().roll("1d20+100")
         assert len(result) == 1
         assert 101 <= result[0] + 100 <= 120
+
+    def test_invalid_notation_still_raises_after_cached_parse(self):
+        """Invalid notation should raise every time, not just on first parse."""
+        import pytest
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                DiceRoller().roll_sum("2d7")
+
+    def test_roll_dice_uses_parsed_modifier(self):
+        """roll_dice should apply the modifier from cached notation."""
+        from src.combat.dice import roll_dice
+
+        results = [roll_dice("1d4+10") for _ in range(50)]
+        assert all(11 <= r <= 14 for r in results)
@@ -1,5 +1,7 @@
 """Tests for narrative data models."""
 
+import sys
+
 import pytest
 from dataclasses import asdict
 from src.narrative.models import (
@@ -94,6 +96,15 @@ class TestChoiceModel:
         assert choice.skill_check.ability == "dex"
         assert choice.skill_check.dc == 15
 
+    def test_choice_flag_names_interned(self):
+        flag = "".join(["has_", "key"])
+        choice = Choice(
+            id="test", text="Test", shortcut="A", next_scene="next", required_flags={flag: True}
+        )
+        key = next(iter(choice.required_flags))
+        assert key == "has_key"
+        assert key is sys.intern("has_key")
+
 
 class TestConsequenceModel:
     """Test Consequence data model."""
@@ -194,6 +194,18 @@ class TestSaveDataBuilder:
         assert "narrative_state" in save_data
         assert save_data["narrative_state"]["current_scene"] == "boss_fight"
 
+    def test_build_full_save_header_first(self, game_state):
+        """Test that the listing header is the first key of the save."""
+        metadata = {"saved_at": "2024-01-01 00:00:00", "saved_at_epoch": 1704067200}
+        save_data = SaveDataBuilder.build_full_save(game_state, metadata)
+
+        assert next(iter(save_data)) == "header"
+        assert save_data["header"]["game_type"] == "narrative"
+        assert save_data["header"]["saved_at"] == "2024-01-01 00:00:00"
+        assert save_data["header"]["saved_at_epoch"] == 1704067200
+        assert save_data["header"]["current_scene"] == "boss_fight"
+        assert save_data["header"]["character_name"] == game_state.character.name
+
     def test_extract_narrative_state(self, game_state):
         """Test extracting narrative state from save."""
         save_data = SaveDataBuilder.build_full_save(game_state)
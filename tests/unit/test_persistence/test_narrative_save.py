@@ -0,0 +1,77 @@
+"""Tests for the narrative save file format."""
+
+import zlib
+
+from src.persistence.narrative_save import (
+    MAGIC,
+    encode_save,
+    read_save_file,
+    read_save_header,
+)
+from src.utils import fastjson
+
+
+def _save_data():
+    return {
+        "header": {
+            "game_type": "narrative",
+            "saved_at": "2024-01-01 00:00:00",
+            "current_scene": "intro",
+            "character_name": "Aria",
+        },
+        "version": 2,
+        "game_type": "narrative",
+        "narrative_state": {"scene_history": ["intro"] * 100},
+    }
+
+
+class TestNarrativeSaveFormat:
+    """Tests for encoding and reading narrative saves."""
+
+    def test_round_trip(self, tmp_path):
+        """A written save should read back in full."""
+        path = tmp_path / "a.sav"
+        data = _save_data()
+        path.write_bytes(encode_save(data))
+
+        assert read_save_file(path) == data
+
+    def test_header_is_plain(self, tmp_path):
+        """The header should be readable without decompressing anything."""
+        path = tmp_path / "a.sav"
+        data = _save_data()
+        encoded = encode_save(data)
+        path.write_bytes(encoded)
+
+        assert encoded.startswith(MAGIC)
+        assert b'"character_name":"Aria"' in encoded
+        assert read_save_header(path) == data["header"]
+
+    def test_header_read_skips_decompression(self, tmp_path, monkeypatch):
+        """Reading the header should never touch the compressed payload."""
+        path = tmp_path / "a.sav"
+        path.write_bytes(encode_save(_save_data()))
+
+        def fail(prefix):
+            raise AssertionError("payload should not be decompressed")
+
+        monkeypatch.setattr("src.utils.compression.decompressobj", fail)
+        assert read_save_header(path)["current_scene"] == "intro"
+
+    def test_legacy_compressed_save(self, tmp_path):
+        """Bare compressed saves with a leading header should still read."""
+        path = tmp_path / "a.sav"
+        data = _save_data()
+        path.write_bytes(zlib.compress(fastjson.dumps(data)))
+
+        assert read_save_header(path) == data["header"]
+        assert read_save_file(path) == data
+
+    def test_legacy_save_without_header(self, tmp_path):
+        """Old saves without any header should report no header."""
+        path = tmp_path / "a.sav"
+        data = {"version": 2, "game_type": "narrative"}
+        path.write_bytes(zlib.compress(fastjson.dumps(data)))
+
+        assert read_save_header(path) is None
+        assert read_save_file(path) == data
@@ -0,0 +1,232 @@
+"""Tests for save listing on the load game screen."""
+
+import json
+import zlib
+from unittest.mock import Mock
+
+from src.utils import fastjson
+from src.tui.screens.load_game_screen import (
+    INDEX_FILENAME,
+    LoadGameScreen,
+    SaveFileInfo,
+    read_save_header,
+    scan_saves,
+)
+
+
+def _write_save(path, game_type="narrative", name="Hero", scene="intro"):
+    data = {
+        "game_type": game_type,
+        "metadata": {"saved_at": "2024-01-01T00:00:00"},
+        "narrative_state": {"current_scene": scene, "character": {"name": name}},
+    }
+    path.write_bytes(zlib.compress(json.dumps(data).encode("utf-8")))
+    return data
+
+
+def _write_header_save(path, name="Hero", padding=0):
+    data = {
+        "header": {
+            "game_type": "narrative",
+            "saved_at": "2024-01-01 00:00:00",
+            "current_scene": "intro",
+            "character_name": name,
+        },
+        "game_type": "narrative",
+        "narrative_state": {"history": ["x" * 64] * padding},
+    }
+    path.write_bytes(zlib.compress(fastjson.dumps(data)))
+    return data
+
+
+class TestReadSaveHeader:
+    """Tests for decoding only the save header."""
+
+    def test_reads_header(self, tmp_path):
+        """The leading header block should be decoded."""
+        path = tmp_path / "a.sav"
+        data = _write_header_save(path, name="Aria", padding=5000)
+        assert read_save_header(path) == data["header"]
+
+    def test_legacy_save_has_no_header(self, tmp_path):
+        """Saves without a leading header should return None."""
+        path = tmp_path / "a.sav"
+        _write_save(path)
+        assert read_save_header(path) is None
+
+
+class TestScanSaves:
+    """Tests for scanning the save directory."""
+
+    def test_missing_directory_returns_empty(self, tmp_path):
+        """A missing save directory should list no saves."""
+        assert scan_saves(tmp_path / "missing") == []
+
+    def test_lists_only_narrative_saves(self, tmp_path):
+        """Non-narrative saves should be skipped."""
+        _write_save(tmp_path / "a.sav", name="Aria")
+        _write_save(tmp_path / "b.sav", game_type="roguelike")
+
+        saves = scan_saves(tmp_path)
+
+        assert [s.character_name for s in saves] == ["Aria"]
+        assert saves[0].scene == "intro"
+
+    def test_newest_first(self, tmp_path):
+        """Saves read in parallel should still be listed newest first."""
+        import os
+
+        for i, name in enumerate(["Old", "Middle", "New"]):
+            path = tmp_path / f"{name}.sav"
+            _write_header_save(path, name=name)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        assert [s.character_name for s in scan_saves(tmp_path)] == ["New", "Middle", "Old"]
+
+    def test_second_scan_uses_index(self, tmp_path, monkeypatch):
+        """Unchanged saves should be listed from the index without decoding."""
+        data = _write_save(tmp_path / "a.sav", name="Aria")
+        scan_saves(tmp_path)
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+        def fail(path):
+            raise AssertionError("save file should not be read")
+
+        monkeypatch.setattr("src.tui.screens.load_game_screen.read_save_file", fail)
+        saves = scan_saves(tmp_path)
+
+        assert saves[0].character_name == "Aria"
+        monkeypatch.undo()
+        assert saves[0].data == data
+
+    def test_modified_save_is_reparsed(self, tmp_path):
+        """A save whose size changed should be re-read."""
+        save_path = tmp_path / "a.sav"
+        _write_save(save_path, name="Aria")
+        scan_saves(tmp_path)
+
+        _write_save(save_path, name="Bartholomew the Brave", scene="cavern")
+        saves = scan_saves(tmp_path)
+
+        assert saves[0].character_name == "Bartholomew the Brave"
+        assert saves[0].scene == "cavern"
+
+    def test_header_save_listed_without_full_read(self, tmp_path, monkeypatch):
+        """Saves with a header should be listed without decoding the payload."""
+        data = _write_header_save(tmp_path / "a.sav", name="Aria")
+
+        def fail(path):
+            raise AssertionError("save file should not be read")
+
+        monkeypatch.setattr("src.tui.screens.load_game_screen.read_save_file", fail)
+        saves = scan_saves(tmp_path)
+
+        assert saves[0].character_name == "Aria"
+        assert saves[0].timestamp == "2024-01-01 00:00:00"
+        monkeypatch.undo()
+        assert saves[0].data == data
+
+    def test_corrupt_index_is_ignored(self, tmp_path):
+        """A corrupt index should fall back to reading the saves."""
+        _write_save(tmp_path / "a.sav", name="Aria")
+        (tmp_path / INDEX_FILENAME).write_text("not json")
+
+        assert scan_saves(tmp_path)[0].character_name == "Aria"
+
+
+class TestSaveFileInfo:
+    """Tests for save file metadata."""
+
+    def test_fields_from_data(self, tmp_path):
+        """Listing fields should be read from the save payload."""
+        path = tmp_path / "a.sav"
+        data = _write_save(path, name="Aria", scene="tavern")
+        info = SaveFileInfo(path, data)
+
+        assert info.character_name == "Aria"
+        assert info.scene == "tavern"
+        assert info.timestamp == "2024-01-01T00:00:00"
+        assert info.data is data
+
+    def test_fields_from_header(self, tmp_path):
+        """Saves with a header block should be listed from the header."""
+        path = tmp_path / "a.sav"
+        data = _write_header_save(path, name="Aria")
+        info = SaveFileInfo(path, data)
+
+        assert info.character_name == "Aria"
+        assert info.scene == "intro"
+        assert info.timestamp == "2024-01-01 00:00:00"
+
+    def test_display_time_from_epoch(self, tmp_path):
+        """The save time should be formatted from the epoch when present."""
+        import time
+
+        info = SaveFileInfo(tmp_path / "a.sav", timestamp="stale", saved_at_epoch=0)
+        assert info.display_time() == time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(0))
+
+        legacy = SaveFileInfo(tmp_path / "b.sav", timestamp="2024-01-01 00:00:00")
+        assert legacy.display_time() == "2024-01-01 00:00:00"
+
+    def test_full_payload_read_once(self, tmp_path, monkeypatch):
+        """load_full should read the file once and reuse the result."""
+        path = tmp_path / "a.sav"
+        data = _write_save(path)
+        info = SaveFileInfo(path)
+        calls = []
+
+        def read(p):
+            calls.append(p)
+            return data
+
+        monkeypatch.setattr("src.tui.screens.load_game_screen.read_save_file", read)
+        assert info.load_full() is data
+        assert info.load_full() is data
+        assert calls == [path]
+
+
+class TestSaveListRendering:
+    """Tests for rendering the save list."""
+
+    def _screen(self, tmp_path, count=3):
+        screen = LoadGameScreen()
+        screen._list_widget = Mock()
+        screen._details_widget = Mock()
+        screen.saves = [
+            SaveFileInfo(tmp_path / f"save{i}.sav", timestamp="today", scene=f"scene{i}")
+            for i in range(count)
+        ]
+        return screen
+
+    def test_selected_row_is_expanded(self, tmp_path):
+        """Only the selected save should show its details."""
+        screen = self._screen(tmp_path)
+        screen._update_display()
+
+        text = screen._list_widget.update.call_args[0][0]
+        assert text.splitlines() == [
+            "> save0.sav",
+            "   Scene: scene0",
+            "   Saved: today",
+            "  save1.sav",
+            "  save2.sav",
+        ]
+
+    def test_moving_selection_updates_two_rows(self, tmp_path):
+        """Moving the selection should collapse the old row and expand the new."""
+        screen = self._screen(tmp_path)
+        screen._update_display()
+        screen.selected_index = 2
+        screen._update_display()
+
+        text = screen._list_widget.update.call_args[0][0]
+        assert text.splitlines()[0] == "  save0.sav"
+        assert text.splitlines()[2:] == ["> save2.sav", "   Scene: scene2", "   Saved: today"]
+
+    def test_unchanged_selection_skips_update(self, tmp_path):
+        """Pressing up on the first row should not redraw the list."""
+        screen = self._screen(tmp_path)
+        screen._update_display()
+        screen._update_display()
+
+        screen._list_widget.update.assert_called_once()
@@ -0,0 +1,518 @@
+"""Unit tests for the narrative game screen."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
+
+import pytest
+
+from textual.widgets import Button
+
+from src.entities.character import Character
+from src.narrative.models import Choice, GameState
+from src.tui.screens.narrative_game_screen import NarrativeGameScreen, _choice_button_spec
+
+
+def _choice(required_flags=None, choice_id="open_door", shortcut="A"):
+    return Choice(
+        id=choice_id,
+        text="Open the door",
+        shortcut=shortcut,
+        next_scene="hall",
+        required_flags=required_flags or {},
+    )
+
+
+class TestChoiceAvailability:
+    """Tests for flag-gated choice availability."""
+
+    @pytest.fixture
+    def screen(self):
+        screen = NarrativeGameScreen()
+        screen.game_state = GameState(character=None, current_scene="start")
+        return screen
+
+    def test_no_requirements_available(self, screen):
+        """Choices without required flags should always be available."""
+        assert screen._is_choice_available(_choice())
+
+    def test_required_flag_set(self, screen):
+        """A choice requiring a set flag should follow that flag."""
+        choice = _choice({"has_key": True})
+        assert not screen._is_choice_available(choice)
+
+        screen.game_state.flags["has_key"] = True
+        assert screen._is_choice_available(choice)
+
+    def test_missing_flag_counts_as_false(self, screen):
+        """A choice requiring a False flag should be available when it is unset."""
+        choice = _choice({"alarm_raised": False})
+        assert screen._is_choice_available(choice)
+
+        screen.game_state.flags["alarm_raised"] = True
+        assert not screen._is_choice_available(choice)
+
+    def test_mixed_requirements(self, screen):
+        """All required flags must match for the choice to be available."""
+        choice = _choice({"has_key": True, "alarm_raised": False})
+        screen.game_state.flags.update({"has_key": True, "alarm_raised": False})
+        assert screen._is_choice_available(choice)
+
+        screen.game_state.flags["has_key"] = False
+        assert not screen._is_choice_available(choice)
+
+    def test_non_bool_requirements_use_equality(self, screen):
+        """Non-bool requirements should match flag values by equality."""
+        assert screen._is_choice_available(_choice({"guards": 0}))
+        assert not screen._is_choice_available(_choice({"oath": None}))
+
+        screen.game_state.flags.update({"guards": 2, "oath": None})
+        assert not screen._is_choice_available(_choice({"guards": 0}))
+        assert screen._is_choice_available(_choice({"guards": 2}))
+        assert screen._is_choice_available(_choice({"oath": None}))
+        assert not screen._is_choice_available(_choice({"oath": False}))
+
+
+class TestChoiceVisibility:
+    """Tests for toggling choice buttons without rebuilding them."""
+
+    def test_visibility_follows_flags(self):
+        """Buttons should be shown or hidden as their flags change."""
+        screen = NarrativeGameScreen()
+        screen.game_state = GameState(character=None, current_scene="start")
+        choice = _choice({"has_key": True})
+        button = Button("Open the door")
+        button.display = False
+        screen._effective_choices = [choice]
+        screen._choice_buttons = {choice.id: button}
+
+        screen.game_state.flags["has_key"] = True
+        screen._update_choice_visibility()
+        assert button.display is True
+        assert screen._choice_buttons[choice.id] is button
+
+        screen.game_state.flags["has_key"] = False
+        screen._update_choice_visibility()
+        assert button.display is False
+
+
+class TestSkillModifier:
+    """Tests for looking up skill check modifiers."""
+
+    def test_modifier_from_character(self):
+        """The ability code should select the matching modifier."""
+        screen = NarrativeGameScreen()
+        character = Character(name="Hero", dexterity=16, wisdom=8)
+        screen.game_state = GameState(character=character, current_scene="start")
+
+        assert screen._get_skill_modifier("dex") == 3
+        assert screen._get_skill_modifier("wis") == -1
+
+    def test_no_character_has_no_modifier(self):
+        """Without a character the modifier should be zero."""
+        screen = NarrativeGameScreen()
+        screen.game_state = GameState(character=None, current_scene="start")
+
+        assert screen._get_skill_modifier("str") == 0
+
+    @pytest.mark.asyncio
+    async def test_rolling_frames_cycle_question_marks(self):
+        """The rolling animation should show one, two, three, then one '?'."""
+        screen = NarrativeGameScreen()
+        screen._dice_widget = Mock()
+        screen._transition_to_scene = AsyncMock()
+        skill_check = Mock(dc=12, success_next_scene="win", failure_next_scene="lose")
+
+        with patch("src.tui.screens.narrative_game_screen.asyncio.sleep", new=AsyncMock()):
+            await screen._animate_and_reveal_skill_check(Mock(), skill_check, 2, "Dexterity")
+
+        frames = [call.args[0] for call in screen._dice_widget.update.call_args_list[1:5]]
+        assert "DEXTERITY CHECK" in frames[0]
+        assert "DC 12 · Dexterity (+2)" in frames[0]
+        assert [frame.count("?") for frame in frames] == [1, 2, 3, 1]
+        assert all(frame.endswith("╯") for frame in frames)
+        assert "│         Rolling... ??               │" in frames[1]
+
+    @pytest.mark.asyncio
+    async def test_failed_animation_stops_without_transition(self):
+        """A dice widget that fails mid-animation should abort the reveal."""
+        screen = NarrativeGameScreen()
+        screen._dice_widget = Mock()
+        screen._dice_widget.update.side_effect = [None, RuntimeError("gone")]
+        screen._transition_to_scene = AsyncMock()
+        skill_check = Mock(dc=12, success_next_scene="win", failure_next_scene="lose")
+
+        with patch("src.tui.screens.narrative_game_screen.asyncio.sleep", new=AsyncMock()):
+            await screen._animate_and_reveal_skill_check(Mock(), skill_check, 0, "Wisdom")
+
+        assert screen._dice_widget.update.call_count == 2
+        screen._transition_to_scene.assert_not_awaited()
+
+
+class TestShortcutKeys:
+    """Tests for choosing options by shortcut key."""
+
+    @pytest.mark.asyncio
+    async def test_key_selects_first_available_choice(self):
+        """A shortcut should pick the first available choice bound to it."""
+        screen = NarrativeGameScreen()
+        screen.game_state = GameState(character=None, current_scene="start")
+        screen.current_scene = Mock()
+        locked = _choice({"has_key": True}, choice_id="unlock", shortcut="a")
+        fallback = _choice(choice_id="knock", shortcut="A")
+        screen._shortcut_index = {"A": (locked, fallback)}
+        screen._handle_choice = AsyncMock()
+
+        await screen.on_key(Mock(key="a"))
+
+        screen._handle_choice.assert_awaited_once_with(fallback)
+
+    @pytest.mark.asyncio
+    async def test_key_uses_availability_from_last_refresh(self):
+        """Shortcut keys should reuse availability computed at refresh."""
+        screen = NarrativeGameScreen()
+        screen.game_state = GameState(character=None, current_scene="start")
+        screen.current_scene = Mock()
+        choice = _choice({"has_key": True})
+        screen._effective_choices = [choice]
+        screen._shortcut_index = {"A": (choice,)}
+        screen.game_state.flags["has_key"] = True
+        screen._update_choice_visibility()
+        screen._handle_choice = AsyncMock()
+        screen._is_choice_available = Mock(side_effect=AssertionError("recomputed"))
+
+        await screen.on_key(Mock(key="a"))
+
+        screen._handle_choice.assert_awaited_once_with(choice)
+
+    @pytest.mark.asyncio
+    async def test_button_resolves_choice_by_id(self):
+        """A choice button should pass its Choice through to the handler."""
+        screen = NarrativeGameScreen()
+        screen.current_scene = Mock(id="tavern")
+        choice = _choice(choice_id="knock")
+        screen._button_choices = {"choice_tavern_knock": choice}
+        screen._handle_choice = AsyncMock()
+
+        await screen.on_button_pressed(Mock(button=Mock(id="choice_tavern_knock")))
+
+        screen._handle_choice.assert_awaited_once_with(choice)
+
+
+class TestSceneCache:
+    """Tests for caching scenes across transitions."""
+
+    @pytest.fixture
+    def screen(self):
+        scene_manager = Mock()
+        scene_manager.ai_client = None
+        app = Mock()
+        app.scene_manager = scene_manager
+        with patch.object(NarrativeGameScreen, "app", new_callable=PropertyMock) as p:
+            p.return_value = app
+            screen = NarrativeGameScreen()
+            screen.game_state = GameState(character=None, current_scene="start")
+            screen.set_scene = AsyncMock()
+            yield screen
+
+    @pytest.mark.asyncio
+    async def test_authored_scene_resolved_once(self, screen):
+        """Revisiting an authored scene should reuse the cached Scene."""
+        scene = Mock(flags_set={}, is_combat=False, is_ending=False)
+        scene_manager = screen.app.scene_manager
+        scene_manager.scenes = {"hub": scene}
+        scene_manager.ai_scene_cache = {}
+        scene_manager.get_scene.return_value = scene
+
+        await screen._transition_to_scene("hub")
+        await screen._transition_to_scene("hub")
+
+        scene_manager.get_scene.assert_called_once_with("hub")
+        assert screen.game_state.scene_history == ["hub", "hub"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_scene_not_cached(self, screen):
+        """Generic fallback scenes should be fetched again on the next visit."""
+        scene = Mock(flags_set={}, is_combat=False, is_ending=False)
+        scene_manager = screen.app.scene_manager
+        scene_manager.scenes = {}
+        scene_manager.ai_scene_cache = {}
+        scene_manager.get_scene.return_value = scene
+
+        await screen._transition_to_scene("unknown")
+        await screen._transition_to_scene("unknown")
+
+        assert scene_manager.get_scene.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_transition_refreshes_availability(self, screen):
+        """Flags set by a choice should gate shortcuts even if its scene fails."""
+        screen.app.scene_manager.get_scene.side_effect = KeyError("missing")
+        screen.notify = Mock()
+        screen.current_scene = Mock()
+        locked = _choice({"alarm_raised": False}, choice_id="sneak")
+        screen._effective_choices = [locked]
+        screen._shortcut_index = {"A": (locked,)}
+        screen._update_choice_visibility()
+        assert screen._availability["sneak"] is True
+
+        trip = Choice(
+            id="trip",
+            text="Trip the wire",
+            shortcut="B",
+            next_scene="missing",
+            set_flags={"alarm_raised": True},
+        )
+        await screen._handle_choice(trip)
+
+        assert screen._availability["sneak"] is False
+        screen._handle_choice = AsyncMock()
+        await screen.on_key(Mock(key="a"))
+        screen._handle_choice.assert_not_awaited()
+
+
+class TestRefreshBatching:
+    """Tests for coalescing display refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_batched_setters_refresh_once(self):
+        """Setting state and scene inside a batch should refresh once."""
+        screen = NarrativeGameScreen()
+        screen._update_display = AsyncMock()
+
+        async with screen._batch():
+            await screen.set_game_state(GameState(character=None, current_scene="start"))
+            await screen.set_scene(Mock())
+            screen._update_display.assert_not_awaited()
+
+        screen._update_display.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_setter_outside_batch_refreshes(self):
+        """A setter outside any batch should refresh immediately."""
+        screen = NarrativeGameScreen()
+        screen._update_display = AsyncMock()
+
+        await screen.set_scene(Mock())
+
+        screen._update_display.assert_awaited_once()
+
+    def test_unchanged_status_is_not_rewritten(self):
+        """The status panel should only be updated when its text changes."""
+        screen = NarrativeGameScreen()
+        screen.game_state = GameState(character=None, current_scene="start")
+        screen._status_widget = Mock()
+
+        screen._update_status()
+        screen._update_status()
+        screen.game_state.current_scene = "tavern"
+        screen._update_status()
+
+        assert screen._status_widget.update.call_count == 2
+
+
+class TestFormatDescription:
+    """Tests for styling scene descriptions."""
+
+    def test_dialogue_is_styled(self):
+        """Quoted dialogue should be wrapped in the dialogue style."""
+        screen = NarrativeGameScreen()
+        text = screen._format_description('The guard says "Halt!" and waits.')
+        assert text == 'The guard says [italic #87CEEB]"Halt!"[/italic #87CEEB] and waits.'
+
+
+class TestNpcContext:
+    """Tests for building the NPC AI context."""
+
+    def test_context_follows_flags(self):
+        """The context should mention notable flags and NPC memory."""
+        app = Mock()
+        app.npc_memory.get_npc_context.return_value = "I remember you."
+        with patch.object(NarrativeGameScreen, "app", new_callable=PropertyMock) as p:
+            p.return_value = app
+            screen = NarrativeGameScreen()
+            character = Character(name="Aria", race="elf", character_class="rogue")
+            screen.game_state = GameState(character=character, current_scene="start")
+            screen.current_scene = Mock(npc_name="Stranger")
+
+            first = screen._build_npc_context()
+            screen.game_state.flags["accepted_quest"] = True
+            second = screen._build_npc_context()
+
+        assert first == "Player is a elf rogue named Aria. I remember you."
+        assert second == first + " The player accepted my quest."
+        app.npc_memory.get_npc_context.assert_called_with("stranger")
+
+
+class TestChoiceRebuild:
+    """Tests for skipping choice rebuilds on unchanged scenes."""
+
+    @pytest.mark.asyncio
+    async def test_same_scene_keeps_buttons(self):
+        """Re-rendering the same scene should not rebuild its buttons."""
+        app = Mock(ai_service=None)
+        with patch.object(NarrativeGameScreen, "app", new_callable=PropertyMock) as p:
+            p.return_value = app
+            screen = NarrativeGameScreen()
+            screen.game_state = GameState(character=None, current_scene="start")
+            screen.current_scene = Mock(id="tavern", choices=[_choice()], ai_choices=False)
+            container = Mock(children=[])
+            screen._choices_container = container
+
+            await screen._update_choices()
+            buttons = dict(screen._choice_buttons)
+            await screen._update_choices()
+
+        container.mount_all.assert_called_once()
+        assert screen._choice_buttons == buttons
+
+    def test_button_spec_reused_across_visits(self):
+        """Revisiting a scene should reuse the formatted button id and label."""
+        first = _choice_button_spec("tavern", "knock", "a", "Knock on the door")
+        again = _choice_button_spec("tavern", "knock", "a", "Knock on the door")
+
+        assert first == ("choice_tavern_knock", "[yellow]A[/yellow] Knock on the door")
+        assert again is first
+
+
+class TestSceneDescription:
+    """Tests for AI-enhanced scene descriptions."""
+
+    @pytest.fixture
+    def screen(self):
+        app = Mock(ai_service=None)
+        app.scene_manager.ai_client = object()
+        app.scene_manager.render_scene = AsyncMock(return_value="A rich description.")
+        with patch.object(NarrativeGameScreen, "app", new_callable=PropertyMock) as p:
+            p.return_value = app
+            screen = NarrativeGameScreen()
+            screen.game_state = GameState(character=None, current_scene="tavern")
+            screen.current_scene = Mock(
+                id="tavern", title="Tavern", description="A plain room.", ai_dialogue=False
+            )
+            screen._title_widget = Mock()
+            screen._desc_widget = Mock()
+            screen._update_choices = AsyncMock()
+            screen.run_worker = Mock()
+            yield screen
+
+    @pytest.mark.asyncio
+    async def test_static_text_shown_while_fetching(self, screen):
+        """The static description should show until the AI text arrives."""
+        await screen._refresh_scene()
+
+        screen._desc_widget.update.assert_called_once_with("A plain room.")
+        fetch = screen.run_worker.call_args[0][0]
+        await fetch
+
+        screen._desc_widget.update.assert_called_with("A rich description.")
+
+    @pytest.mark.asyncio
+    async def test_cached_description_reused(self, screen):
+        """A revisit with the same flags should use the cached text."""
+        await screen._refresh_scene()
+        await screen.run_worker.call_args[0][0]
+        screen.run_worker.reset_mock()
+
+        await screen._refresh_scene()
+
+        screen.run_worker.assert_not_called()
+        screen._desc_widget.update.assert_called_with("A rich description.")
+        screen.app.scene_manager.render_scene.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unhashable_flag_value_still_cached(self, screen):
+        """A flag holding an unhashable value should not break the render."""
+        screen.game_state.flags["inventory_seen"] = ["torch", "rope"]
+
+        await screen._refresh_scene()
+        await screen.run_worker.call_args[0][0]
+        screen.run_worker.reset_mock()
+        await screen._refresh_scene()
+
+        screen.run_worker.assert_not_called()
+        screen._update_choices.assert_awaited()
+        screen._desc_widget.update.assert_called_with("A rich description.")
+
+
+class TestNpcDialogue:
+    """Tests for AI-enhanced NPC dialogue."""
+
+    @pytest.mark.asyncio
+    async def test_dialogue_cached_for_same_context(self):
+        """Revisiting an NPC with the same context should reuse the dialogue."""
+        app = Mock()
+        app.scene_manager = None
+        app.ai_service.is_enabled.return_value = True
+        app.ai_service.enhance_dialogue = AsyncMock(return_value="Welcome back.")
+        app.npc_memory.get_npc_context.return_value = ""
+        with patch.object(NarrativeGameScreen, "app", new_callable=PropertyMock) as p:
+            p.return_value = app
+            screen = NarrativeGameScreen()
+            character = Character(name="Aria", race="elf", character_class="rogue")
+            screen.game_state = GameState(character=character, current_scene="tavern")
+            screen.current_scene = Mock(
+                id="tavern",
+                title="Tavern",
+                description="A plain room.",
+                ai_dialogue=True,
+                npc_name="Barkeep",
+                npc_mood="cheerful",
+            )
+            screen._title_widget = Mock()
+            screen._desc_widget = Mock()
+            screen._update_choices = AsyncMock()
+
+            await screen._refresh_scene()
+            await screen._refresh_scene()
+
+        app.ai_service.enhance_dialogue.assert_awaited_once()
+        text = screen._desc_widget.update.call_args[0][0]
+        assert '[bold cyan]Barkeep:[/bold cyan] [italic #87CEEB]"Welcome back."' in text
+
+    @pytest.mark.asyncio
+    async def test_scene_change_cancels_pending_dialogue(self):
+        """Leaving a scene should cancel its dialogue request and drop the reply."""
+        app = Mock()
+        app.scene_manager = None
+        app.ai_service.is_enabled.return_value = True
+        app.npc_memory.get_npc_context.return_value = ""
+        started = asyncio.Event()
+        cancelled = []
+
+        async def slow_dialogue(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["npc_name"])
+                raise
+            return "Too late."
+
+        app.ai_service.enhance_dialogue = slow_dialogue
+        with patch.object(NarrativeGameScreen, "app", new_callable=PropertyMock) as p:
+            p.return_value = app
+            screen = NarrativeGameScreen()
+            screen.game_state = GameState(character=None, current_scene="tavern")
+            screen.current_scene = Mock(
+                id="tavern",
+                title="Tavern",
+                description="A plain room.",
+                ai_dialogue=True,
+                npc_name="Barkeep",
+                npc_mood=None,
+            )
+            screen._title_widget = Mock()
+            screen._desc_widget = Mock()
+            screen._update_choices = AsyncMock()
+
+            first = asyncio.create_task(screen._refresh_scene())
+            await started.wait()
+            screen.current_scene = Mock(
+                id="street", title="Street", description="Rain.", ai_dialogue=False
+            )
+            await screen._refresh_scene()
+            await first
+
+        assert cancelled == ["Barkeep"]
+        assert screen._desc_widget.update.call_args_list[-1].args[0] == "Rain."
+        screen._update_choices.assert_awaited_once()
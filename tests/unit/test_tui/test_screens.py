@@ -1,7 +1,7 @@
 """Unit tests for TUI screens."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 from textual.widgets import Static
 
 
@@ -79,6 +79,34 @@ class TestEndingScreen:
         assert ending_screen.ending_description == "Test description"
         assert ending_screen.stats == {"score": "100"}
 
+    def test_unchanged_panels_not_updated(self, ending_screen):
+        """Test that re-rendering identical content skips widget updates."""
+        from src.tui.screens.ending_screen import EndingScreen
+
+        ending_screen._title_widget = Mock()
+        ending_screen._desc_widget = Mock()
+        ending_screen._stats_widget = Mock()
+        ending_screen._buttons_widget = Mock()
+
+        with patch.object(EndingScreen, "app", new_callable=PropertyMock) as app:
+            app.return_value = MagicMock()
+            ending_screen.set_ending("Test Ending", "Test description", {"score": "100"})
+            ending_screen._update_display()
+
+        ending_screen._title_widget.update.assert_called_once()
+        ending_screen._desc_widget.update.assert_called_once()
+        ending_screen._stats_widget.update.assert_called_once()
+
+    def test_stats_text_memoized(self, ending_screen):
+        """Test that the stats block is reused until the stats change."""
+        ending_screen.set_ending("Test Ending", "Test description", {"score": "100"})
+        first = ending_screen._format_stats()
+        assert ending_screen._format_stats() is first
+        assert "score: 100" in first
+
+        ending_screen.set_ending("Test Ending", "Test description", {"score": "200"})
+        assert "score: 200" in ending_screen._format_stats()
+
     def test_markup_in_title_no_errors(self, ending_screen):
         """Test that title markup doesn't cause errors."""
         ending_screen.ending_title = "Test Ending"
@@ -110,6 +138,39 @@ class TestEndingScreen:
         assert stats["Enemies Defeated"] == "5"
 
 
+class TestInventoryScreen:
+    """Tests for the inventory screen."""
+
+    @staticmethod
+    def _item(name):
+        item = Mock()
+        item.name = name
+        return item
+
+    def test_only_changed_rows_are_rebuilt(self):
+        """Test that rows shared with the previous render are kept."""
+        from src.tui.screens import InventoryScreen
+
+        mock_app = Mock()
+        mock_app.game_engine.items = [self._item("Sword"), self._item("Shield")]
+        with patch.object(InventoryScreen, "app", new_callable=PropertyMock) as app:
+            app.return_value = mock_app
+            screen = InventoryScreen()
+            screen._list_view = Mock()
+
+            screen._update_display()
+            screen._list_view.remove_items.assert_not_called()
+            assert screen._list_view.extend.call_count == 1
+
+            mock_app.game_engine.items = [self._item("Sword"), self._item("Potion")]
+            screen._update_display()
+            screen._list_view.remove_items.assert_called_once_with(range(1, 2))
+            assert screen._list_view.extend.call_count == 2
+
+            screen._update_display()
+            assert screen._list_view.extend.call_count == 2
+
+
 class TestMarkupValidation:
     """Tests for markup validation across all screens."""
 
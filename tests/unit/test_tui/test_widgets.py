@@ -0,0 +1,188 @@
+"""Unit tests for TUI widgets."""
+
+import pytest
+from unittest.mock import patch
+
+from src.tui.widgets import CombatWidget, LogWidget, MapWidget
+from src.world.map import GameMap
+from src.world.tile_types import Tile, TileType
+
+
+class TestMapWidget:
+    """Tests for the map widget."""
+
+    @pytest.fixture
+    def map_widget(self):
+        """Create a map widget with refresh stubbed out."""
+        widget = MapWidget()
+        with patch.object(widget, "refresh") as refresh:
+            widget.refresh_mock = refresh
+            yield widget
+
+    def test_patch_enemies_moves_and_removes(self, map_widget):
+        """Test that enemy patches update positions in place."""
+        map_widget.set_enemies({"a": (1, 1), "b": (2, 2)})
+        positions = map_widget.enemy_positions
+
+        map_widget.patch_enemies({"a": (1, 2)}, {"b"})
+
+        assert map_widget.enemy_positions is positions
+        assert map_widget.enemy_positions == {"a": (1, 2)}
+
+    def test_empty_patch_skips_refresh(self, map_widget):
+        """Test that a patch with no changes does not refresh the widget."""
+        map_widget.set_items({"potion": (3, 3)})
+        map_widget.refresh_mock.reset_mock()
+        version = map_widget._version
+
+        map_widget.patch_items({}, set())
+
+        map_widget.refresh_mock.assert_not_called()
+        assert map_widget._version == version
+
+    def test_render_uses_tile_glyphs_and_fov(self, map_widget):
+        """Test that visible, explored and unseen tiles render differently."""
+        game_map = GameMap(width=3, height=2)
+        game_map.set_tile(1, 0, Tile.wall())
+        game_map.set_tile(2, 0, Tile(TileType.TRAP))
+        map_widget.set_map(game_map)
+        map_widget.set_visible_tiles({(0, 0), (1, 0), (2, 0)})
+        map_widget.set_explored_tiles({(0, 1), (2, 0)})
+        map_widget.set_player((0, 0))
+
+        assert map_widget.render() == "@#?\n.  "
+
+        map_widget.set_visible_tiles(set())
+        assert map_widget.render() == "@  \n.  "
+
+    def test_map_passed_to_constructor_renders(self):
+        """Test that a map given to the constructor renders without set_map."""
+        widget = MapWidget(map_data=GameMap(width=5, height=4))
+        assert widget.render() == "\n".join([" " * 5] * 4)
+
+    def test_visibility_set_before_map_is_kept(self, map_widget):
+        """Test that FOV set before the map, or out of bounds, is handled."""
+        map_widget.set_visible_tiles({(0, 0), (5, 5)})
+        map_widget.set_map(GameMap(width=2, height=1))
+
+        assert map_widget.render() == ". "
+
+    def test_overlay_priority_and_patches(self, map_widget):
+        """Test that the player beats enemies, which beat items, after patches."""
+        map_widget.set_map(GameMap(width=3, height=1))
+        map_widget.set_visible_tiles({(0, 0), (1, 0), (2, 0)})
+        map_widget.set_items({"potion": (1, 0), "gem": (2, 0)})
+        map_widget.set_enemies({"orc": (1, 0)})
+        map_widget.set_player((2, 0))
+
+        assert map_widget.render() == ".E@"
+
+        map_widget.patch_enemies({}, {"orc"})
+        assert map_widget.render() == ".*@"
+
+    def test_render_reused_until_state_changes(self, map_widget):
+        """Test that an unchanged map returns its cached render."""
+        map_widget.set_map(GameMap(width=2, height=1))
+        map_widget.set_visible_tiles({(0, 0), (1, 0)})
+
+        with patch.object(
+            map_widget, "_render_tiles", wraps=map_widget._render_tiles
+        ) as render_tiles:
+            first = map_widget.render()
+            assert map_widget.render() is first
+            assert render_tiles.call_count == 1
+
+            map_widget.set_player((1, 0))
+            assert map_widget.render() == ".@"
+            assert render_tiles.call_count == 2
+
+    def test_setters_share_one_refresh(self, map_widget):
+        """Test that back-to-back setters schedule a single redraw."""
+        with patch.object(map_widget, "call_later", return_value=True) as call_later:
+            map_widget.set_player((1, 1))
+            map_widget.set_enemies({"orc": (2, 2)})
+            map_widget.set_visible_tiles({(1, 1)})
+            call_later.assert_called_once_with(map_widget._flush_refresh)
+
+            map_widget._flush_refresh()
+            map_widget.set_items({"potion": (0, 0)})
+
+        map_widget.refresh_mock.assert_called_once()
+        assert call_later.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mounted_refresh_reuses_render(self):
+        """Test that refreshes of a mounted, unchanged map skip redrawing tiles."""
+        from textual.app import App
+
+        class MapApp(App):
+            def compose(self):
+                yield MapWidget(map_data=GameMap(width=5, height=4))
+
+        app = MapApp()
+        async with app.run_test() as pilot:
+            widget = app.query_one(MapWidget)
+            await pilot.pause()
+            with patch.object(
+                widget, "_render_tiles", wraps=widget._render_tiles
+            ) as render_tiles:
+                for _ in range(3):
+                    widget.refresh()
+                    await pilot.pause()
+                assert render_tiles.call_count == 0
+
+                widget.set_player((1, 1))
+                await pilot.pause()
+                assert render_tiles.call_count == 1
+
+
+class TestLogWidgets:
+    """Tests for the rolling combat and message logs."""
+
+    def test_combat_log_keeps_latest_entries(self):
+        """Test that the combat log drops the oldest entries past its cap."""
+        widget = CombatWidget()
+        with patch.object(widget, "refresh"):
+            for i in range(widget.max_lines + 3):
+                widget.add_entry(f"hit {i}")
+
+        assert len(widget.combat_log) == widget.max_lines
+        assert widget.render().splitlines()[0] == "hit 3"
+
+    def test_message_log_keeps_latest_messages(self):
+        """Test that the message log drops the oldest messages past its cap."""
+        widget = LogWidget(max_lines=2)
+        with patch.object(widget, "refresh"):
+            for text in ("one", "two", "three"):
+                widget.add_message(text)
+
+        lines = widget.render().splitlines()
+        assert len(lines) == 2
+        assert lines[0].endswith("I: two")
+
+    def test_timestamp_formatted_once_per_second(self):
+        """Test that messages within one second share a formatted timestamp."""
+        widget = LogWidget()
+        with patch("src.tui.widgets.time") as fake_time:
+            fake_time.time.side_effect = [100.1, 100.9, 101.2]
+            fake_time.strftime.side_effect = ["00:01:40", "00:01:41"]
+            stamps = [widget._timestamp() for _ in range(3)]
+
+        assert stamps == ["00:01:40", "00:01:40", "00:01:41"]
+        assert fake_time.strftime.call_count == 2
+
+    def test_messages_stored_with_level_marker(self):
+        """Test that messages are formatted with their level marker on insert."""
+        widget = LogWidget()
+        with patch.object(widget, "refresh"), patch.object(
+            widget, "_timestamp", return_value="12:00:00"
+        ):
+            widget.add_message("Door opens")
+            widget.add_message("Trap!", level="warning")
+            widget.add_message("???", level="verbose")
+
+        assert list(widget.messages) == [
+            "[12:00:00] I: Door opens",
+            "[12:00:00] !: Trap!",
+            "[12:00:00] ?: ???",
+        ]
@@ -0,0 +1,48 @@
+"""Tests for compression.py - save payload compression."""
+
+import zlib
+
+import pytest
+
+from src.utils import compression
+
+
+class TestCompression:
+    """Test suite for the compression helpers."""
+
+    def test_round_trip(self):
+        """Compressed data should decompress to the original bytes."""
+        data = b'{"header":{}}' * 100
+        assert compression.decompress(compression.compress(data)) == data
+
+    def test_reads_legacy_zlib(self):
+        """Existing zlib saves should still decompress."""
+        data = b"legacy save"
+        assert compression.decompress(zlib.compress(data, level=6)) == data
+
+    def test_zlib_fallback(self, monkeypatch):
+        """Without zstandard, data should be written as zlib."""
+        monkeypatch.setattr(compression, "zstandard", None)
+        data = b"payload" * 10
+        assert zlib.decompress(compression.compress(data)) == data
+
+    def test_zstd_without_package_raises(self, monkeypatch):
+        """zstd data should raise ValueError when zstandard is missing."""
+        monkeypatch.setattr(compression, "zstandard", None)
+        with pytest.raises(ValueError):
+            compression.decompress(compression.ZSTD_MAGIC + b"\x00\x00")
+
+    def test_streaming_round_trip(self):
+        """The streaming decompressor should match the compressor's format."""
+        data = b"x" * 50000
+        compressed = compression.compress(data)
+        decompressor = compression.decompressobj(compressed[:8])
+        assert decompressor.decompress(compressed) == data
+
+    def test_zstd_round_trip(self):
+        """zstd data should round trip when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        data = b"payload" * 100
+        compressed = compression.compress(data)
+        assert compressed.startswith(compression.ZSTD_MAGIC)
+        assert compression.decompress(compressed) == data
@@ -0,0 +1,33 @@
+"""Tests for fastjson.py - JSON encoding helpers."""
+
+from datetime import datetime
+
+from src.utils import fastjson
+
+
+class TestFastJson:
+    """Test suite for the fastjson helpers."""
+
+    def test_round_trip(self):
+        """Encoded data should decode back to the same value."""
+        data = {"name": "Hero", "hp": 12, "flags": ["a", "b"], "nested": {"x": 1.5}}
+        assert fastjson.loads(fastjson.dumps(data)) == data
+
+    def test_dumps_returns_bytes(self):
+        """dumps should return UTF-8 bytes ready for compression."""
+        assert isinstance(fastjson.dumps({"a": 1}), bytes)
+
+    def test_unknown_types_are_stringified(self):
+        """Values without a JSON form should be written as strings."""
+        when = datetime(2024, 1, 1)
+        assert fastjson.loads(fastjson.dumps({"when": when})) == {"when": str(when)}
+
+    def test_non_string_keys(self):
+        """Integer keys should be written as strings like the stdlib does."""
+        assert fastjson.loads(fastjson.dumps({1: "a"})) == {"1": "a"}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Helpers should work without orjson installed."""
+        monkeypatch.setattr(fastjson, "orjson", None)
+        data = {"name": "Hero", 2: [1, 2]}
+        assert fastjson.loads(fastjson.dumps(data)) == {"name": "Hero", "2": [1, 2]}
@@ -41,6 +41,16 @@ class TestGameLogger:
             logger = GameLogger("test_file", log_file=log_file)
             logger.info("test message")
             assert log_file.exists()
+            logger.close()
+
+    def test_file_records_written_by_close(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "queued.log"
+            logger = GameLogger("test_queued_file", log_file=log_file)
+            logger.info("queued message")
+            logger.close()
+            logger.close()
+            assert "test_queued_file: queued message" in log_file.read_text()
 
 
 class TestGetLogger:
@@ -52,3 +62,38 @@ class TestGetLogger:
         logger1 = get_logger("singleton_test2")
         logger2 = get_logger("singleton_test2")
         assert logger1 is logger2
+
+    def test_get_logger_honours_name(self):
+        logger1 = get_logger("named_test_a")
+        logger2 = get_logger("named_test_b")
+        assert logger1 is not logger2
+        assert logger2.logger.name == "named_test_b"
+
+    def test_loggers_share_formatters(self):
+        logger1 = GameLogger("formatter_test_a")
+        logger2 = GameLogger("formatter_test_b")
+        assert logger1.logger.handlers[0].formatter is logger2.logger.handlers[0].formatter
+
+    def test_get_logger_without_file_keeps_file_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "kept.log"
+            logger1 = get_logger("file_reuse_test", log_file)
+            logger2 = get_logger("file_reuse_test")
+            assert logger1 is logger2
+            logger1.info("still on disk")
+            logger1.close()
+            assert "still on disk" in log_file.read_text()
+
+    def test_get_logger_moves_to_new_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            old_file = Path(tmpdir) / "old.log"
+            new_file = Path(tmpdir) / "new.log"
+            logger = get_logger("file_move_test", old_file)
+            logger.info("first")
+            assert get_logger("file_move_test", new_file) is logger
+            logger.info("second")
+            logger.close()
+            assert "first" in old_file.read_text()
+            assert "second" not in old_file.read_text()
+            assert "second" in new_file.read_text()
+            assert len(logger.logger.handlers) == 1
@@ -21,6 +21,10 @@ class TestValidateCoordinate:
         assert validate_coordinate(101, 50, 100, 100) == (99, 50)
         assert validate_coordinate(50, 200, 100, 100) == (50, 99)
 
+    def test_empty_bounds_clamp_to_origin(self):
+        assert validate_coordinate(5, -3, 0, 0) == (0, 0)
+        assert validate_coordinate(-2, 7, 1, 1) == (0, 0)
+
 
 class TestValidateCharacterName:
     def test_valid_name_passes(self):
@@ -40,6 +44,13 @@ class TestValidateCharacterName:
         with pytest.raises(ValidationError, match="invalid"):
             validate_character_name("test@char")
 
+    def test_punctuation_only_and_non_ascii_names(self):
+        validate_character_name("Zoë O'Brien")
+        with pytest.raises(ValidationError, match="invalid"):
+            validate_character_name(" -' ")
+        with pytest.raises(ValidationError, match="invalid"):
+            validate_character_name("Hero\n")
+
 
 class TestValidateDirection:
     def test_valid_directions_normalized(self):
@@ -1,8 +1,12 @@
 # tests/unit/test_world/test_dungeon_generator.py
 """Tests for Dungeon Generator."""
 
+import random
+
 import pytest
 from src.world.dungeon_generator import DungeonGenerator, DungeonConfig, BSPNode
+from src.world.map import Room
+from src.world.tile_types import TileType
 
 
 class TestDungeonConfig:
@@ -154,7 +158,7 @@ class TestDungeonGenerator:
         for y in range(dungeon.height):
             for x in range(dungeon.width):
                 tile = dungeon.get_tile(x, y)
-                if tile.tile_type.name == "FLOOR":
+                if tile.tile_type is TileType.FLOOR:
                     floor_count += 1
 
         assert floor_count > 0
@@ -192,7 +196,7 @@ class TestDungeonGenerator:
             # Simple horizontal check
             for x in range(min(center_a[0], center_b[0]), max(center_a[0], center_b[0]) + 1):
                 tile = dungeon.get_tile(x, center_a[1])
-                if tile.tile_type.name == "FLOOR":
+                if tile.tile_type is TileType.FLOOR:
                     has_floor_path = True
                     break
 
@@ -200,12 +204,153 @@ class TestDungeonGenerator:
             if not has_floor_path:
                 for y in range(min(center_a[1], center_b[1]), max(center_a[1], center_b[1]) + 1):
                     tile = dungeon.get_tile(center_b[0], y)
-                    if tile.tile_type.name == "FLOOR":
+                    if tile.tile_type is TileType.FLOOR:
                         has_floor_path = True
                         break
 
             assert has_floor_path, f"No floor path between room {i} and {i+1}"
 
+    def test_carve_room_clipped_to_map(self):
+        """Test that a room hanging off the map only carves in-bounds tiles."""
+        gen = DungeonGenerator(DungeonConfig(width=6, height=4, seed=1))
+        gen._floor = [bytearray(6) for _ in range(4)]
+
+        gen._carve_room(Room(id="edge", x=4, y=2, width=5, height=5))
+
+        assert gen._floor == [
+            bytearray(b"\x00\x00\x00\x00\x00\x00"),
+            bytearray(b"\x00\x00\x00\x00\x00\x00"),
+            bytearray(b"\x00\x00\x00\x00\x01\x01"),
+            bytearray(b"\x00\x00\x00\x00\x01\x01"),
+        ]
+
+    def test_bsp_rooms_extracted_left_to_right(self):
+        """Test that leaf rooms are collected in depth-first, left-first order."""
+        gen = DungeonGenerator(DungeonConfig(min_room_size=2, max_room_size=2, seed=1))
+        left = BSPNode(0, 0, 4, 8, left=BSPNode(0, 0, 4, 4), right=BSPNode(0, 4, 4, 4))
+        root = BSPNode(0, 0, 8, 8, left=left, right=BSPNode(4, 0, 4, 8))
+
+        gen._extract_bsp_rooms(root)
+
+        assert [(room.id, room.x, room.y) for room in gen.rooms] == [
+            ("room_0", 1, 1),
+            ("room_1", 1, 5),
+            ("room_2", 5, 3),
+        ]
+
+    def test_carved_rooms_are_exactly_their_union(self):
+        """Test that carving adjacent rooms leaves every other cell as wall."""
+        gen = DungeonGenerator(DungeonConfig(width=10, height=6, seed=1))
+        gen._floor = [bytearray(10) for _ in range(6)]
+        rooms = [
+            Room(id="a", x=1, y=1, width=3, height=3),
+            Room(id="b", x=4, y=2, width=4, height=3),
+        ]
+
+        for room in rooms:
+            gen._carve_room(room)
+
+        assert [
+            (x, y) for y, row in enumerate(gen._floor) for x, cell in enumerate(row) if cell
+        ] == [(x, y) for y in range(6) for x in range(10) if any(r.contains(x, y) for r in rooms)]
+
+    def test_corridor_through_room_only_adds_floor(self):
+        """Test that corridors overwrite unconditionally without undoing floor."""
+        gen = DungeonGenerator(DungeonConfig(width=8, height=5, seed=1))
+        gen._floor = [bytearray(8) for _ in range(5)]
+        gen._carve_room(Room(id="r", x=2, y=1, width=3, height=3))
+        before = [bytearray(row) for row in gen._floor]
+
+        gen._carve_horizontal_corridor(0, 7, 2)
+        gen._carve_vertical_corridor(0, 4, 3)
+
+        for y in range(5):
+            for x in range(8):
+                expected = before[y][x] or y == 2 or x == 3
+                assert gen._floor[y][x] == int(expected)
+
+    def test_corridors_clipped_to_map(self):
+        """Test that corridors running off the map carve only in-bounds cells."""
+        gen = DungeonGenerator(DungeonConfig(width=4, height=3, seed=1))
+        gen._floor = [bytearray(4) for _ in range(3)]
+
+        gen._carve_horizontal_corridor(6, 2, 0)
+        gen._carve_vertical_corridor(-3, 1, 0)
+        gen._carve_vertical_corridor(0, 2, 9)
+
+        assert [list(row) for row in gen._floor] == [
+            [1, 0, 1, 1],
+            [1, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+
+    def test_cellular_automata_matches_neighbor_rule(self):
+        """Test one smoothing step against a direct count of floor neighbors."""
+        rng = random.Random(7)
+        floor = [[rng.randint(0, 1) for _ in range(9)] for _ in range(6)]
+
+        def neighbors(x, y):
+            return sum(
+                floor[ny][nx]
+                for ny in range(y - 1, y + 2)
+                for nx in range(x - 1, x + 2)
+                if (nx, ny) != (x, y) and 0 <= nx < 9 and 0 <= ny < 6
+            )
+
+        expected = [
+            [
+                1 if neighbors(x, y) > 4 else 0 if neighbors(x, y) < 4 else floor[y][x]
+                for x in range(9)
+            ]
+            for y in range(6)
+        ]
+        assert DungeonGenerator._apply_cellular_automata(floor) == expected
+
+    def test_connectivity_keeps_largest_region(self):
+        """Test that only the largest 4-connected floor region survives."""
+        floor = [
+            [1, 1, 0, 1],
+            [0, 1, 0, 1],
+            [1, 0, 0, 1],
+            [0, 0, 0, 1],
+        ]
+
+        assert DungeonGenerator._ensure_cave_connectivity(floor) == [
+            [0, 0, 0, 1],
+            [0, 0, 0, 1],
+            [0, 0, 0, 1],
+            [0, 0, 0, 1],
+        ]
+
+    def test_connectivity_tie_keeps_first_region(self):
+        """Test that equal-sized regions keep the first one found."""
+        floor = [[1, 0, 1]]
+
+        assert DungeonGenerator._ensure_cave_connectivity(floor) == [[1, 0, 0]]
+
+    def test_generation_leaves_global_random_alone(self):
+        """Test that generating does not reseed or consume the global RNG."""
+        random.seed(2024)
+        expected = random.random()
+
+        random.seed(2024)
+        DungeonGenerator(DungeonConfig(seed=5)).generate()
+        DungeonGenerator(DungeonConfig(seed=6, use_cave=True)).generate()
+
+        assert random.random() == expected
+
+    def test_interleaved_generators_keep_their_seeds(self):
+        """Test that creating a second generator does not disturb the first."""
+        first = DungeonGenerator(DungeonConfig(width=40, height=20, seed=11))
+        second = DungeonGenerator(DungeonConfig(width=40, height=20, seed=12))
+
+        first_map = first.generate()
+        second_map = second.generate()
+
+        assert first_map.tiles == DungeonGenerator.generate_dungeon(first.config).tiles
+        assert second_map.tiles == DungeonGenerator.generate_dungeon(second.config).tiles
+        assert first.rooms != second.rooms
+
 
 class TestGenerateDungeon:
     """Tests for generate_dungeon convenience function."""
@@ -224,3 +369,16 @@ class TestGenerateDungeon:
         assert dungeon.width == 50
         assert dungeon.height == 25
         assert dungeon.seed == 999
+
+    def test_generate_many_matches_sequential(self):
+        """Test that parallel generation gives the same maps as one by one."""
+        configs = [DungeonConfig(width=30, height=20, seed=seed) for seed in (3, 4, 5)]
+
+        maps = DungeonGenerator.generate_many(configs, max_workers=2)
+
+        assert len(maps) == 3
+        for config, dungeon in zip(configs, maps):
+            expected = DungeonGenerator.generate_dungeon(config)
+            assert dungeon.seed == config.seed
+            assert dungeon.tiles == expected.tiles
+            assert dungeon.rooms == expected.rooms
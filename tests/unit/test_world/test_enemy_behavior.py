@@ -2,12 +2,14 @@
 """Tests for enemy AI behaviors."""
 
 import pytest
+from unittest.mock import patch
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Set
 from enum import Enum, auto
 
 from src.world.enemy_behavior import EnemyAI, Action
 from src.entities.enemy import Enemy, AIType, EnemyType
+from src.world.pathfinding import chebyshev_distance
 
 
 class MockMap:
@@ -208,6 +210,24 @@ class TestEnemyAI:
         action1 = ai.decide_action(enemy, player, mock_map, fov)
         assert action1 == Action.MOVE
 
+    @pytest.mark.parametrize(
+        "ai_type", [AIType.PASSIVE, AIType.AGGRESSIVE, AIType.DEFENSIVE, AIType.PATROL]
+    )
+    def test_decide_action_measures_distance_once(self, ai_type):
+        """Test that each decision computes the player distance a single time."""
+        ai = EnemyAI(ai_type, patrol_route=[(2, 2)])
+        enemy = Enemy(id="e1", name="Goblin", position=(2, 2), ai_type=ai_type)
+        player = MockPlayer(position=(3, 2))
+        fov = {(3, 2), (2, 2)}
+
+        with patch(
+            "src.world.enemy_behavior.manhattan_distance",
+            wraps=lambda a, b: abs(a[0] - b[0]) + abs(a[1] - b[1]),
+        ) as distance:
+            ai.decide_action(enemy, player, MockMap(), fov)
+
+        assert distance.call_count == 1
+
     def test_get_path_to_player(self):
         """Test path to player calculation."""
         ai = EnemyAI(AIType.AGGRESSIVE)
@@ -224,6 +244,26 @@ class TestEnemyAI:
         assert len(path) > 0
         assert path[-1] == (5, 5)
 
+    def test_heuristic_cache_shared_across_enemies(self):
+        """Test that a second enemy's pathfind reuses cached heuristic values."""
+        player = MockPlayer(position=(5, 5))
+        mock_map = MockMap(width=10, height=10)
+        first = Enemy(id="e1", name="Goblin", position=(0, 0), ai_type=AIType.AGGRESSIVE)
+        second = Enemy(id="e2", name="Orc", position=(0, 1), ai_type=AIType.AGGRESSIVE)
+
+        EnemyAI.begin_turn(player.position)
+        EnemyAI(AIType.AGGRESSIVE).get_path_to_player(first, player, mock_map)
+        with patch(
+            "src.world.enemy_behavior.chebyshev_distance", wraps=chebyshev_distance
+        ) as heuristic:
+            path = EnemyAI(AIType.AGGRESSIVE).get_path_to_player(second, player, mock_map)
+
+        assert path[-1] == (5, 5)
+        assert heuristic.call_count < len(EnemyAI._h_cache)
+
+        EnemyAI.begin_turn((9, 9))
+        assert EnemyAI._h_cache == {}
+
     def test_get_path_blocked_by_wall(self):
         """Test path calculation with walls."""
         ai = EnemyAI(AIType.AGGRESSIVE)
@@ -301,3 +341,15 @@ class TestEnemyAI:
         next_pos = ai._get_flee_position(enemy, player, mock_map)
         # Should move away from player (left, up, down)
         assert next_pos[0] < enemy.position[0] or next_pos[1] != enemy.position[1]
+
+    def test_flee_prefers_first_direction_and_stays_when_boxed_in(self):
+        """Test flee tie-breaking order and the no-exit case."""
+        ai = EnemyAI(AIType.PASSIVE)
+        enemy = Enemy(id="e1", name="Rabbit", position=(5, 5), ai_type=AIType.PASSIVE)
+        player = MockPlayer(position=(6, 5))
+
+        # N, S and W all end two steps away; N is checked first
+        assert ai._get_flee_position(enemy, player, MockMap()) == (5, 4)
+
+        boxed_in = MockMap(walls=[(5, 4), (6, 5), (5, 6), (4, 5)])
+        assert ai._get_flee_position(enemy, player, boxed_in) == (5, 5)
@@ -99,3 +99,30 @@ class TestFieldOfView:
         assert (25, 25) in visible
         # Should cover some area
         assert len(visible) > 10
+
+    def test_fov_explored_matches_visible(self):
+        """Test that exactly the in-bounds visible tiles are marked explored."""
+        m = GameMap(width=10, height=10)
+        fov = FieldOfView(m)
+        visible = fov.compute(-1, 4, 4)
+
+        assert m.explored_tiles == {pos for pos in visible if pos != (-1, 4)}
+        assert (0, 4) in m.explored_tiles
+
+    @pytest.mark.parametrize(
+        "octant, expected",
+        [
+            (0, (12, 17)),  # N: (cx + dx, cy - dy)
+            (1, (13, 22)),  # E: (cx + dy, cy + dx)
+            (2, (8, 23)),  # S: (cx - dx, cy + dy)
+            (3, (7, 18)),  # W: (cx - dy, cy - dx)
+            (4, (8, 17)),  # NW: (cx - dx, cy - dy)
+            (5, (7, 22)),  # SW: (cx - dy, cy + dx)
+            (6, (12, 23)),  # SE: (cx + dx, cy + dy)
+            (7, (13, 18)),  # NE: (cx + dy, cy - dx)
+        ],
+    )
+    def test_fov_transform_octants(self, octant, expected):
+        """Test that each octant maps relative offsets like the original rotations."""
+        fov = FieldOfView(GameMap(width=5, height=5))
+        assert fov._transform(2, 3, octant, 10, 20) == expected
@@ -23,6 +23,12 @@ class TestRoom:
         room = Room("r1", x=10, y=10, width=8, height=6)
         assert room.center == (14, 13)
 
+    def test_room_center_not_part_of_equality(self):
+        """Test that the cached center does not change repr or equality."""
+        room = Room("r1", x=10, y=10, width=8, height=6)
+        assert "center" not in repr(room)
+        assert room == Room("r1", x=10, y=10, width=8, height=6)
+
     def test_room_bounds(self):
         """Test room bounds calculation."""
         room = Room("r1", x=10, y=10, width=5, height=5)
@@ -158,6 +164,31 @@ class TestGameMap:
         m.set_tile(3, 3, Tile.wall())
         assert m.is_opaque(3, 3) is True
 
+    def test_is_opaque_out_of_bounds(self):
+        """Test is_opaque returns True for out of bounds."""
+        m = GameMap(width=10, height=10)
+        assert m.is_opaque(-1, 0) is True
+        assert m.is_opaque(0, 10) is True
+
+    def test_set_tile_updates_masks(self):
+        """Test that set_tile keeps the walkable and opaque masks in step."""
+        m = GameMap(width=10, height=10)
+        m.set_tile(4, 6, Tile.wall())
+        assert m.walkable_mask[6][4] is False
+        assert m.opaque_mask[6][4] is True
+        assert m.is_walkable(4, 6) is False
+
+        m.set_tile(4, 6, Tile.door_open())
+        assert m.is_walkable(4, 6) is True
+        assert m.is_opaque(4, 6) is False
+
+    def test_masks_built_from_given_tiles(self):
+        """Test that masks mirror tiles passed in at construction."""
+        tiles = [[Tile.floor(), Tile.wall()], [Tile.water(), Tile.void()]]
+        m = GameMap(width=2, height=2, tiles=tiles)
+        assert m.walkable_mask == [[True, False], [False, False]]
+        assert m.opaque_mask == [[False, True], [False, True]]
+
     def test_mark_explored(self):
         """Test marking tile as explored."""
         m = GameMap(width=10, height=10)
@@ -162,3 +162,26 @@ class TestAStar:
             assert map_data[y][x] is True
         # Path should end at goal
         assert path[-1] == (6, 2)
+
+
+class TestAStarHeuristic:
+    """Tests for pluggable A* heuristics."""
+
+    def test_custom_heuristic_is_used(self):
+        """Test that a_star_path calls the supplied heuristic."""
+        calls = []
+
+        def heuristic(a, b):
+            calls.append((a, b))
+            return chebyshev_distance(a, b)
+
+        passable = lambda x, y: 0 <= x < 10 and 0 <= y < 10
+        path = a_star_path((0, 0), (4, 2), passable, heuristic=heuristic)
+        assert path[-1] == (4, 2)
+        assert calls and all(goal == (4, 2) for _, goal in calls)
+
+    def test_chebyshev_finds_diagonal_shortest_path(self):
+        """Test that the Chebyshev heuristic yields an all-diagonal route."""
+        passable = lambda x, y: 0 <= x < 10 and 0 <= y < 10
+        path = a_star_path((0, 0), (6, 6), passable, heuristic=chebyshev_distance)
+        assert path == [(i, i) for i in range(1, 7)]